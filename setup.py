@@ -71,6 +71,11 @@ setup(
     requires=requires,
     install_requires=requires,
     zip_safe=False,
+    entry_points={
+        'console_scripts': [
+            'towers=towers.cli:main',
+        ],
+    },
     keywords='towers',
     classifiers=[
         'Development Status :: 4 - Beta',
@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_batch
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from towers import InvalidMoves
+from towers.core.batch import moves_at, states_at
+from towers.core.solution import move_at, state_at
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class BatchTestCase(unittest.TestCase):
+    def test_moves_at(self, height=7):
+        indexes = numpy.arange(2 ** height - 1)[::-1]
+        disks, starts, ends = moves_at(height, indexes, chunk_size=10)
+        expected = [move_at(height, int(i)) for i in indexes]
+        self.assertEqual(list(disks), [i.disk for i in expected])
+        self.assertEqual(list(starts), [i.start for i in expected])
+        self.assertEqual(list(ends), [i.end for i in expected])
+
+    def test_states_at(self, height=6):
+        moves = numpy.arange(2 ** height)
+        rods = states_at(height, moves, chunk_size=20)
+        self.assertEqual(rods.shape, (len(moves), height))
+        for row, count in zip(rods, moves):
+            state = state_at(height, int(count))
+            self.assertEqual(list(row), [((state >> (2 * i)) & 3) - 1 for i in range(height)])
+
+    def test_huge(self, height=63):
+        total = 2 ** height - 1
+        indexes = numpy.array([0, total // 2, total - 1], dtype=numpy.uint64)
+        disks, starts, ends = moves_at(height, indexes)
+        self.assertEqual(list(disks), [1, height, 1])
+        self.assertEqual(list(states_at(height, [total])[0]), [1] * height)
+
+    def test_bounds(self, height=4):
+        self.assertRaises(InvalidMoves, moves_at, height, [15])
+        self.assertRaises(InvalidMoves, states_at, height, [16])
+        self.assertRaises(InvalidMoves, states_at, height, [-1])
+        self.assertEqual(moves_at(height, [])[0].shape, (0,))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_blocks
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import itertools
+import unittest
+
+from towers import Towers
+from towers.core import blocks
+from towers.core.blocks import iter_compact, iter_packed, packed_block
+from towers.core.moves import pack_moves
+from towers.core.solution import iter_solution
+
+
+class BlocksTestCase(unittest.TestCase):
+    def test_blocks(self, height=5):
+        for start, end, tmp in itertools.permutations(range(3)):
+            tower = Towers(height)
+            expected = pack_moves(tower.schedule(height, start, end, tmp))
+            self.assertEqual(packed_block(height, start, end, tmp), bytes(expected))
+
+    def test_splice(self, height=5):
+        block_height = blocks.BLOCK_HEIGHT
+        blocks.BLOCK_HEIGHT = 2
+        try:
+            for i in range(1, height + 1):
+                expected = list(iter_solution(i))
+                self.assertEqual(list(iter_compact(i)), expected)
+                self.assertEqual(b''.join(iter_packed(i)),
+                                 bytes(pack_moves((m.start, m.end) for m in expected)))
+        finally:
+            blocks.BLOCK_HEIGHT = block_height
+
+    def test_lru(self):
+        cache_size = blocks.CACHE_SIZE
+        blocks.CACHE_SIZE = 4
+        try:
+            for start, end, tmp in itertools.permutations(range(3)):
+                packed_block(6, start, end, tmp)
+            self.assertEqual(len(blocks._BLOCKS), 4)
+            self.assertEqual(list(blocks._BLOCKS)[-1], (6, 2, 1, 0))
+        finally:
+            blocks.CACHE_SIZE = cache_size
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_capacity
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import itertools
+import unittest
+from collections import deque
+
+from towers import CapacityTowers, Towers, Unsolvable
+from towers.core.capacity import _successors, lower_bound, solve_capacities
+from towers.core.solution import state_at
+from towers.core.state import apply, decode, end_state, tops, unrank
+
+
+def shortest(height, capacities, state):
+    """
+    The length of a shortest solution within the capacities, by breadth first search.
+    """
+    distances = {state: 0}
+    queue = deque([state])
+    while queue:
+        state = queue.popleft()
+        if state == end_state(height):
+            return distances[state]
+        for _, _, _, after in _successors(state, height, capacities):
+            if after not in distances:
+                distances[after] = distances[state] + 1
+                queue.append(after)
+
+
+class CapacityTestCase(unittest.TestCase):
+    def assertSolution(self, height, capacities, state):
+        result = solve_capacities(height, capacities, state)
+        for move in result.path:
+            self.assertEqual(tops(state)[move.start], move.disk)
+            state = apply(state, (move.start, move.end))
+            counts = [len(rod.disks) for rod in decode(state)]
+            self.assertTrue(all(c <= limit for c, limit in zip(counts, capacities)))
+        self.assertEqual(state, end_state(height))
+        return result.distance
+
+    def test_shortest(self):
+        for height in [1, 2, 3]:
+            for capacities in itertools.product(range(height + 1), repeat=3):
+                for index in range(3 ** height):
+                    state = unrank(index, height)
+                    counts = [len(rod.disks) for rod in decode(state)]
+                    expected = None
+                    if all(c <= limit for c, limit in zip(counts, capacities)):
+                        expected = shortest(height, capacities, state)
+                    try:
+                        distance = self.assertSolution(height, capacities, state)
+                    except Unsolvable:
+                        distance = None
+                    self.assertEqual(distance, expected)
+                    if distance is not None:
+                        self.assertLessEqual(lower_bound(state, height), distance)
+
+    def test_start(self, height=20):
+        # Answered without searching, however tall the tower.
+        result = solve_capacities(height, (None, None, height - 1), path=False)
+        self.assertEqual((result.distance, result.explored), (2 ** height - 1, 0))
+        self.assertRaises(Unsolvable, solve_capacities, height, (None, None, height - 2))
+        self.assertRaises(Unsolvable, solve_capacities, height, (None, height - 1, None))
+        self.assertRaises(ValueError, solve_capacities, height, (None, -1, None))
+
+    def test_capacity_towers(self, height=4):
+        tower = CapacityTowers(height, capacities=(None, None, height - 1))
+        self.assertEqual(tower.total_moves, 2 ** height - 1)
+        clone = copy.deepcopy(tower)
+        self.assertEqual(clone.capacities, (None, None, height - 1))
+        with tower:
+            self.assertEqual(len(list(tower)), 2 ** height - 1)
+
+        tower = CapacityTowers(height, capacities=(None, None, 1))
+        self.assertRaises(Unsolvable, lambda: tower.total_moves)
+        self.assertRaises(Unsolvable, CapacityTowers.moves_for_height, height, (None, None, 1))
+        self.assertEqual(CapacityTowers.moves_for_height(height, (None, None, height - 1)),
+                         2 ** height - 1)
+        self.assertRaises(Unsolvable, list, tower.iter_compact())
+
+        # Half way through the classic solution, the tmp rod is full.
+        state = state_at(height, 2 ** (height - 1))
+        tower = CapacityTowers(height, rods=decode(state), capacities=(None, None, height - 1))
+        self.assertEqual(len(list(tower.iter_compact())), 2 ** (height - 1) - 1)
+        self.assertTrue(tower.is_solved())
+        self.assertEqual(Towers(height).total_moves, 2 ** height - 1)
+
+    def test_iter_moves_midway(self, height=3):
+        tower = CapacityTowers(height, capacities=(None, None, 2))
+        list(itertools.islice(tower.iter_compact(), 3))
+        moves = list(tower.iter_moves())
+        self.assertEqual([i.moves for i in moves], list(range(3, 2 ** height - 1)))
+        self.assertEqual(list(tower.iter_moves(disks=[height])), [moves[0]])
+        self.assertEqual(list(tower.iter_compact()), moves)
+        self.assertTrue(tower.is_solved())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_cli
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import six
+
+from towers.cli import main
+from towers.core.moves import pack_moves
+from towers.core.solution import iter_solution
+
+
+class CliTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.stdout = sys.stdout
+        sys.stdout = six.StringIO()
+
+    def tearDown(self):
+        sys.stdout = self.stdout
+        shutil.rmtree(self.dir)
+
+    def output(self):
+        return sys.stdout.getvalue().splitlines()
+
+    def test_solve_packed(self, height=6):
+        path = os.path.join(self.dir, 'moves')
+        self.assertEqual(main(['solve', '--height', str(height), '--format', 'packed',
+                               '--out', path]), 0)
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.assertEqual(data, bytes(pack_moves((i.start, i.end) for i in iter_solution(height))))
+
+        self.assertEqual(main(['verify', path, '--height', str(height), '--workers', '1']), 0)
+        self.assertEqual(self.output(), ['valid moves=63 solved=True optimal=True'])
+
+    def test_solve_lines(self, height=3):
+        path = os.path.join(self.dir, 'moves')
+        main(['solve', '--height', str(height), '--format', 'jsonl', '--out', path])
+        with open(path) as f:
+            moves = [json.loads(line) for line in f]
+        self.assertEqual(len(moves), 7)
+        self.assertEqual(moves[0], {'moves': 0, 'disk': 1, 'start': 'start', 'end': 'end'})
+
+        self.assertEqual(main(['verify', path, '--height', str(height)]), 0)
+        main(['solve', '--height', str(height), '--out', path])
+        self.assertEqual(main(['verify', path, '--height', str(height)]), 0)
+        with open(path, 'ab') as f:
+            f.write(b'start end\n')
+        self.assertEqual(main(['verify', path, '--height', '3', '--format', 'text']), 1)
+        self.assertEqual(self.output()[-1], 'illegal move at 7: start rod is empty')
+
+    def test_queries(self):
+        self.assertEqual(main(['count', '--height', '10']), 0)
+        self.assertEqual(main(['count', '--height', '3', '--variant', 'linear']), 0)
+        self.assertEqual(main(['state-at', '3', '--height', '3']), 0)
+        self.assertEqual(self.output(), [
+            '1023', '26', '31', 'Rods(3 - start([***]), end([]), tmp([**, *]))',
+        ])
+
+    def test_invalid_height(self):
+        stderr = sys.stderr
+        sys.stderr = six.StringIO()
+        try:
+            self.assertEqual(main(['count', '--height', '-1']), 2)
+        finally:
+            sys.stderr = stderr
+
+    def test_bench_and_profile(self):
+        self.assertEqual(main(['bench', '--height', '4', '--repeat', '1']), 0)
+        self.assertEqual(main(['profile', '--height', '4', '--limit', '3']), 0)
+        self.assertIn('move_disk', sys.stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
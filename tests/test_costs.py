@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_costs
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import heapq
+import random
+import unittest
+
+from towers import Towers, Unsolvable, WeightedTowers
+from towers.core.costs import CostTable
+from towers.core.state import apply, end_state, legal_moves, start_state, tops
+
+
+def cheapest(height, table):
+    """
+    The minimum cost of solving a tower by Dijkstra's algorithm over every state.
+    """
+    best = {start_state(height): 0}
+    queue = [(0, start_state(height))]
+    while queue:
+        cost, state = heapq.heappop(queue)
+        if state == end_state(height):
+            return cost
+        if cost > best[state]:
+            continue
+        for start, end in legal_moves(state):
+            step = table.move_cost(tops(state)[start], start, end)
+            if step is None:
+                continue
+            step += cost
+            after = apply(state, (start, end))
+            if step < best.get(after, step + 1):
+                best[after] = step
+                heapq.heappush(queue, (step, after))
+
+
+class CostsTestCase(unittest.TestCase):
+    def assertOptimal(self, height, table):
+        state = start_state(height)
+        cost = 0
+        moves = list(table.iter_moves(height))
+        for move in moves:
+            self.assertEqual(tops(state)[move.start], move.disk)
+            cost += table.move_cost(move.disk, move.start, move.end)
+            state = apply(state, (move.start, move.end))
+        self.assertEqual(state, end_state(height))
+        self.assertEqual(cost, table.cost(height))
+        self.assertEqual(len(moves), table.moves(height))
+        self.assertEqual(cost, cheapest(height, table))
+
+    def test_random_costs(self):
+        rng = random.Random(11)
+        for _ in range(20):
+            costs = [[rng.randint(0, 20) for _ in range(3)] for _ in range(3)]
+            by_width = rng.random() < 0.5
+            for height in [1, 2, 4]:
+                self.assertOptimal(height, CostTable(costs, by_width=by_width))
+
+    def test_uniform(self, height=6):
+        table = CostTable([[1] * 3] * 3)
+        self.assertEqual(table.cost(height), 2 ** height - 1)
+        self.assertEqual(list(table.schedule(height)),
+                         list(Towers(height).schedule(height, 0, 1, 2)))
+
+    def test_via(self):
+        # Small towers avoid the expensive moves between the start and end rods (the linear
+        # variant), large towers pay for them rather than take 3 ** n moves.
+        table = CostTable([[0, 100, 1], [100, 0, 1], [1, 1, 0]])
+        self.assertEqual(table.moves(3), 3 ** 3 - 1)
+        self.assertEqual(table.cost(3), 3 ** 3 - 1)
+        self.assertLess(table.cost(100), 3 ** 100 - 1)
+        self.assertLess(table.moves(100), 3 ** 100 - 1)
+        tower = WeightedTowers(3, costs=table.costs)
+        self.assertEqual(tower.total_moves, 26)
+        self.assertEqual(WeightedTowers.moves_for_height(3, table.costs), tower.total_moves)
+        self.assertEqual(WeightedTowers.moves_for_height(3), 7)
+        self.assertRaises(ValueError, CostTable, [[0, -1, 1], [1, 0, 1], [1, 1, 0]])
+        self.assertRaises(ValueError, CostTable, [[1, 1], [1, 1]])
+
+    def test_forbidden(self, height=5):
+        # Without the direct moves between the start and end rods: the linear variant.
+        table = CostTable([[0, None, 1], [None, 0, 1], [1, 1, 0]])
+        self.assertEqual(table.moves(height), 3 ** height - 1)
+        self.assertOptimal(height, table)
+        self.assertIsNone(table.move_cost(1, 0, 1))
+
+        table = CostTable([[0, 1, None], [None, 0, None], [None, None, 0]])
+        self.assertEqual(table.moves(1), 1)
+        self.assertRaises(Unsolvable, table.cost, 2)
+        self.assertRaises(Unsolvable, list, table.schedule(2))
+
+    def test_weighted_towers(self, height=4):
+        costs = [[0, 5, 1], [1, 0, 1], [2, 1, 0]]
+        tower = WeightedTowers(height, costs=costs, by_width=True)
+        table = CostTable(costs, by_width=True)
+        self.assertEqual(tower.total_cost, table.cost(height))
+        self.assertEqual(tower.total_moves, table.moves(height))
+
+        clone = copy.deepcopy(tower)
+        self.assertEqual((clone.costs, clone.by_width), (tower.costs, True))
+        with tower:
+            moves = list(tower)
+        self.assertEqual(sum(table.move_cost(i.disk.width, ['start', 'end', 'tmp'].index(
+            i.start.name), ['start', 'end', 'tmp'].index(i.end.name)) for i in moves),
+            tower.total_cost)
+        self.assertEqual(list(clone.iter_compact()), list(table.iter_moves(height)))
+        self.assertTrue(clone.is_solved())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_graph
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import shutil
+import tempfile
+import unittest
+
+from towers import InvalidTowerHeight
+from towers.core.graph import count_edges, export_graph, state_graph
+from towers.core.state import apply, legal_moves, rank, unrank
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class GraphTestCase(unittest.TestCase):
+    def _check(self, height, indptr, indices):
+        self.assertEqual(len(indptr), 3 ** height + 1)
+        self.assertEqual(indptr[-1], count_edges(height))
+        for index in range(3 ** height):
+            state = unrank(index, height)
+            expected = sorted(rank(apply(state, move)) for move in legal_moves(state))
+            self.assertEqual(list(indices[indptr[index]:indptr[index + 1]]), expected)
+
+    def test_state_graph(self):
+        for height in [1, 2, 5]:
+            indptr, indices = state_graph(height, chunk_size=7)
+            self.assertEqual(indices.dtype, numpy.int32)
+            self._check(height, indptr, indices)
+        indptr, indices = state_graph(3, dtype=numpy.int64)
+        self.assertEqual(indptr.dtype, numpy.int64)
+        self.assertRaises(InvalidTowerHeight, state_graph, 39)
+
+    def test_export_graph(self, height=6):
+        directory = tempfile.mkdtemp()
+        try:
+            paths = export_graph(height, directory, chunk_size=100)
+            indptr, indices = [numpy.load(path, mmap_mode='r') for path in paths]
+            self._check(height, indptr, indices)
+            self.assertTrue(numpy.array_equal(indices, state_graph(height)[1]))
+            del indptr, indices
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    unittest.main()
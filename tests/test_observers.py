@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_observers
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import itertools
+import unittest
+
+from towers import CorruptRod, Disk, Rod, Rods, Towers
+from towers.core.moves import pack_moves
+
+
+class ObserversTestCase(unittest.TestCase):
+    def test_batches(self, height=5):
+        small = []
+        large = []
+        tower = Towers(height)
+        tower.subscribe(small.append, batch_size=3)
+        tower.subscribe(large.append, batch_size=7)
+        moves = list(tower)
+
+        self.assertEqual([len(i) for i in small], [3] * 10 + [1])
+        self.assertEqual([len(i) for i in large], [7] * 4 + [3])
+        self.assertEqual(sum(small, []), moves)
+        self.assertEqual(sum(large, []), moves)
+
+        tower = Towers(height)
+        tower.unsubscribe(tower.subscribe(small.append))
+        tower()
+        self.assertEqual(len(small), 11)
+
+    def test_packed(self, height=4):
+        batches = []
+        tower = Towers(height)
+        tower.subscribe(batches.append, batch_size=4, packed=True)
+        moves = list(tower.iter_compact())
+        self.assertEqual(b''.join(bytes(i) for i in batches),
+                         bytes(pack_moves((i.start, i.end) for i in moves)))
+
+        batches = []
+        tower = Towers(height)
+        tower.subscribe(batches.append, batch_size=100, packed=True)
+        tower()
+        self.assertEqual(bytes(batches[0]), bytes(pack_moves((i.start, i.end) for i in moves)))
+
+    def test_flush_on_error(self, height=4):
+        batches = []
+        tower = Towers(height)
+        tower.subscribe(batches.append, batch_size=100)
+        list(itertools.islice(tower.iter_compact(), 5))
+        self.assertEqual([len(i) for i in batches], [5])
+
+        # The schedule places the largest disk on the middle one on the second move.
+        start = Rod('start', [Disk(0, 3), Disk(2, 3)], 3)
+        tmp = Rod('tmp', [Disk(1, 3)], 3)
+        tower = Towers(3, rods=Rods(3, start, Rod('end', height=3), tmp))
+        batches = []
+        tower.subscribe(batches.append, batch_size=2)
+        self.assertRaises(CorruptRod, list, tower.iter_compact())
+        self.assertEqual([len(i) for i in batches], [1])
+        self.assertRaises(ValueError, tower.subscribe, batches.append, batch_size=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
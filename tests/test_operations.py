@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_operations
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import json
+import unittest
+
+from towers import Rod, Towers
+from towers.core.operations import count_operations
+
+
+class OperationsTestCase(unittest.TestCase):
+    """
+    Budgets on the work done per move, checked at two heights so that any per-move cost which
+    grows with the height fails.
+    """
+
+    def _iterate(self, height, compact):
+        tower = Towers(height)
+        with count_operations() as counts:
+            for _ in (tower.iter_compact() if compact else tower):
+                pass
+        return counts, tower.moves
+
+    def test_compact(self):
+        for height in [6, 12]:
+            counts, moves = self._iterate(height, compact=True)
+            self.assertEqual(counts['CompactMove.__new__'], moves)
+            for key in ['Rod.__deepcopy__', 'Rod.__copy__', 'Rods.__deepcopy__', 'Move.__new__',
+                        'Disk.__new__', 'Rod.__new__']:
+                self.assertEqual(counts[key], 0, key)
+            # The rods are validated once, before the first move.
+            self.assertEqual(counts['Rod.validate'], 3)
+            self.assertEqual(counts['Disk.validate'], height)
+
+    def test_moves(self):
+        for height in [6, 12]:
+            counts, moves = self._iterate(height, compact=False)
+            self.assertEqual(counts['Move.__new__'], moves)
+            self.assertEqual(counts['Rod.__deepcopy__'], 2 * moves)
+            self.assertEqual(counts['Rod.validate'], 3 * moves)
+            self.assertEqual(counts['Disk.__new__'], 0)
+            self.assertEqual(counts['Rods.__deepcopy__'], 0)
+            # Every copied rod is validated, so the validations of the disks are O(height) per move.
+            self.assertLessEqual(counts['Disk.validate'], 2 * height * moves)
+
+    def test_context(self):
+        for height in [6, 12]:
+            tower = Towers(height)
+            with count_operations() as counts:
+                with tower.context():
+                    for _ in tower.iter_compact():
+                        pass
+            # Only the rods saved on entry are rebuilt on exit, never per move.
+            self.assertEqual(counts['Disk.__new__'], height)
+            self.assertEqual(counts['Rods.__new__'], 1)
+            self.assertEqual(counts['Rod.validate'], 12)
+            self.assertLessEqual(counts['Disk.validate'], 5 * height)
+
+    def test_serialization(self, height=10):
+        tower = Towers(height)
+        with count_operations() as counts:
+            data = json.dumps(tower.to_json())
+            self.assertEqual(Towers.from_json(json.loads(data)), tower)
+        self.assertEqual(counts['Disk.__new__'], height)
+        self.assertEqual(counts['Rods.__new__'], 1)
+        self.assertEqual(counts['Rod.__new__'], 3)
+
+        with count_operations() as counts:
+            copy.deepcopy(tower._rods)
+        self.assertEqual(counts['Rod.__deepcopy__'], 3)
+        self.assertEqual(counts['Disk.__new__'], 0)
+
+    def test_restored(self):
+        new = Rod.__dict__['__new__']
+        with count_operations() as counts:
+            Rod('start', height=3)
+        self.assertEqual(counts['Rod.__new__'], 1)
+        self.assertIs(Rod.__dict__['__new__'], new)
+        Rod('start', height=3)
+        self.assertEqual(counts['Rod.__new__'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_parallel
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from towers import verify
+from towers.core.moves import ROD_NAMES, pack_moves
+from towers.core.parallel import detect_format, parse_jsonl, verify_file
+from towers.core.solution import iter_solution
+from towers.core.verify import LARGER_DISK
+
+
+class ParallelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.path = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def write(self, name, moves, fmt):
+        path = os.path.join(self.path, name)
+        with open(path, 'wb') as f:
+            if fmt == 'packed':
+                f.write(pack_moves(moves))
+            elif fmt == 'jsonl':
+                for start, end in moves:
+                    f.write(json.dumps({'start': ROD_NAMES[start], 'end': end}).encode() + b'\n')
+            else:
+                for start, end in moves:
+                    f.write('{start} {end}\n'.format(start=ROD_NAMES[start], end=end).encode())
+        return path
+
+    def test_optimal(self, height=10):
+        moves = [(i.start, i.end) for i in iter_solution(height)]
+        for fmt in ['packed', 'text', 'jsonl']:
+            path = self.write(fmt, moves, fmt)
+            self.assertEqual(detect_format(path), fmt)
+            for workers in [1, 3]:
+                result = verify_file(path, height, None, workers=workers, chunk_size=100)
+                self.assertTrue(result.optimal)
+
+    def test_deviation(self, height=9):
+        moves = [(i.start, i.end) for i in iter_solution(height)]
+        # A legal detour which puts every later chunk out of step with the optimal solution.
+        moves[50:50] = [moves[49][::-1], moves[49]]
+        for fmt in ['packed', 'text']:
+            path = self.write(fmt, moves, fmt)
+            result = verify_file(path, height, fmt, workers=2, chunk_size=64)
+            self.assertEqual(result, verify(height, moves))
+            self.assertTrue(result.solved)
+            self.assertFalse(result.optimal)
+
+        moves[300] = moves[300][::-1]
+        for fmt in ['packed', 'text', 'jsonl']:
+            path = self.write(fmt, moves, fmt)
+            result = verify_file(path, height, fmt, workers=2, chunk_size=64)
+            self.assertEqual(result, verify(height, moves))
+            self.assertEqual(result.index, 300)
+            self.assertEqual(result.reason, LARGER_DISK)
+
+    def test_jsonl(self):
+        data = b'{"start": "start", "end": 2}\n\nnot json\n{"start": 0}\n'
+        self.assertEqual(list(parse_jsonl(data)), [('start', 2), (None, None), (None, None)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_persistent
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import unittest
+
+from towers import CorruptRod, Disk, PersistentRod, Rod, Rods, Towers
+from towers.core.stack import DiskStack
+
+
+class DiskStackTestCase(unittest.TestCase):
+    def test_list_like(self, height=3):
+        disks = [Disk(i, height) for i in range(height)]
+        stack = DiskStack(disks)
+        self.assertEqual(len(stack), height)
+        self.assertEqual(list(stack), disks)
+        self.assertEqual(list(reversed(stack)), disks[::-1])
+        self.assertEqual(stack, disks)
+        self.assertEqual(stack[-1], disks[-1])
+        self.assertEqual(stack.top, disks[-1])
+
+        other = stack[:]
+        self.assertEqual(other.pop(), disks[-1])
+        self.assertEqual(list(stack), disks)
+        self.assertNotEqual(other, stack)
+        other.append(disks[-1])
+        self.assertEqual(other, stack)
+
+        self.assertRaises(IndexError, DiskStack().pop)
+        self.assertFalse(DiskStack())
+
+
+class PersistentRodTestCase(unittest.TestCase):
+    def test_solve(self, height=5):
+        tower = Towers(height, rods=Rods(height, persistent=True))
+        expected = Towers(height)
+        for move, other in zip(tower, expected):
+            self.assertEqual(move, other)
+            self.assertIsInstance(move.start, PersistentRod)
+        self.assertEqual(tower, expected)
+        tower.validate_end()
+
+    def test_history_is_persistent(self, height=4):
+        tower = Towers(height, rods=Rods(height, persistent=True))
+        history = list(tower)
+        replay = list(Towers(height))
+        self.assertEqual(history, replay)
+
+        # The snapshots of the first move share the start rod's disks.
+        first = history[0].start
+        self.assertIs(first.disks._head.below, history[1].start.disks._head)
+
+    def test_deepcopy_shares(self, height=3):
+        rod = Rods(height, persistent=True).start
+        other = copy.deepcopy(rod)
+        self.assertIs(other.disks._head, rod.disks._head)
+        self.assertEqual(other.zobrist, rod.zobrist)
+        rod.pop()
+        self.assertEqual(len(other.disks), height)
+        self.assertNotEqual(other, rod)
+
+    def test_append_validates(self, height=3):
+        rod = PersistentRod('end', height=height)
+        rod.append(Disk(1, height))
+        self.assertRaises(CorruptRod, rod.append, Disk(0, height))
+        self.assertEqual(len(rod.disks), 1)
+
+    def test_json(self, height=3):
+        rods = Rods(height, persistent=True)
+        self.assertIsInstance(Rods.from_json(rods.to_json()).start, PersistentRod)
+        self.assertEqual(Rods.from_json(rods.to_json()), rods)
+        self.assertNotIsInstance(Rods.from_json(Rods(height).to_json()).start, PersistentRod)
+        self.assertEqual(Rod.from_json(rods.start.to_json()), rods.start)
+
+
+if __name__ == '__main__':
+    unittest.main()
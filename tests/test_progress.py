@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_progress
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import itertools
+import unittest
+
+from towers import CyclicTowers, Towers
+
+
+class ProgressTestCase(unittest.TestCase):
+    def test_every(self, height=6):
+        reports = []
+        tower = Towers(height)
+        tower.on_progress(reports.append, every=10)
+        moves = list(tower)
+        self.assertEqual(moves, list(Towers(height)))
+        self.assertEqual([i.moves for i in reports], [10, 20, 30, 40, 50, 60, 63])
+        self.assertEqual(set(i.total for i in reports), set([63]))
+        self.assertEqual(reports[-1].eta, 0)
+
+    def test_interval(self, height=10):
+        ticks = itertools.count()
+        reports = []
+        tower = CyclicTowers(height)
+        tower.on_progress(reports.append, interval=3, clock=lambda: next(ticks))
+        moves = list(tower.iter_compact())
+        self.assertEqual(len(moves), tower.total_moves)
+        self.assertEqual(reports[-1].moves, tower.total_moves)
+        self.assertGreater(len(reports), 2)
+        for report in reports[:-1]:
+            self.assertGreater(report.rate, 0)
+            self.assertAlmostEqual(report.eta, (report.total - report.moves) / report.rate)
+
+    def test_disable(self, height=4):
+        reports = []
+        tower = Towers(height)
+        tower.on_progress(reports.append, every=1)
+        tower.on_progress(None)
+        tower()
+        self.assertEqual(reports, [])
+        self.assertRaises(ValueError, tower.on_progress, reports.append)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_render
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import io
+import unittest
+
+from towers import CompactMove, Renderer, Towers
+from towers.core.moves import ROD_NAMES
+from towers.core.render import disk_glyphs, format_move
+
+
+class RenderTestCase(unittest.TestCase):
+    def test_compact_run(self, height=3):
+        stream = io.StringIO()
+        tower = Towers(height, verbose=True)
+
+        with tower:
+            tower(Renderer(stream=stream))
+
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), tower.moves_for_height(height))
+        self.assertEqual(lines[0], '0 *   start->end')
+        self.assertEqual(lines[3], '3 *** start->end')
+
+    def test_iter_compact_matches_moves(self, height=4):
+        expected = [
+            CompactMove(
+                i.disk.width, ROD_NAMES.index(i.start.name), ROD_NAMES.index(i.end.name), i.moves)
+            for i in Towers(height)
+        ]
+        self.assertEqual(list(Towers(height).iter_compact()), expected)
+
+    def test_sampling_and_rate(self):
+        stream = io.StringIO()
+        ticks = iter(range(100))
+        renderer = Renderer(stream=stream, every=2, rate=0.5, clock=lambda: next(ticks))
+
+        Towers(4, verbose=True)(renderer)
+
+        self.assertEqual(renderer.rendered + renderer.dropped, 15)
+        self.assertEqual(renderer.rendered, 4)
+        self.assertEqual(len(stream.getvalue().splitlines()), 4)
+
+    def test_glyph_cache(self):
+        self.assertIs(disk_glyphs(5), disk_glyphs(5))
+        self.assertEqual(disk_glyphs(3, pad=True)[1], '*  ')
+        self.assertEqual(repr(Towers(3).start_rod.disks), '[***, **, *]')
+
+    def test_full(self, height=3):
+        move = next(Towers(height).iter_compact())
+        self.assertEqual(format_move(move, height, 'full'), str(move))
+        move = next(iter(Towers(height)))
+        self.assertIn("name='start'", format_move(move, height, 'full'))
+
+
+if __name__ == '__main__':
+    unittest.main()
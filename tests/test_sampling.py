@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_sampling
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import random
+import unittest
+from collections import Counter
+
+from towers import InvalidTowerHeight
+from towers.core.sampling import count_states, iter_states, random_state, random_states
+from towers.core.state import decode, encode, height_of, rank, unrank
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+class SamplingTestCase(unittest.TestCase):
+    def test_iter_states(self):
+        for height in [1, 2, 5, 9]:
+            states = list(iter_states(height))
+            self.assertEqual(states, [unrank(i, height) for i in range(count_states(height))])
+        self.assertEqual(list(iter_states(9, 6000, 7000)),
+                         [unrank(i, 9) for i in range(6000, 7000)])
+        self.assertEqual(list(iter_states(3, 20, 100)), [unrank(i, 3) for i in range(20, 27)])
+        self.assertRaises(InvalidTowerHeight, count_states, 0)
+
+    def test_random_state(self, height=40):
+        first = [random_state(height, random.Random(3)) for _ in range(5)]
+        second = [random_state(height, random.Random(3)) for _ in range(5)]
+        self.assertEqual(first, second)
+        for state in first:
+            self.assertEqual(height_of(state), height)
+            self.assertEqual(encode(decode(state)), state)
+
+    def test_uniform(self, height=2, samples=9000):
+        rng = random.Random(7)
+        counts = Counter(rank(random_state(height, rng)) for _ in range(samples))
+        self.assertEqual(sorted(counts), list(range(9)))
+        for count in counts.values():
+            self.assertTrue(800 < count < 1200, count)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_random_states(self, height=32):
+        states = random_states(height, 1000, seed=5, chunk_size=300)
+        self.assertEqual(states.dtype, numpy.uint64)
+        self.assertEqual(list(states), list(random_states(height, 1000, seed=5)))
+        for state in states[:20]:
+            self.assertEqual(encode(decode(int(state))), int(state))
+        self.assertRaises(InvalidTowerHeight, random_states, 33, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_search
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import shutil
+import tempfile
+import unittest
+
+from towers import Towers
+from towers.core.search import StateGraph, layers, search
+
+
+class SearchTestCase(unittest.TestCase):
+    def assertPath(self, result, graph, start, end):
+        index = graph.index(start)
+        for move in result.path:
+            successors = dict(((i[:3]), i[3]) for i in graph.successors(index))
+            index = successors[(move.disk, move.start, move.end)]
+        self.assertEqual(index, graph.index(end))
+        self.assertEqual(len(result.path), result.distance)
+
+    def test_classic(self, height=6):
+        result = search(height)
+        self.assertEqual(result.distance, Towers.moves_for_height(height))
+        self.assertPath(result, StateGraph(height), [0] * height, [1] * height)
+
+        unidirectional = search(height, canonical=False, bidirectional=False)
+        self.assertEqual(unidirectional.distance, result.distance)
+        self.assertLess(result.explored, unidirectional.explored)
+
+    def test_frame_stewart(self):
+        # Frame-Stewart numbers for four rods.
+        for height, expected in enumerate([1, 3, 5, 9, 13, 17], 1):
+            result = search(height, rods=4)
+            self.assertEqual(result.distance, expected)
+            self.assertPath(result, StateGraph(height, 4), [0] * height, [1] * height)
+
+    def test_rules(self, height=4):
+        def clockwise(disk, start, end):
+            return end == (start + 1) % 3
+
+        result = search(height, rule=clockwise)
+        self.assertEqual(result.distance, 43)
+        self.assertPath(result, StateGraph(height, rule=clockwise), [0] * height, [1] * height)
+
+        def adjacent(disk, start, end):
+            return 2 in (start, end)
+
+        self.assertEqual(search(height, rule=adjacent, directed=False).distance, 3 ** height - 1)
+        self.assertEqual(search(height, rule=lambda *a: False).distance, None)
+
+    def test_spill(self, height=6):
+        spill_dir = tempfile.mkdtemp()
+        try:
+            result = search(height, rods=4, spill_dir=spill_dir, frontier_limit=8)
+            self.assertEqual(result.distance, 17)
+            counts = layers(height, spill_dir=spill_dir, frontier_limit=8)
+            self.assertEqual(sum(counts), 3 ** height)
+        finally:
+            shutil.rmtree(spill_dir)
+
+    def test_layers(self):
+        self.assertEqual(layers(2), [1, 2, 2, 4])
+        self.assertEqual(len(layers(5)) - 1, Towers.moves_for_height(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
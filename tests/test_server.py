@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_server
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import base64
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+from towers.core.moves import pack_moves
+from towers.core.solution import iter_solution
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'the server requires Python 3.7+')
+class ServerTestCase(unittest.TestCase):
+    def setUp(self):
+        import asyncio
+
+        from towers.server import ResultCache, Server
+
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'towers.sock')
+        self.server = Server(self.path, ResultCache(1 << 16))
+        self.loop = asyncio.new_event_loop()
+        self.loop.run_until_complete(self.server.start())
+        self.thread = threading.Thread(target=self.loop.run_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        import asyncio
+
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.server.close()
+        tasks = asyncio.all_tasks(self.loop)
+        if tasks:
+            self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+        shutil.rmtree(self.dir)
+
+    def request(self, op, **fields):
+        from towers.server import request
+
+        return request(self.path, op, **fields)
+
+    def test_solve(self, height=10):
+        packed = bytes(pack_moves((i.start, i.end) for i in iter_solution(height)))
+        header, body = self.request('solve', height=height)
+        self.assertEqual(header['moves'], 2 ** height - 1)
+        self.assertEqual(body, packed)
+
+        header, body = self.request('solve', height=3, format='jsonl')
+        moves = [json.loads(line) for line in body.decode('ascii').splitlines()]
+        self.assertEqual([(i['start'], i['end']) for i in moves][:2], [('start', 'end'),
+                                                                       ('start', 'tmp')])
+
+        # Concurrent clients share the cached response, too large responses are streamed only.
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.request(
+            'solve', height=height)[1])) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [packed] * 4)
+        self.assertGreaterEqual(self.server.cache.hits, 1)
+        self.assertEqual(len(self.request('solve', height=17)[1]), 2 ** 17 - 1)
+        self.assertEqual(len(self.server.cache), 2)
+
+    def test_queries(self, height=5):
+        self.assertEqual(self.request('count', height=height)[0]['moves'], 31)
+        self.assertEqual(self.request('count', height=height, variant='linear')[0]['moves'], 242)
+        header = self.request('state-at', height=3, moves=1)[0]
+        self.assertEqual(header['rods'], 'Rods(3 - start([***, **]), end([*]), tmp([]))')
+
+        packed = base64.b64encode(bytes(pack_moves([(0, 1), (0, 1)]))).decode('ascii')
+        header = self.request('verify', height=height, packed=packed)[0]
+        self.assertEqual((header['valid'], header['index']), (False, 1))
+
+    def test_large_verify(self, height=16):
+        # The base64 moves are longer than the default line limit of a stream.
+        packed = bytes(pack_moves((i.start, i.end) for i in iter_solution(height)))
+        header = self.request('verify', height=height, packed=base64.b64encode(packed).decode())[0]
+        self.assertTrue(header['ok'])
+        self.assertTrue(header['optimal'])
+
+    def test_too_long(self):
+        import asyncio
+
+        from towers.server import Server, request
+
+        path = os.path.join(self.dir, 'small.sock')
+        server = Server(path, limit=1 << 10)
+        asyncio.run_coroutine_threadsafe(server.start(), self.loop).result()
+        try:
+            header = request(path, 'verify', height=3, packed='A' * (1 << 11))[0]
+            self.assertFalse(header['ok'])
+            self.assertIn('longer', header['error'])
+        finally:
+            self.loop.call_soon_threadsafe(server.close)
+
+    def test_errors(self):
+        self.assertFalse(self.request('solve', height=0)[0]['ok'])
+        self.assertFalse(self.request('solve', height=3, format='xml')[0]['ok'])
+        self.assertIn('unknown', self.request('shuffle', height=3)[0]['error'])
+        self.assertIn('height', self.request('count')[0]['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_snapshot
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import sys
+import threading
+import unittest
+
+from towers import CorruptRod, Towers
+from towers.core.solution import state_at
+
+
+class SnapshotTestCase(unittest.TestCase):
+    def setUp(self):
+        self.interval = getattr(sys, 'getswitchinterval', lambda: None)()
+        if self.interval is not None:
+            # Switch threads as often as possible to provoke torn reads.
+            sys.setswitchinterval(1e-6)
+
+    def tearDown(self):
+        if self.interval is not None:
+            sys.setswitchinterval(self.interval)
+
+    def check_concurrent(self, tower, run):
+        height = tower.height
+        worker = threading.Thread(target=run)
+        worker.start()
+        snapshots = []
+        while worker.is_alive():
+            snapshots.append(tower.snapshot())
+        worker.join()
+        snapshots.append(tower.snapshot())
+
+        for moves, state in snapshots:
+            self.assertEqual(state, state_at(height, moves))
+        self.assertEqual(snapshots[-1], (tower.total_moves, state_at(height, tower.total_moves)))
+
+    def test_compact(self, height=12):
+        tower = Towers(height)
+        self.check_concurrent(tower, tower)
+
+    def test_moves(self, height=9):
+        tower = Towers(height)
+        self.check_concurrent(tower, lambda: list(tower))
+
+    def test_failed_move(self, height=3):
+        tower = Towers(height)
+        self.assertRaises(IndexError, list, tower.move_disk(tower.end_rod, tower.start_rod))
+        self.assertEqual(tower.snapshot(), (0, state_at(height, 0)))
+
+        list(tower.move_disk(tower.start_rod, tower.end_rod))
+        self.assertRaises(CorruptRod, list, tower.move_disk(tower.start_rod, tower.end_rod))
+        self.assertEqual(tower.snapshot()[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_solution
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import itertools
+import unittest
+
+from towers import CyclicTowers, InvalidMoves, LinearTowers, Towers
+from towers.core.solution import (
+    count_moves, iter_filtered, iter_solution, move_at, next_move, previous_move, state_at,
+)
+from towers.core.state import end_state, start_state
+
+
+class SolutionTestCase(unittest.TestCase):
+    def test_matches_towers(self):
+        for height in range(1, 8):
+            tower = Towers(height)
+            for index, move in enumerate(tower.iter_compact()):
+                self.assertEqual(move_at(height, index), move)
+                self.assertEqual(state_at(height, index + 1), tower.state)
+
+    def test_iter_solution(self, height=6):
+        self.assertEqual(list(iter_solution(height)), list(Towers(height).iter_compact()))
+        self.assertEqual(list(iter_solution(height, 10, 20)), list(iter_solution(height))[10:20])
+
+    def test_iter_filtered(self, height=6):
+        moves = list(iter_solution(height))
+        for disks in [None, [1], [height - 1, height], [height + 1]]:
+            for pairs, indexes in [(None, None), ([(0, 1)], [(0, 1)]),
+                                   ([('tmp', 'end'), (1, 0)], [(2, 1), (1, 0)])]:
+                expected = [
+                    i for i in moves
+                    if disks is None or i.disk in disks
+                    if indexes is None or (i.start, i.end) in indexes
+                ]
+                self.assertEqual(list(iter_filtered(height, disks, pairs)), expected)
+        self.assertEqual(list(iter_filtered(height, [2], None, 10, 30)),
+                         [i for i in moves[10:30] if i.disk == 2])
+
+    def test_iter_filtered_huge(self, height=200):
+        # Only the moves of the largest disks are generated.
+        moves = list(iter_filtered(height, range(height - 2, height + 1), [(0, 1)]))
+        self.assertEqual(moves, [move_at(height, i.moves) for i in moves])
+        self.assertEqual([i.disk for i in moves], [height - 2, height, height - 2])
+
+    def test_queries(self, height=6):
+        moves = list(iter_solution(height))
+        lands = [('start', 'end'), ('tmp', 'end')]
+        for disk in range(1, height + 1):
+            selected = [i for i in moves if i.disk == disk and i.end == 1]
+            for index in range(len(moves) + 1):
+                after = [i for i in selected if i.moves >= index]
+                before = [i for i in selected if i.moves <= index]
+                self.assertEqual(next_move(height, index, [disk], lands), (after or [None])[0])
+                self.assertEqual(previous_move(height, index, [disk], lands),
+                                 (before or [None])[-1])
+                self.assertEqual(count_moves(height, index, None, [disk], lands), len(after))
+
+        self.assertEqual(count_moves(height, 5, 40, rod_pairs=[(2, 1)]),
+                         len([i for i in moves[5:40] if i[1:3] == (2, 1)]))
+        self.assertEqual(count_moves(height, 40, 5), 0)
+
+    def test_queries_huge(self, height=1000):
+        total = Towers.moves_for_height(height)
+        self.assertEqual(count_moves(height), total)
+        self.assertEqual(count_moves(height, disks=[1]), (total + 1) // 2)
+        self.assertEqual(next_move(height, 1, disks=[height]), move_at(height, total // 2))
+        self.assertIsNone(next_move(height, total // 2 + 1, disks=[height]))
+        self.assertEqual(previous_move(height, total), move_at(height, total - 1))
+
+    def test_iter_moves(self, height=5):
+        for cls in (Towers, CyclicTowers, LinearTowers):
+            tower = cls(height)
+            expected = list(tower.iter_compact())
+            tower = cls(height)
+            self.assertEqual(list(tower.iter_moves()), expected)
+            self.assertEqual(list(tower.iter_moves(disks=[height], rod_pairs=[('start', 'tmp')])),
+                             [i for i in expected if i.disk == height and i[1:3] == (0, 2)])
+            self.assertEqual(tower.moves, 0)
+
+            for _ in itertools.islice(tower.iter_compact(), 7):
+                pass
+            self.assertEqual(list(tower.iter_moves(disks=[1])),
+                             [i for i in expected[7:] if i.disk == 1])
+
+    def test_bounds(self, height=100):
+        total = Towers.moves_for_height(height)
+        self.assertEqual(state_at(height, 0), start_state(height))
+        self.assertEqual(state_at(height, total), end_state(height))
+        self.assertEqual(move_at(height, total // 2).disk, height)
+        self.assertRaises(InvalidMoves, move_at, height, total)
+        self.assertRaises(InvalidMoves, state_at, height, total + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_state
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import unittest
+
+from towers import IllegalMove, Rods, Towers
+from towers.core.state import (
+    apply, decode, encode, end_state, from_masks, height_of, legal_moves, rank, start_state,
+    unrank,
+)
+
+
+class StateTestCase(unittest.TestCase):
+    def test_encode_decode(self, height=4):
+        tower = Towers(height)
+        self.assertEqual(tower.state, start_state(height))
+        self.assertEqual(height_of(tower.state), height)
+
+        for _ in tower.iter_compact():
+            self.assertEqual(decode(tower.state), tower._rods)
+        self.assertEqual(tower.state, end_state(height))
+
+    def test_legal_moves(self, height=4):
+        tower = Towers(height)
+        for _ in tower.iter_compact():
+            state = tower.state
+            expected = []
+            for start, end in [(0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1)]:
+                rods = copy.deepcopy(tower._rods)
+                try:
+                    rods[end].append(rods[start].pop())
+                except (IndexError, ValueError):
+                    continue
+                expected.append(encode(rods))
+            self.assertEqual([apply(state, move) for move in legal_moves(state)], expected)
+
+    def test_apply(self, height=3):
+        state = start_state(height)
+        state = apply(state, (0, 1))
+        self.assertEqual(str(decode(state)), 'Rods(3 - start([***, **]), end([*]), tmp([]))')
+        self.assertRaises(IllegalMove, apply, state, (0, 1))
+        self.assertRaises(IllegalMove, apply, state, (2, 0))
+        self.assertEqual(legal_moves(start_state(height)), [(0, 1), (0, 2)])
+        self.assertEqual(encode(Rods(height)), start_state(height))
+
+    def test_rank(self, height=5):
+        ranks = set()
+        for index in range(3 ** height):
+            state = unrank(index, height)
+            self.assertEqual(rank(state), index)
+            ranks.add(state)
+        self.assertEqual(len(ranks), 3 ** height)
+        self.assertEqual(rank(start_state(height)), 0)
+
+    def test_from_masks(self, height=3):
+        self.assertEqual(from_masks([(1 << height) - 1, 0, 0]), start_state(height))
+        self.assertEqual(from_masks([0, (1 << height) - 1, 0]), end_state(height))
+        # The smallest disk on `end`, the others on `tmp`.
+        self.assertEqual(decode(from_masks([0, 1, 6])), decode(unrank(1 + 2 * 3 + 2 * 9, 3)))
+
+
+if __name__ == '__main__':
+    unittest.main()
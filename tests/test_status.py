@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_status
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import pickle
+import unittest
+
+from towers import (
+    CorruptRod, Disk, InvalidEndingConditions, InvalidStartingConditions, LinearTowers, Rod, Rods,
+    Towers,
+)
+
+
+class StatusTestCase(unittest.TestCase):
+    def test_predicates(self, height=4):
+        for iterate in (list, lambda tower: list(tower.iter_compact())):
+            tower = Towers(height)
+            self.assertTrue(tower.is_start())
+            self.assertFalse(tower.is_solved())
+            self.assertFalse(tower)
+            moves = iter(tower) if iterate is list else tower.iter_compact()
+            next(moves)
+            self.assertFalse(tower.is_start())
+            self.assertFalse(tower.is_solved())
+            self.assertTrue(tower.is_valid())
+            list(moves)
+            self.assertTrue(tower.is_solved())
+            self.assertTrue(tower)
+            tower.validate_end()
+
+    def test_cached(self, height=3):
+        tower = LinearTowers(height)
+        tower()
+        self.assertTrue(tower.is_solved())
+
+        tower.end_rod.disks.reverse()
+        tower.invalidate()
+        self.assertFalse(tower.is_valid())
+        self.assertFalse(tower.is_solved())
+        self.assertRaises(CorruptRod, tower.validate_end)
+
+    def test_validate_direct_changes(self, height=3):
+        # The validators always check the rods, whatever the cache says.
+        tower = Towers(height)
+        self.assertTrue(tower.is_start())
+        tower.end_rod.append(tower.start_rod.pop())
+        self.assertRaises(InvalidStartingConditions, tower.validate_start)
+        self.assertFalse(tower.is_start())
+
+        tower = Towers(height)
+        tower()
+        self.assertTrue(tower.is_solved())
+        tower.start_rod.append(tower.end_rod.pop())
+        self.assertRaises(InvalidEndingConditions, tower.validate_end)
+        self.assertFalse(tower)
+
+        # The predicates see the disks moved directly, without validating.
+        tower = Towers(height)
+        tower()
+        tower.start_rod.append(tower.end_rod.pop())
+        self.assertFalse(tower)
+        self.assertFalse(tower.is_solved())
+
+        tower = Towers(height)
+        tower()
+        smallest = tower.end_rod.pop()
+        middle = tower.end_rod.pop()
+        tower.end_rod.append(smallest)
+        tower.end_rod.append(middle, validate=False)
+        self.assertRaises(CorruptRod, tower.validate)
+        self.assertRaises(CorruptRod, tower.validate_end)
+        self.assertFalse(tower.is_valid())
+
+    def test_untrusted_start(self, height=3):
+        # The schedule moves the largest disk onto the middle disk.
+        start = Rod('start', [Disk(0, height), Disk(2, height)], height)
+        tmp = Rod('tmp', [Disk(1, height)], height)
+        tower = Towers(height, rods=Rods(height, start, Rod('end', height=height), tmp))
+        self.assertTrue(tower.is_valid())
+        self.assertFalse(tower.is_start())
+        self.assertRaises(CorruptRod, list, tower.iter_compact())
+        self.assertFalse(tower.is_valid())
+
+    def test_untrusted_call(self, height=3):
+        start = Rod('start', [Disk(0, height), Disk(2, height)], height)
+        tmp = Rod('tmp', [Disk(1, height)], height)
+        tower = Towers(height, rods=Rods(height, start, Rod('end', height=height), tmp))
+        self.assertRaises(CorruptRod, tower)
+        self.assertEqual(tower.moves, 1)
+
+    def test_failed_move(self, height=3):
+        tower = Towers(height)
+        list(tower.move_disk(tower.start_rod, tower.end_rod))
+        self.assertRaises(CorruptRod, list, tower.move_disk(tower.start_rod, tower.end_rod))
+        self.assertFalse(tower.is_valid())
+
+    def test_lazy_errors(self, height=3):
+        tower = Towers(height)
+        error = InvalidEndingConditions(tower._rods)
+        self.assertEqual(error.args, (tower._rods,))
+        self.assertEqual(str(error), 'Invalid ending condition for rods: {rods}'.format(
+            rods=tower._rods))
+        error = pickle.loads(pickle.dumps(CorruptRod('rod', 'disk')))
+        self.assertEqual((error.rod, error.disk), ('rod', 'disk'))
+
+
+if __name__ == '__main__':
+    unittest.main()
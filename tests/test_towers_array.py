@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_towers_array
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from towers import InvalidMoves, InvalidTowerHeight, Towers, TowersArray
+from towers.core.solution import state_at
+from towers.core.state import tops
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, 'numpy is not installed')
+class TowersArrayTestCase(unittest.TestCase):
+    def test_step(self, height=5):
+        moves = numpy.arange(0, 32)
+        towers = TowersArray(len(moves), height, moves=moves)
+        for _ in range(10):
+            active = towers.step()
+            self.assertEqual(list(active), list(moves < 31))
+            moves = numpy.minimum(moves + 1, 31)
+            self.assertEqual(list(towers.moves), list(moves))
+            self.assertEqual(list(towers.states()), [state_at(height, int(i)) for i in moves])
+            self.assertEqual([list(i) for i in towers.tops()],
+                             [list(tops(state_at(height, int(i)))) for i in moves])
+        self.assertTrue(towers.valid().all())
+        self.assertEqual(list(towers.solved()), list(moves == 31))
+
+    def test_matches_towers(self, height=4):
+        towers = TowersArray(3, height)
+        tower = Towers(height)
+        for move in tower.iter_compact():
+            towers.step()
+            self.assertEqual(towers.tower(2), tower)
+        self.assertEqual(str(towers.tower(0)), str(tower))
+
+    def test_apply(self, height=3):
+        towers = TowersArray(4, height)
+        legal = towers.apply([0, 0, 1, 0], [1, 2, 0, 0])
+        self.assertEqual(list(legal), [True, True, False, False])
+        self.assertEqual(list(towers.moves), [1, 1, 0, 0])
+        self.assertEqual(list(towers.legal(0, 2)), [True, False, True, True])
+        self.assertTrue(towers.valid().all())
+
+        towers.masks[3, 1] = 1
+        self.assertEqual(list(towers.valid()), [True, True, True, False])
+
+    def test_bounds(self, height=63):
+        towers = TowersArray(2, height, moves=[0, 2 ** height - 1])
+        self.assertEqual(list(towers.solved()), [False, True])
+        self.assertEqual(list(towers.states()),
+                         [state_at(height, 0), state_at(height, 2 ** height - 1)])
+        self.assertRaises(InvalidMoves, towers.seek, 2 ** height)
+        self.assertRaises(InvalidTowerHeight, TowersArray, 1, 64)
+
+
+if __name__ == '__main__':
+    unittest.main()
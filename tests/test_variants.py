@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_variants
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import itertools
+import unittest
+
+from towers import CyclicTowers, GraphTowers, LinearTowers, Towers, Unsolvable
+from towers.core.search import search
+
+
+class VariantsTestCase(unittest.TestCase):
+    def assertSolves(self, tower, allowed, expected):
+        with tower:
+            moves = list(tower)
+        self.assertEqual(len(moves), expected)
+        self.assertEqual(tower.moves, expected)
+        for i in moves:
+            self.assertIn((i.start.name, i.end.name), allowed)
+
+    def test_cyclic(self):
+        for height in range(1, 7):
+            self.assertSolves(
+                CyclicTowers(height),
+                [('start', 'tmp'), ('tmp', 'end'), ('end', 'start')],
+                search(height, rule=lambda d, start, end: end == (start + 2) % 3).distance,
+            )
+            self.assertSolves(
+                CyclicTowers(height, clockwise=False),
+                [('start', 'end'), ('end', 'tmp'), ('tmp', 'start')],
+                CyclicTowers.moves_for_height(height, clockwise=False),
+            )
+        self.assertEqual(CyclicTowers.moves_for_height(4, clockwise=False), 43)
+
+    def test_linear(self):
+        allowed = [('start', 'tmp'), ('tmp', 'start'), ('tmp', 'end'), ('end', 'tmp')]
+        for height in range(1, 7):
+            self.assertSolves(LinearTowers(height), allowed, LinearTowers.moves_for_height(height))
+
+    def test_context(self, height=4):
+        tower = CyclicTowers(height, clockwise=False)
+        with tower.context():
+            for _ in tower.iter_compact():
+                pass
+        self.assertEqual(tower, CyclicTowers(height))
+        self.assertEqual(tower.moves, 0)
+
+        other = copy.deepcopy(tower)
+        self.assertIsInstance(other, CyclicTowers)
+        self.assertFalse(other.clockwise)
+        self.assertIsInstance(copy.copy(LinearTowers(height)), LinearTowers)
+        self.assertEqual(Towers.moves_for_height(height), 15)
+
+    def test_graph(self):
+        pairs = [(start, end) for start in range(3) for end in range(3) if start != end]
+        names = ['start', 'end', 'tmp']
+        for count in range(1, len(pairs) + 1):
+            for allowed in itertools.combinations(pairs, count):
+                for height in range(1, 5):
+                    expected = search(
+                        height, rule=lambda d, start, end: (start, end) in allowed,
+                    ).distance
+                    if expected is None:
+                        self.assertRaises(Unsolvable, GraphTowers.moves_for_height, height,
+                                          allowed)
+                        continue
+                    self.assertSolves(GraphTowers(height, allowed=allowed),
+                                      [(names[a], names[b]) for a, b in allowed], expected)
+
+    def test_graph_counts(self, height=100):
+        clockwise = [('start', 'tmp'), ('tmp', 'end'), ('end', 'start')]
+        linear = [(0, 2), (2, 0), (2, 1), (1, 2)]
+        self.assertEqual(GraphTowers.moves_for_height(height, clockwise),
+                         CyclicTowers.moves_for_height(height))
+        self.assertEqual(GraphTowers.moves_for_height(height, linear), 3 ** height - 1)
+        self.assertEqual(GraphTowers(height).total_moves, 2 ** height - 1)
+        self.assertEqual(GraphTowers.moves_for_height(height), Towers.moves_for_height(height))
+        self.assertRaises(Unsolvable, GraphTowers.moves_for_height, 2, [(0, 1)])
+        self.assertRaises(ValueError, GraphTowers, 2, allowed=[(0, 0)])
+        self.assertRaises(ValueError, GraphTowers, 2, allowed=[('start', 'nowhere')])
+
+    def test_graph_copies(self, height=4):
+        tower = GraphTowers(height, allowed=[(0, 1), (0, 2), (1, 2), (2, 1), (2, 0)])
+        clone = copy.deepcopy(tower)
+        self.assertIsInstance(clone, GraphTowers)
+        self.assertEqual(clone.allowed, tower.allowed)
+        self.assertEqual(copy.copy(tower).allowed, tower.allowed)
+        self.assertNotIn('costs', tower.to_json())
+        self.assertFalse(hasattr(tower, 'total_cost'))
+        self.assertEqual(list(clone.iter_compact()), list(tower.iter_moves()))
+        self.assertTrue(clone.is_solved())
+
+
+if __name__ == '__main__':
+    unittest.main()
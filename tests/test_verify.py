@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_verify
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import unittest
+
+from towers import Towers, verify
+from towers.core.moves import ROD_NAMES, pack_moves
+from towers.core.solution import iter_solution
+from towers.core.verify import EMPTY_ROD, LARGER_DISK, SAME_ROD, UNKNOWN_ROD
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+def solution(height):
+    return [(i.start, i.end) for i in iter_solution(height)]
+
+
+class VerifyTestCase(unittest.TestCase):
+    def test_optimal(self, height=8):
+        moves = solution(height)
+        for i in [moves, pack_moves(moves), [(ROD_NAMES[a], ROD_NAMES[b]) for a, b in moves]]:
+            result = verify(height, i)
+            self.assertTrue(result.optimal)
+            self.assertEqual(result.moves, Towers.moves_for_height(height))
+
+    def test_illegal(self, height=3):
+        self.assertEqual(verify(height, [(1, 0)])[2:4], (0, EMPTY_ROD))
+        self.assertEqual(verify(height, [(0, 1), (0, 1)])[2:4], (1, LARGER_DISK))
+        self.assertEqual(verify(height, [(0, 0)])[2:4], (0, SAME_ROD))
+        self.assertEqual(verify(height, [(0, 'x')])[2:4], (0, UNKNOWN_ROD))
+        self.assertEqual(verify(height, b'\x01\x0f')[2:4], (1, UNKNOWN_ROD))
+
+    def test_suboptimal(self, height=4):
+        moves = [(0, 1), (1, 0)] + solution(height)
+        for i in [moves, pack_moves(moves)]:
+            result = verify(height, i)
+            self.assertTrue(result.solved)
+            self.assertFalse(result.optimal)
+
+        moves = solution(height)
+        moves[7] = moves[7][::-1]
+        for i in [moves, pack_moves(moves)]:
+            self.assertEqual(verify(height, i)[1:4], (7, 7, EMPTY_ROD))
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy(self, height=12):
+        moves = numpy.array(solution(height))
+        self.assertTrue(verify(height, moves).optimal)
+        moves[100] = [2, 2]
+        self.assertEqual(verify(height, moves)[2:4], (100, SAME_ROD))
+        packed = numpy.frombuffer(b'\x09', numpy.uint8)
+        self.assertEqual(verify(height, packed)[2:4], (0, EMPTY_ROD))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module tests.test_zobrist
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import copy
+import unittest
+
+from towers import Rods, Towers
+from towers.core.zobrist import zobrist_hash
+
+
+class ZobristTestCase(unittest.TestCase):
+    def test_incremental_hash(self, height=4):
+        tower = Towers(height)
+        for _ in tower.iter_compact():
+            for rod in tower._rods:
+                self.assertEqual(rod.zobrist, zobrist_hash(rod.disks))
+
+    def test_dedupe_states(self, height=3):
+        tower = Towers(height)
+        seen = set([copy.deepcopy(tower._rods)])
+        for _ in tower:
+            seen.add(copy.deepcopy(tower._rods))
+        self.assertEqual(len(seen), tower.moves_for_height(height) + 1)
+        self.assertIn(Rods(height), seen)
+
+    def test_equality(self, height=3):
+        tower = Towers(height)
+        other = Towers(height)
+        self.assertEqual(hash(tower), hash(other))
+        self.assertTrue(tower == other)
+
+        tower()
+        self.assertIs(tower == other, False)
+        self.assertIs(tower.end_rod == other.end_rod, False)
+        self.assertIs(tower == object(), False)
+        self.assertEqual(tower, Towers.from_json(tower.to_json()))
+        self.assertEqual(hash(tower), hash(Towers.from_json(tower.to_json())))
+
+    def test_copy_then_move(self, height=3):
+        rod = Towers(height).start_rod
+        clone = copy.copy(rod)
+        rod.pop()
+        self.assertEqual(len(clone.disks), height)
+        self.assertEqual(clone.zobrist, zobrist_hash(clone.disks))
+        self.assertEqual(rod.zobrist, zobrist_hash(rod.disks))
+        self.assertNotEqual(rod, clone)
+        rod.append(clone.disks[-1])
+        self.assertEqual(rod, clone)
+        self.assertEqual(hash(rod), hash(clone))
+
+        # Changed directly, equal whatever the (stale) hash.
+        clone.disks.pop()
+        other = copy.copy(clone)
+        self.assertEqual(clone, other)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,23 +17,36 @@
 
 from .core.disk import Disk
 from .core.errors import (
-    CorruptRod, DuplicateDisk, InvalidDiskPosition, InvalidEndingConditions, InvalidMoves,
-    InvalidRod, InvalidRodHeight, InvalidRods, InvalidStartingConditions, InvalidTowerHeight,
-    TowersError,
+    CorruptRod, DuplicateDisk, IllegalMove, InvalidDiskPosition, InvalidEndingConditions,
+    InvalidMoves, InvalidRod, InvalidRodHeight, InvalidRods, InvalidStartingConditions,
+    InvalidTowerHeight, TowersError, Unsolvable,
 )
-from .core.moves import Move
-from .core.rod import Rod
+from .core.moves import CompactMove, Move
+from .core.render import Renderer
+from .core.rod import PersistentRod, Rod
 from .core.rods import Rods
 from .core.towers import Towers
+from .core.towers_array import TowersArray
+from .core.variants import CapacityTowers, CyclicTowers, GraphTowers, LinearTowers, WeightedTowers
 from .core.validation import validate_height, validate_moves, validate_rods
+from .core.verify import Verification, verify
 from .__version__ import __version__, __author__, __title__
 
 __all__ = [
     'Towers',
+    'TowersArray',
+    'CyclicTowers',
+    'CapacityTowers',
+    'GraphTowers',
+    'LinearTowers',
+    'WeightedTowers',
     'Disk',
     'Rod',
+    'PersistentRod',
     'Rods',
     'Move',
+    'CompactMove',
+    'Renderer',
     'TowersError',
     'DuplicateDisk',
     'CorruptRod',
@@ -45,7 +58,11 @@ __all__ = [
     'InvalidRods',
     'InvalidRodHeight',
     'InvalidMoves',
+    'IllegalMove',
+    'Unsolvable',
     'validate_height',
     'validate_rods',
     'validate_moves',
+    'verify',
+    'Verification',
 ]
@@ -0,0 +1,236 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.cli
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+#
+# The `towers` command.
+#
+# Every sub-command imports what it needs when it runs (ie: numpy, cProfile, multiprocessing) so
+# that the command starts quickly.
+
+import argparse
+import errno
+import os
+import sys
+
+from .core.blocks import FORMATS as SOLVE_FORMATS
+from .core.errors import TowersError
+from .core.variants import VARIANTS
+
+__all__ = ['main']
+
+
+def _open(path, mode='wb'):
+    """
+    Open a file, `-` (or None) = stdin/stdout.
+    """
+    if path in (None, '-'):
+        stream = sys.stdin if 'r' in mode else sys.stdout
+        return getattr(stream, 'buffer', stream), False
+    return open(path, mode), True
+
+
+def solve(args):
+    """
+    Stream the optimal solution in constant memory.
+    """
+    from .core.blocks import iter_batches
+
+    batches = iter_batches(args.height, args.format)
+
+    stream, close = _open(args.out)
+    try:
+        for batch in batches:
+            stream.write(batch)
+        stream.flush()
+    finally:
+        if close:
+            stream.close()
+    return 0
+
+
+def count(args):
+    """
+    Print the number of moves required to solve the tower.
+    """
+    from .core.variants import moves_for_variant
+
+    print(moves_for_variant(args.height, args.variant))
+    return 0
+
+
+def state_at(args):
+    """
+    Print the state of the optimal solution after a number of moves.
+    """
+    from .core.solution import state_at
+    from .core.state import decode
+
+    state = state_at(args.height, args.moves)
+    print(state)
+    print(decode(state))
+    return 0
+
+
+def verify(args):
+    """
+    Verify a move log, the exit status is 1 if any move is illegal.
+    """
+    from .core.parallel import verify_file
+
+    fmt = None if args.format == 'auto' else args.format
+    result = verify_file(args.file, args.height, fmt=fmt, workers=args.workers)
+    if not result.valid:
+        print('illegal move at {index}: {reason}'.format(index=result.index, reason=result.reason))
+        return 1
+    print('valid moves={moves} solved={solved} optimal={optimal}'.format(
+        moves=result.moves, solved=result.solved, optimal=result.optimal,
+    ))
+    return 0
+
+
+def _benchmarks(height):
+    """
+    Obtain the benchmarked solvers as (name, function) pairs.
+    """
+    from collections import deque
+
+    from .core.blocks import iter_compact, iter_packed
+    from .core.solution import iter_solution
+    from .core.towers import Towers
+    from .core.utils import import_numpy
+    from .core.verify import optimal_packed
+
+    def drain(iterable):
+        return lambda: deque(iterable(), 0)
+
+    benchmarks = [
+        ('moves', drain(lambda: Towers(height))),
+        ('compact', drain(lambda: Towers(height).iter_compact())),
+        ('solution', drain(lambda: iter_solution(height))),
+        ('blocks', drain(lambda: iter_compact(height))),
+        ('packed', drain(lambda: iter_packed(height))),
+    ]
+    np = import_numpy()
+    if np is not None:
+        benchmarks.append(('numpy', lambda: optimal_packed(np, height, 0, (1 << height) - 1)))
+    return benchmarks
+
+
+def bench(args):
+    """
+    Time the solvers and print their throughput.
+    """
+    import timeit
+
+    total = (1 << args.height) - 1
+    for name, function in _benchmarks(args.height):
+        elapsed = min(timeit.repeat(function, number=1, repeat=args.repeat))
+        print('{name:<10} {moves} moves in {elapsed:.4f}s, {rate:,.0f} moves/s'.format(
+            name=name, moves=total, elapsed=elapsed, rate=total / max(elapsed, 1e-9),
+        ))
+    return 0
+
+
+def profile(args):
+    """
+    Profile a full solve (with :class:`Move` snapshots) and print the hot spots.
+    """
+    import cProfile
+    import pstats
+
+    from .core.towers import Towers
+
+    tower = Towers(args.height)
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for _ in tower:
+        pass
+    profiler.disable()
+
+    stats = pstats.Stats(profiler, stream=sys.stdout)
+    stats.strip_dirs().sort_stats(args.sort).print_stats(args.limit)
+    return 0
+
+
+def serve(args):
+    """
+    Serve requests on a Unix socket until interrupted.
+    """
+    from .server import serve
+
+    serve(args.socket, cache_bytes=args.cache_bytes)
+    return 0
+
+
+def _parser():
+    parser = argparse.ArgumentParser(prog='towers', description='The towers of Hanoi.')
+    commands = parser.add_subparsers(dest='command', metavar='command')
+    commands.required = True
+
+    def command(name, function, help):
+        sub = commands.add_parser(name, help=help, description=help)
+        sub.add_argument('--height', type=int, default=3, help='The height of the tower.')
+        sub.set_defaults(function=function)
+        return sub
+
+    sub = command('solve', solve, 'Stream the optimal solution.')
+    sub.add_argument('--format', choices=SOLVE_FORMATS, default='text')
+    sub.add_argument('--out', default='-', help='The output file, default = stdout.')
+
+    sub = command('count', count, 'Print the number of moves required.')
+    sub.add_argument('--variant', choices=VARIANTS, default='classic')
+
+    sub = command('state-at', state_at, 'Print the state after a number of optimal moves.')
+    sub.add_argument('moves', type=int)
+
+    sub = command('verify', verify, 'Verify a move log.')
+    sub.add_argument('file', help='The move log, as written by `solve`.')
+    sub.add_argument('--format', choices=('auto',) + SOLVE_FORMATS, default='auto',
+                     help='The format of the log, default = detected from its first byte.')
+    sub.add_argument('--workers', type=int, default=None)
+
+    sub = command('bench', bench, 'Time the solvers.')
+    sub.add_argument('--repeat', type=int, default=3)
+
+    sub = command('profile', profile, 'Profile a solve and print the hot spots.')
+    sub.add_argument('--limit', type=int, default=20, help='The number of functions to print.')
+    sub.add_argument('--sort', default='cumulative', help='The pstats sort key.')
+
+    help = 'Serve solve, count, state-at and verify requests over a Unix socket.'
+    sub = commands.add_parser('serve', help=help, description=help)
+    sub.add_argument('--socket', required=True, help='The path of the Unix socket.')
+    sub.add_argument('--cache-bytes', type=int, default=1 << 26,
+                     help='The maximum size of the shared response cache.')
+    sub.set_defaults(function=serve)
+    return parser
+
+
+def main(argv=None):
+    """
+    Run the `towers` command.
+
+    :param List[str] argv:
+        (optional) The arguments. Default = `sys.argv[1:]`.
+    :rtype: int
+    :return:
+        The exit status.
+    """
+    args = _parser().parse_args(argv)
+    try:
+        return args.function(args)
+    except TowersError as e:
+        sys.stderr.write('towers: {error}\n'.format(error=e))
+        return 2
+    except IOError as e:
+        # The reader of a pipeline went away (ie: `towers solve | head`), silence the final flush.
+        if e.errno != errno.EPIPE:
+            raise
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
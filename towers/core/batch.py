@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.batch
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from six.moves import range
+
+from .errors import InvalidMoves, InvalidTowerHeight
+from .solution import _moves_array, _step
+from .utils import import_numpy
+from .validation import validate_height
+
+__all__ = [
+    'moves_at',
+    'states_at',
+]
+
+# The largest tower whose move indexes fit in a uint64.
+MAX_HEIGHT = 63
+
+# The default number of array elements computed at once.
+CHUNK_SIZE = 1 << 20
+
+
+def _prepare(height, indexes, total):
+    """
+    Validate the height and indexes, returning numpy and the indexes as a uint64 array.
+    """
+    validate_height(height)
+    if height > MAX_HEIGHT:
+        raise InvalidTowerHeight(height)
+    np = import_numpy()
+    if np is None:  # pragma: no cover
+        raise ImportError('batch queries require numpy')
+
+    indexes = np.asarray(indexes)
+    if indexes.size:
+        if indexes.dtype.kind not in 'iu':
+            raise InvalidMoves(indexes.flat[0])
+        lowest = int(indexes.min())
+        highest = int(indexes.max())
+        if lowest < 0 or highest > total:
+            raise InvalidMoves(lowest if lowest < 0 else highest)
+    return np, indexes.astype(np.uint64).ravel()
+
+
+def _rods(np, height, disk, moves):
+    """
+    Calculate the rod of a disk after the given uint64 numbers of moves.
+    """
+    turns = (moves + np.uint64(1 << (disk - 1))) >> np.uint64(disk)
+    return (turns * np.uint64(_step(height, disk))) % np.uint64(3)
+
+
+def moves_at(height, indexes, chunk_size=CHUNK_SIZE):
+    """
+    Determine the moves at many indexes of the optimal solution at once, vectorized
+    (see :func:`towers.core.solution.move_at`).
+
+    :param int height:
+        The height of the tower, at most 63.
+    :param numpy.ndarray indexes:
+        The indexes of the moves.
+    :param int chunk_size:
+        The number of indexes computed at once, bounds the temporary memory.
+    :rtype:
+        tuple
+    :return:
+        The (disk, start, end) uint8 arrays, the disk widths and the rod indexes (see
+        `ROD_NAMES`), in the shape of `indexes`.
+    :raises InvalidMoves:
+        An index is not within the solution.
+    """
+    np, flat = _prepare(height, indexes, (1 << height) - 2)
+    result = tuple(np.empty(len(flat), dtype=np.uint8) for _ in range(3))
+
+    for begin in range(0, len(flat), chunk_size):
+        stop = begin + chunk_size
+        for array, values in zip(result, _moves_array(np, height, flat[begin:stop])):
+            array[begin:stop] = values
+    shape = np.shape(indexes)
+    return tuple(array.reshape(shape) for array in result)
+
+
+def states_at(height, moves, chunk_size=CHUNK_SIZE):
+    """
+    Determine the state after many numbers of moves of the optimal solution at once, vectorized
+    (see :func:`towers.core.solution.state_at`).
+
+    :param int height:
+        The height of the tower, at most 63.
+    :param numpy.ndarray moves:
+        The numbers of moves made (a one dimensional array).
+    :param int chunk_size:
+        The number of elements (states x height) computed at once, bounds the temporary memory.
+    :rtype:
+        numpy.ndarray
+    :return:
+        A (len(moves), height) uint8 array of the rod index (see `ROD_NAMES`) of every disk, the
+        disk of width `w` is in column `w-1`.
+    :raises InvalidMoves:
+        A number of moves is not within the solution.
+    """
+    np, flat = _prepare(height, moves, (1 << height) - 1)
+    rods = np.empty((len(flat), height), dtype=np.uint8)
+    rows = max(chunk_size // height, 1)
+
+    for begin in range(0, len(flat), rows):
+        chunk = flat[begin:begin + rows]
+        for disk in range(1, height + 1):
+            rods[begin:begin + rows, disk - 1] = _rods(np, height, disk, chunk)
+    return rods
@@ -0,0 +1,252 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.blocks
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from collections import OrderedDict
+from functools import partial
+from itertools import chain, count
+
+from six.moves import map, range, zip
+
+from .moves import ROD_NAMES, CompactMove
+from .validation import validate_height
+
+__all__ = [
+    'BLOCK_HEIGHT',
+    'CACHE_SIZE',
+    'packed_block',
+    'iter_packed',
+    'iter_blocks',
+    'iter_compact',
+    'FORMATS',
+    'iter_batches',
+]
+
+# The largest tower whose packed solution is held as one block (2 ** 16 - 1 bytes).
+BLOCK_HEIGHT = 16
+
+# The maximum number of (height, rod labelling) blocks held by the cache.
+CACHE_SIZE = 64
+
+# The formats of a streamed solution, see :func:`iter_batches`.
+FORMATS = ('text', 'jsonl', 'packed')
+
+# The number of jsonl moves in a batch.
+_BATCH = 1 << 16
+
+_BLOCKS = OrderedDict()
+_TABLES = {}
+_RULERS = {}
+
+# Build a :class:`CompactMove` from a tuple without running any Python code.
+_make = partial(tuple.__new__, CompactMove)
+
+# The start and end rod of every packed move byte, see :func:`towers.core.moves.pack_moves`.
+_STARTS = bytes(bytearray(byte >> 2 for byte in range(256)))
+_ENDS = bytes(bytearray(byte & 3 for byte in range(256)))
+
+
+def _table(start, end, tmp):
+    """
+    Obtain the `bytes.translate` table which relabels the packed moves of the `start` -> `end`
+    (via `tmp`) solution, with rods 0 -> 1 (via 2), as the given rods.
+    """
+    key = (start, end, tmp)
+    table = _TABLES.get(key)
+    if table is None:
+        rods = (start, end, tmp, 3)
+        table = bytes(bytearray((rods[byte >> 2 & 3] << 2) | rods[byte & 3] for byte in range(256)))
+        _TABLES[key] = table
+    return table
+
+
+def packed_block(height, start=0, end=1, tmp=2):
+    """
+    Obtain the (cached) packed moves of the optimal solution of a small tower.
+
+    The solution of height `n` is the solution of height `n-1` with the `end` and `tmp` rods
+    swapped, the move of the largest disk, then the solution of height `n-1` with the `start` and
+    `tmp` rods swapped, so every block is spliced from the one below with `bytes.translate`.
+    The most recently used blocks are kept in a bounded LRU cache.
+
+    :param int height:
+        The height of the tower, at most `BLOCK_HEIGHT`.
+    :param int start:
+        The index of the rod the tower is moved from.
+    :param int end:
+        The index of the rod the tower is moved to.
+    :param int tmp:
+        The index of the intermediary rod.
+    :rtype:
+        bytes
+    """
+    key = (height, start, end, tmp)
+    block = _BLOCKS.pop(key, None)
+    if block is None:
+        if (start, end, tmp) != (0, 1, 2):
+            block = packed_block(height, 0, 1, 2).translate(_table(start, end, tmp))
+        elif height:
+            block = b''.join([
+                packed_block(height - 1, 0, 2, 1),
+                b'\x01',
+                packed_block(height - 1, 2, 1, 0),
+            ])
+        else:
+            block = b''
+    _BLOCKS[key] = block
+    while len(_BLOCKS) > CACHE_SIZE:
+        _BLOCKS.popitem(last=False)
+    return block
+
+
+def _ruler(height):
+    """
+    Obtain the width of the disk moved by every move of the solution of a small tower.
+    """
+    ruler = _RULERS.get(height)
+    if ruler is None:
+        ruler = _ruler(height - 1) + bytearray([height]) + _ruler(height - 1) if height else \
+            bytearray()
+        _RULERS[height] = ruler
+    return ruler
+
+
+def iter_blocks(height, start=0, end=1, tmp=2):
+    """
+    Generate the optimal solution as packed blocks.
+
+    :note:
+        Generator, yields (height, bytes) pairs: either the packed solution of a tower of the
+        given height (at most `BLOCK_HEIGHT`), or the single move of the disk with the given
+        width.
+    :param int height:
+        The height of the tower.
+    :param int start:
+        The index of the rod the tower is moved from.
+    :param int end:
+        The index of the rod the tower is moved to.
+    :param int tmp:
+        The index of the intermediary rod.
+    """
+    validate_height(height)
+    stack = [(height, start, end, tmp, False)] if height else []
+    pop = stack.pop
+    push = stack.append
+
+    while stack:
+        height, start, end, tmp, single = pop()
+        if single:
+            yield height, bytes(bytearray([(start << 2) | end]))
+        elif height <= BLOCK_HEIGHT:
+            yield height, packed_block(height, start, end, tmp)
+        else:
+            push((height - 1, tmp, end, start, False))
+            push((height, start, end, tmp, True))
+            push((height - 1, start, tmp, end, False))
+
+
+def iter_packed(height, start=0, end=1, tmp=2):
+    """
+    Generate the packed moves (see :func:`towers.core.moves.pack_moves`) of the optimal solution.
+
+    :note:
+        Generator, yields bytes of up to `2 ** BLOCK_HEIGHT` moves.
+    :param int height:
+        The height of the tower.
+    :param int start:
+        The index of the rod the tower is moved from.
+    :param int end:
+        The index of the rod the tower is moved to.
+    :param int tmp:
+        The index of the intermediary rod.
+    """
+    pending = []
+    size = 0
+    for _, block in iter_blocks(height, start, end, tmp):
+        pending.append(block)
+        size += len(block)
+        if size >= 1 << BLOCK_HEIGHT:
+            yield b''.join(pending)
+            pending = []
+            size = 0
+    if pending:
+        yield b''.join(pending)
+
+
+def _compact_segments(height):
+    make = _make
+    index = count()
+    for disk, block in iter_blocks(height):
+        if len(block) == 1:
+            byte = bytearray(block)[0]
+            yield (make((disk, byte >> 2, byte & 3, next(index))),)
+        else:
+            starts = bytearray(block.translate(_STARTS))
+            ends = bytearray(block.translate(_ENDS))
+            yield map(make, zip(_ruler(disk), starts, ends, index))
+
+
+def iter_compact(height):
+    """
+    Generate the moves of the optimal solution, spliced from the cached blocks.
+
+    :note:
+        Iterator of :class:`CompactMove` instances, every move of a block is built by C-level
+        iteration without running any Python code per move.
+    :param int height:
+        The height of the tower.
+    :rtype:
+        Iterator[CompactMove]
+    """
+    return chain.from_iterable(_compact_segments(height))
+
+
+def _text_batches(height):
+    # Every packed move byte maps directly onto its line.
+    lines = [b''] * 256
+    for start, start_name in enumerate(ROD_NAMES):
+        for end, end_name in enumerate(ROD_NAMES):
+            lines[(start << 2) | end] = '{start} {end}\n'.format(
+                start=start_name, end=end_name,
+            ).encode('ascii')
+    for batch in iter_packed(height):
+        yield b''.join(map(lines.__getitem__, bytearray(batch)))
+
+
+def _jsonl_batches(height):
+    line = '{{"moves": {moves}, "disk": {disk}, "start": "{start}", "end": "{end}"}}\n'
+    batch = []
+    for move in iter_compact(height):
+        batch.append(line.format(
+            moves=move.moves, disk=move.disk, start=ROD_NAMES[move.start], end=ROD_NAMES[move.end],
+        ))
+        if len(batch) >= _BATCH:
+            yield ''.join(batch).encode('ascii')
+            batch = []
+    if batch:
+        yield ''.join(batch).encode('ascii')
+
+
+def iter_batches(height, fmt='packed'):
+    """
+    Generate the optimal solution as batches of bytes, for streaming in constant memory.
+
+    :param int height:
+        The height of the tower.
+    :param str fmt:
+        `packed` (one byte per move, see :func:`towers.core.moves.pack_moves`), `text` (the
+        `start end` rod names of a move per line) or `jsonl` (a json object per move).
+    :rtype:
+        Iterator[bytes]
+    :raises ValueError:
+        The format is unknown.
+    """
+    validate_height(height)
+    if fmt not in FORMATS:
+        raise ValueError('Unknown format: {fmt}'.format(fmt=fmt))
+    if fmt == 'packed':
+        return iter_packed(height)
+    return _text_batches(height) if fmt == 'text' else _jsonl_batches(height)
@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.capacity
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import heapq
+from collections import OrderedDict
+
+from six.moves import range
+
+from .errors import Unsolvable
+from .moves import CompactMove
+from .search import SearchResult
+from .solution import iter_solution
+from .state import MOVES, _low_bits, end_state, height_of, start_state, tops
+from .validation import validate_height
+
+__all__ = [
+    'solve_capacities',
+    'lower_bound',
+]
+
+# The maximum number of solutions held by the cache.
+CACHE_SIZE = 64
+
+_SOLUTIONS = OrderedDict()
+
+
+def _capacities(height, capacities):
+    """
+    Validate the capacities, None = unlimited.
+    """
+    capacities = tuple(height if i is None else min(i, height) for i in capacities)
+    if len(capacities) != 3 or any(i < 0 for i in capacities):
+        raise ValueError('capacities must be 3 non-negative integers: {capacities}'.format(
+            capacities=capacities,
+        ))
+    return capacities
+
+
+def _rods(state, height):
+    """
+    Obtain the rod index of every disk of a compact state, indexed by width (index 0 unused).
+    """
+    return [None] + [((state >> (2 * width)) & 3) - 1 for width in range(height)]
+
+
+def lower_bound(state, height):
+    """
+    Determine the number of moves needed to move every disk of a compact state onto the `end`
+    rod without any capacity limits, a lower bound of the moves needed with them.
+
+    :param int state:
+        The compact state (see :mod:`towers.core.state`).
+    :param int height:
+        The height of the tower.
+    :rtype:
+        int
+    """
+    rods = _rods(state, height)
+    target = 1
+    moves = 0
+    for width in range(height, 0, -1):
+        if rods[width] != target:
+            # The smaller disks must first be gathered on the third rod.
+            moves += 1 << (width - 1)
+            target = 3 - rods[width] - target
+    return moves
+
+
+def _settle(rods, height, target):
+    """
+    Generate the (disk, start, end) moves of the shortest unconstrained solution which gathers
+    the disks up to `height` on the `target` rod, updating `rods`.
+    """
+    for width in range(height, 0, -1):
+        if rods[width] == target:
+            continue
+        start = rods[width]
+        other = 3 - start - target
+        for move in _settle(rods, width - 1, other):
+            yield move
+        rods[width] = target
+        yield width, start, target
+        for move in iter_solution(width - 1) if width > 1 else ():
+            # The smaller disks are a tower on `other`, relabel the moves of 0 -> 1 via 2.
+            labels = (other, target, start)
+            rods[move.disk] = labels[move.end]
+            yield move.disk, labels[move.start], labels[move.end]
+        return
+
+
+def _counts(state, height):
+    """
+    Count the disks on each rod of a compact state.
+    """
+    mask = _low_bits(height)
+    low = state & mask
+    high = (state >> 1) & mask
+    return [bin(low & ~high).count('1'), bin(high & ~low).count('1'), bin(low & high).count('1')]
+
+
+def _within(path, counts, capacities):
+    """
+    Determine whether every move of a path keeps within the capacities.
+    """
+    for _, start, end in path:
+        counts[start] -= 1
+        counts[end] += 1
+        if counts[end] > capacities[end]:
+            return False
+    return True
+
+
+def _successors(state, height, capacities):
+    """
+    Generate the (disk, start, end, state) of every legal move which keeps within the capacities.
+    """
+    top = tops(state)
+    counts = _counts(state, height)
+    for start, end in MOVES:
+        disk = top[start]
+        if disk and (not top[end] or disk < top[end]) and counts[end] < capacities[end]:
+            yield disk, start, end, state ^ (((start + 1) ^ (end + 1)) << (2 * (disk - 1)))
+
+
+def _search(height, capacities, source):
+    """
+    A* search for the fewest moves, with the unconstrained distance as the (consistent)
+    heuristic, over the states within the capacities.
+    """
+    target = end_state(height)
+    best = {source: 0}
+    parents = {source: None}
+    heap = [(lower_bound(source, height), 0, source)]
+    explored = 0
+
+    while heap:
+        _, moves, state = heapq.heappop(heap)
+        if moves > best[state]:
+            continue
+        explored += 1
+        if state == target:
+            path = []
+            while parents[state] is not None:
+                state, disk, start, end = parents[state]
+                path.append((disk, start, end))
+            return path[::-1], explored
+
+        moves += 1
+        for disk, start, end, after in _successors(state, height, capacities):
+            if moves < best.get(after, moves + 1):
+                best[after] = moves
+                parents[after] = (state, disk, start, end)
+                heapq.heappush(heap, (moves + lower_bound(after, height), moves, after))
+    return None, explored
+
+
+def _solve(height, capacities, state, path):
+    counts = _counts(state, height)
+    if capacities[1] < height or any(c > limit for c, limit in zip(counts, capacities)):
+        return SearchResult(None, None, 0)
+
+    if state == start_state(height):
+        # The largest disk can only leave the start rod with the others all on one rod, and
+        # either it moves straight to the end rod (so `tmp` holds the others), or it passes
+        # through `tmp` while the others move between `start` and `end`, which needs one less
+        # disk on `tmp` than the same problem one disk smaller. Either way `tmp` must hold
+        # `height - 1` disks, which is all the (optimal) classic solution ever needs.
+        if capacities[2] < height - 1:
+            return SearchResult(None, None, 0)
+        moves = list(iter_solution(height)) if path else None
+        return SearchResult((1 << height) - 1, moves, 0)
+
+    # The shortest unconstrained solution is optimal if it keeps within the capacities.
+    moves = list(_settle(_rods(state, height), height, 1))
+    explored = 0
+    if not _within(moves, counts, capacities):
+        moves, explored = _search(height, capacities, state)
+        if moves is None:
+            return SearchResult(None, None, explored)
+    distance = len(moves)
+    if path:
+        moves = [CompactMove(disk, a, b, i) for i, (disk, a, b) in enumerate(moves)]
+    return SearchResult(distance, moves if path else None, explored)
+
+
+def solve_capacities(height, capacities, state=None, path=True):
+    """
+    Find a shortest solution of a tower whose rods can each hold a limited number of disks.
+
+    From the start state the tower can be solved if (and only if) the `tmp` rod holds at least
+    `height - 1` disks, when the classic solution is the shortest, so no search is needed and
+    infeasibility is reported at once. From any other state the shortest unconstrained solution
+    is tried first, and only if it breaks a limit are the states searched: by A* over compact
+    states within the capacities, with the unconstrained distance as the admissible heuristic.
+    The results are cached.
+
+    :param int height:
+        The height of the tower.
+    :param tuple capacities:
+        The maximum number of disks each rod (in `ROD_NAMES` order) can hold, None = unlimited.
+    :param int state:
+        (optional) The compact state (see :mod:`towers.core.state`) to solve from.
+        Default = the start state.
+    :param bool path:
+        True=also return the moves.
+    :rtype:
+        SearchResult
+    :return:
+        The number of moves, the :class:`CompactMove`'s (None if not requested), and the number
+        of states the search explored (zero if no search was needed).
+    :raises Unsolvable:
+        The tower cannot be solved within the capacities.
+    """
+    validate_height(height)
+    capacities = _capacities(height, capacities)
+    state = start_state(height) if state is None else state
+    if height_of(state) != height:
+        raise ValueError('state is not of a tower of height: {height}'.format(height=height))
+
+    key = (height, capacities, state)
+    result = _SOLUTIONS.pop(key, None)
+    if result is None or (path and result.distance is not None and result.path is None):
+        result = _solve(height, capacities, state, path)
+    _SOLUTIONS[key] = result
+    while len(_SOLUTIONS) > CACHE_SIZE:
+        _SOLUTIONS.popitem(last=False)
+
+    if result.distance is None:
+        raise Unsolvable(height, {'capacities': capacities})
+    return result
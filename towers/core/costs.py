@@ -0,0 +1,262 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.costs
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from collections import OrderedDict
+
+from six.moves import range
+
+from .errors import Unsolvable
+from .moves import CompactMove
+from .validation import validate_height
+
+__all__ = [
+    'CostTable',
+    'move_table',
+]
+
+# The (start, end) rod indexes of every possible move.
+_PAIRS = tuple((start, end) for start in range(3) for end in range(3) if start != end)
+
+# The maximum number of move graph tables held by the cache.
+CACHE_SIZE = 64
+
+_TABLES = OrderedDict()
+
+# The (cost, moves) of an impossible move.
+_FORBIDDEN = (None, None)
+
+
+def _total(*parts):
+    """
+    Add up the (cost, moves) parts of a solution, which is impossible if any part is.
+    """
+    if any(cost is None for cost, _ in parts):
+        return _FORBIDDEN
+    return sum(cost for cost, _ in parts), sum(moves for _, moves in parts)
+
+
+class CostTable(object):
+    """
+    The minimum cost of moving a tower of every height between every pair of rods, when every
+    move has a cost depending on its rods (and optionally the width of its disk).
+
+    With non-negative costs the largest disk of an optimal solution moves either straight to the
+    end rod, or via the other rod (when that is cheaper), and the smaller disks are moved as
+    optimal towers in between. So the table is filled by dynamic programming in O(height) and
+    the solution is streamed from it in O(1) amortized per move.
+
+    A move with a cost of None is forbidden, a tower which can only be moved with forbidden moves
+    cannot be solved.
+    """
+
+    def __init__(self, costs, by_width=False):
+        """
+        :param List[List] costs:
+            The 3 x 3 matrix of the cost of a move from rod `start` (row) to rod `end` (column),
+            the rods in `ROD_NAMES` order, the diagonal is ignored. None = the move is
+            forbidden.
+        :param bool by_width:
+            True=the cost of a move is also multiplied by the width of its disk.
+        :raises ValueError:
+            The costs are not a 3 x 3 matrix of non-negative numbers.
+        """
+        rows = [list(row) for row in costs]
+        if len(rows) != 3 or any(len(row) != 3 for row in rows):
+            raise ValueError('costs must be a 3 x 3 matrix: {costs}'.format(costs=costs))
+        if any(rows[start][end] is not None and rows[start][end] < 0 for start, end in _PAIRS):
+            raise ValueError('costs must be non-negative: {costs}'.format(costs=costs))
+        self._costs = tuple(tuple(row) for row in rows)
+        self._by_width = bool(by_width)
+        # The (cost, moves, via) of every (start, end) pair, for every height.
+        self._table = [dict((pair, (0, 0, False)) for pair in _PAIRS)]
+
+    @property
+    def costs(self):
+        """
+        Obtain the cost matrix.
+
+        :rtype: tuple
+        """
+        return self._costs
+
+    @property
+    def by_width(self):
+        """
+        Are the costs multiplied by the width of the disk.
+
+        :rtype: bool
+        """
+        return self._by_width
+
+    def move_cost(self, disk, start, end):
+        """
+        Determine the cost of a single move.
+
+        :param int disk:
+            The width of the disk.
+        :param int start:
+            The index of the rod the disk is moved from.
+        :param int end:
+            The index of the rod the disk is moved to.
+        :rtype:
+            int|float
+        :return:
+            The cost, None if the move is forbidden.
+        """
+        cost = self._costs[start][end]
+        return cost * disk if self._by_width and cost is not None else cost
+
+    def _entry(self, height, start, end):
+        table = self._table
+        while len(table) <= height:
+            below = table[-1]
+            disk = len(table)
+            level = {}
+            moved = dict((pair, entry[:2]) for pair, entry in below.items())
+            for source, target in _PAIRS:
+                other = 3 - source - target
+                direct = _total(moved[source, other], (self.move_cost(disk, source, target), 1),
+                                moved[other, target])
+                via = _total(moved[source, target], (self.move_cost(disk, source, other), 1),
+                             moved[target, source], (self.move_cost(disk, other, target), 1),
+                             moved[source, target])
+                # Prefer the fewer moves when the costs tie.
+                if via[0] is not None and (direct[0] is None or via[0] < direct[0]):
+                    level[source, target] = via + (True,)
+                else:
+                    level[source, target] = direct + (False,)
+            table.append(level)
+        return table[height][start, end]
+
+    def _solvable(self, height, start, end):
+        entry = self._entry(height, start, end)
+        if entry[0] is None:
+            raise Unsolvable(height, {'costs': self._costs})
+        return entry
+
+    def cost(self, height, start=0, end=1):
+        """
+        Determine the minimum cost of moving a tower, without making the moves.
+
+        :param int height:
+            The height of the tower.
+        :param int start:
+            The index of the rod the tower is moved from.
+        :param int end:
+            The index of the rod the tower is moved to.
+        :rtype:
+            int|float
+        :raises Unsolvable:
+            The tower can only be moved with forbidden moves.
+        """
+        validate_height(height)
+        return self._solvable(height, start, end)[0]
+
+    def moves(self, height, start=0, end=1):
+        """
+        Determine the number of moves of the minimum cost solution.
+
+        :param int height:
+            The height of the tower.
+        :param int start:
+            The index of the rod the tower is moved from.
+        :param int end:
+            The index of the rod the tower is moved to.
+        :rtype:
+            int
+        :raises Unsolvable:
+            The tower can only be moved with forbidden moves.
+        """
+        validate_height(height)
+        return self._solvable(height, start, end)[1]
+
+    def schedule(self, height, start=0, end=1):
+        """
+        Generate the moves of the minimum cost solution, without making them.
+
+        :note:
+            Generator, yields (start, end) pairs of rod indexes in O(1) amortized per move.
+        :param int height:
+            The height of the tower.
+        :param int start:
+            The index of the rod the tower is moved from.
+        :param int end:
+            The index of the rod the tower is moved to.
+        :raises Unsolvable:
+            The tower can only be moved with forbidden moves.
+        """
+        self._solvable(height, start, end)
+        table = self._table
+        # Every item is (height, start, end, single), single=only move the disk of that width.
+        stack = [(height, start, end, False)] if height else []
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            height, start, end, single = pop()
+            if single:
+                yield start, end
+                continue
+
+            below = height - 1
+            other = 3 - start - end
+            if table[height][start, end][2]:
+                if below:
+                    push((below, start, end, False))
+                push((height, other, end, True))
+                if below:
+                    push((below, end, start, False))
+                push((height, start, other, True))
+                if below:
+                    push((below, start, end, False))
+            else:
+                if below:
+                    push((below, other, end, False))
+                push((height, start, end, True))
+                if below:
+                    push((below, start, other, False))
+
+    def iter_moves(self, height, start=0, end=1):
+        """
+        Generate the moves of the minimum cost solution of a tower on the `start` rod.
+
+        :note:
+            Generator, yields :class:`CompactMove` instances.
+        :param int height:
+            The height of the tower.
+        :param int start:
+            The index of the rod the tower is moved from.
+        :param int end:
+            The index of the rod the tower is moved to.
+        """
+        rods = [[], [], []]
+        rods[start] = list(range(height, 0, -1))
+        for index, (source, target) in enumerate(self.schedule(height, start, end)):
+            disk = rods[source].pop()
+            rods[target].append(disk)
+            yield CompactMove(disk, source, target, index)
+
+
+def move_table(allowed):
+    """
+    Obtain the (cached) :class:`CostTable` of the towers where only the given moves are allowed,
+    every allowed move costing 1, so its costs are the (exact) fewest moves.
+
+    :param Iterable[tuple] allowed:
+        The (start, end) pairs of the rod indexes of the allowed moves.
+    :rtype:
+        CostTable
+    """
+    key = frozenset(allowed)
+    table = _TABLES.pop(key, None)
+    if table is None:
+        table = CostTable([[1 if (start, end) in key else None for end in range(3)]
+                           for start in range(3)])
+    _TABLES[key] = table
+    while len(_TABLES) > CACHE_SIZE:
+        _TABLES.popitem(last=False)
+    return table
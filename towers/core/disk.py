@@ -11,6 +11,7 @@ from collections import namedtuple
 import six
 
 from .errors import InvalidDiskPosition
+from .render import disk_glyphs
 from .utils import Serializable
 from .validation import Validatable, validate_height
 
@@ -102,5 +103,4 @@ class Disk(namedtuple('Disk', ('original_position', 'height')), Validatable, Ser
             original_position=self.original_position)
 
     def __repr__(self):
-        return '{original_position}'.format(
-            original_position='*' * self.width)
+        return disk_glyphs(self.height)[self.width]
@@ -17,41 +17,56 @@ __all__ = [
     'InvalidRodHeight',
     'InvalidRods',
     'InvalidMoves',
+    'IllegalMove',
+    'Unsolvable',
 ]
 
 
 class TowersError(Exception):
     """
     Base class of all `towers` errors.
+
+    The arguments are kept as they are and the message is only formatted (from `message` and the
+    error's attributes) when it is shown, so raising and catching an error is cheap. The message
+    shows the attributes (ie: a :class:`Rod`) as they are at that time.
     """
-    pass
+
+    message = None
+
+    def __str__(self):
+        if self.message is None:
+            return super(TowersError, self).__str__()
+        return self.message.format(**vars(self))
 
 
 class InvalidRod(TypeError, TowersError):
+    message = 'invalid rod: {rod}'
+
     def __init__(self, rod):
         """
 
         :param object rod:
             The :class:`Rod` which is invalid.
         """
-        super(InvalidRod, self).__init__(
-            'invalid rod: {rod}'.format(rod=rod))
+        super(InvalidRod, self).__init__(rod)
         self.rod = rod
 
 
 class InvalidRods(TypeError, TowersError):
+    message = 'invalid rod: {rods}'
+
     def __init__(self, rods):
         """
         :param object rods:
             The :class:`Rods` which are invalid
         """
-        super(InvalidRods, self).__init__(
-            'invalid rod: {rods}'.format(
-                rods=rods))
+        super(InvalidRods, self).__init__(rods)
         self.rods = rods
 
 
 class InvalidRodHeight(ValueError, TowersError):
+    message = 'invalid rod height: {rod} expecting: {height}.'
+
     def __init__(self, rod, max_height):
         """
         :param Rod rod:
@@ -59,9 +74,7 @@ class InvalidRodHeight(ValueError, TowersError):
         :param int max_height:
             The max allowed height of the :class:`Rod`.
         """
-        super(InvalidRodHeight, self).__init__(
-            'invalid rod height: {rod} expecting: {height}.'.format(
-                rod=rod, height=max_height))
+        super(InvalidRodHeight, self).__init__(rod, max_height)
         self.rod = rod
         self.height = max_height
 
@@ -71,6 +84,8 @@ class DuplicateDisk(ValueError, TowersError):
     A duplicate disk was found on a tower.
     """
 
+    message = 'Duplicate disk width found: {disk_width} in: {rod}'
+
     def __init__(self, rod, disk_width):
         """
         :param Rod rod:
@@ -78,9 +93,7 @@ class DuplicateDisk(ValueError, TowersError):
         :param int disk_width:
             The width of the :class:`Disk`.
         """
-        super(DuplicateDisk, self).__init__(
-            'Duplicate disk width found: {disk_width} in: {rod}'.format(
-                disk_width=disk_width, rod=rod))
+        super(DuplicateDisk, self).__init__(rod, disk_width)
         self.rod = rod
         self.disk_width = disk_width
 
@@ -90,6 +103,8 @@ class CorruptRod(ValueError, TowersError):
     A :class:`Rod` with an invalid stack of disks was found.
     """
 
+    message = 'Corrupt rod, at least one disk is larger than the one below it: {rod}'
+
     def __init__(self, rod, disk):
         """
         :param Rod rod:
@@ -97,9 +112,7 @@ class CorruptRod(ValueError, TowersError):
         :param int disk:
             A :class:`Disk` which sits directly atop a smaller :class:`Disk`.
         """
-        super(CorruptRod, self).__init__(
-            'Corrupt rod, at least one disk is larger than the one below it: {rod}'.format(
-                rod=rod))
+        super(CorruptRod, self).__init__(rod, disk)
         self.rod = rod
         self.disk = disk
 
@@ -109,6 +122,8 @@ class InvalidStartingConditions(ValueError, TowersError):
     The :class:`Rods` for the towers are not in the correct starting state.
     """
 
+    message = 'Invalid starting condition for rods: {rods}, with existing moves: {moves}'
+
     def __init__(self, rods, moves):
         """
         :param Rod rods:
@@ -116,9 +131,7 @@ class InvalidStartingConditions(ValueError, TowersError):
         :param int moves:
             Total number of moves already made (should be zero).
         """
-        super(InvalidStartingConditions, self).__init__(
-            'Invalid starting condition for rods: {rods}, with existing moves: {moves}'.format(
-                rods=rods, moves=moves))
+        super(InvalidStartingConditions, self).__init__(rods, moves)
         self.rods = rods
         self.moves = moves
 
@@ -128,14 +141,14 @@ class InvalidEndingConditions(ValueError, TowersError):
     The :class:`Rod`'s for the towers are not in the correct ending state.
     """
 
+    message = 'Invalid ending condition for rods: {rods}'
+
     def __init__(self, rods):
         """
         :param Rod rods:
             The :class:`Rod`'s.
         """
-        super(InvalidEndingConditions, self).__init__(
-            'Invalid ending condition for rods: {rods}'.format(
-                rods=rods))
+        super(InvalidEndingConditions, self).__init__(rods)
         self.rods = rods
 
 
@@ -144,14 +157,14 @@ class InvalidTowerHeight(ValueError, TowersError):
     The height of the :class:`Tower` is invalid.
     """
 
+    message = 'Invalid tower height: {height}'
+
     def __init__(self, height):
         """
         :param int height:
             The invalid height.
         """
-        super(InvalidTowerHeight, self).__init__(
-            'Invalid tower height: {height}'.format(
-                height=height))
+        super(InvalidTowerHeight, self).__init__(height)
         self.height = height
 
 
@@ -160,6 +173,8 @@ class InvalidDiskPosition(ValueError, TowersError):
     The position of the :class:`Disk` is invalid.
     """
 
+    message = 'Invalid disk position: {position} on Rod of height: {height}'
+
     def __init__(self, position, height):
         """
         :param int position:
@@ -167,9 +182,7 @@ class InvalidDiskPosition(ValueError, TowersError):
         :param int height:
             The height.
         """
-        super(InvalidDiskPosition, self).__init__(
-            'Invalid disk position: {position} on Rod of height: {height}'.format(
-                position=position, height=height))
+        super(InvalidDiskPosition, self).__init__(position, height)
         self.position = position
         self.height = height
 
@@ -179,12 +192,50 @@ class InvalidMoves(ValueError, TowersError):
     An invalid number of moves.
     """
 
+    message = 'Invalid moves: {moves}'
+
     def __init__(self, moves):
         """
         :param int moves:
             The invalid `moves`.
         """
-        super(InvalidMoves, self).__init__(
-            'Invalid moves: {moves}'.format(
-                moves=moves))
+        super(InvalidMoves, self).__init__(moves)
         self.moves = moves
+
+
+class IllegalMove(ValueError, TowersError):
+    """
+    A move which breaks the rules of the towers.
+    """
+
+    message = 'Illegal move: {move} from state: {state:#x}'
+
+    def __init__(self, move, state):
+        """
+        :param tuple move:
+            The (start, end) rod indexes of the move.
+        :param int state:
+            The compact state the move was applied to (see :mod:`towers.core.state`).
+        """
+        super(IllegalMove, self).__init__(move, state)
+        self.move = move
+        self.state = state
+
+
+class Unsolvable(ValueError, TowersError):
+    """
+    Towers which cannot be solved under their constraints.
+    """
+
+    message = 'No solution for a tower of height: {height} with: {constraints}'
+
+    def __init__(self, height, constraints):
+        """
+        :param int height:
+            The height of the tower.
+        :param dict constraints:
+            The constraints which cannot be met (ie: the capacities of the rods).
+        """
+        super(Unsolvable, self).__init__(height, constraints)
+        self.height = height
+        self.constraints = constraints
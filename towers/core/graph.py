@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.graph
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import os
+
+from six.moves import range
+
+from .errors import InvalidTowerHeight
+from .utils import import_numpy
+from .validation import validate_height
+
+__all__ = [
+    'count_edges',
+    'state_graph',
+    'export_graph',
+]
+
+# The largest tower whose edge offsets fit in an int64.
+MAX_HEIGHT = 38
+
+# The default number of states whose edges are computed at once.
+CHUNK_SIZE = 1 << 20
+
+# The file names of the exported arrays.
+INDPTR = 'indptr.npy'
+INDICES = 'indices.npy'
+
+# The padding of the states with only 2 neighbours, sorts after every state id.
+_NONE = (1 << 63) - 1
+
+
+def _prepare(height, dtype):
+    """
+    Validate the height, returning numpy and the dtype of the arrays.
+    """
+    validate_height(height)
+    if height > MAX_HEIGHT:
+        raise InvalidTowerHeight(height)
+    np = import_numpy()
+    if np is None:  # pragma: no cover
+        raise ImportError('the state graph requires numpy')
+    if dtype is None:
+        dtype = np.int32 if count_edges(height) <= np.iinfo(np.int32).max else np.int64
+    return np, dtype
+
+
+def count_edges(height):
+    """
+    Determine the number of (directed) edges of the state graph, every state has 3 neighbours
+    except the 3 states with all the disks on one rod, which have 2.
+
+    :param int height:
+        The height of the tower.
+    :rtype:
+        int
+    """
+    validate_height(height)
+    return 3 ** (height + 1) - 3
+
+
+def _neighbours(np, height, ids):
+    """
+    Calculate the sorted neighbours of the int64 state ids, as a (len(ids), 3) array padded with
+    `_NONE` where a state has only 2 neighbours.
+
+    The smallest disk can always move to either other rod. The only other legal move is between
+    the two other rods, of the smallest disk on either of them.
+    """
+    smallest = ids % 3
+    base = ids - smallest
+    other = np.full(len(ids), _NONE, dtype=np.int64)
+    rest = ids // 3
+    power = 1
+    for _ in range(1, height):
+        power *= 3
+        rods = rest % 3
+        rest //= 3
+        moves = (other == _NONE) & (rods != smallest)
+        target = 3 - smallest[moves] - rods[moves]
+        other[moves] = ids[moves] + (target - rods[moves]) * power
+
+    neighbours = np.stack([base + (smallest + 1) % 3, base + (smallest + 2) % 3, other], axis=1)
+    neighbours.sort(axis=1)
+    return neighbours
+
+
+def _chunks(np, height, chunk_size):
+    """
+    Generate the (first state id, degrees, flattened neighbours) of every chunk of states.
+    """
+    total = 3 ** height
+    for begin in range(0, total, chunk_size):
+        ids = np.arange(begin, min(begin + chunk_size, total), dtype=np.int64)
+        neighbours = _neighbours(np, height, ids)
+        present = neighbours != _NONE
+        yield begin, present.sum(axis=1), neighbours[present]
+
+
+def _fill(np, height, chunk_size, indptr, indices):
+    indptr[0] = 0
+    offset = 0
+    for begin, degrees, neighbours in _chunks(np, height, chunk_size):
+        ends = offset + np.cumsum(degrees)
+        indptr[begin + 1:begin + 1 + len(degrees)] = ends
+        indices[offset:offset + len(neighbours)] = neighbours
+        offset += len(neighbours)
+
+
+def state_graph(height, chunk_size=CHUNK_SIZE, dtype=None):
+    """
+    Build the state graph of a tower in memory, in CSR format.
+
+    The node ids are the base-3 indexes of the states (see :func:`towers.core.state.rank`), and
+    the neighbours of node `i` are `indices[indptr[i]:indptr[i + 1]]`, in ascending order.
+
+    :param int height:
+        The height of the tower.
+    :param int chunk_size:
+        The number of states whose edges are computed at once, bounds the temporary memory.
+    :param numpy.dtype dtype:
+        (optional) The integer dtype of the arrays. Default = int32 if it fits, else int64.
+    :rtype:
+        tuple
+    :return:
+        The (indptr, indices) arrays.
+    :raises ImportError:
+        numpy is not installed.
+    """
+    np, dtype = _prepare(height, dtype)
+    indptr = np.empty(3 ** height + 1, dtype=dtype)
+    indices = np.empty(count_edges(height), dtype=dtype)
+    _fill(np, height, chunk_size, indptr, indices)
+    return indptr, indices
+
+
+def export_graph(height, directory, chunk_size=CHUNK_SIZE, dtype=None):
+    """
+    Write the state graph of a tower (see :func:`state_graph`) to `.npy` files, a chunk at a
+    time, so the graph never has to fit in memory. Load the arrays with
+    `numpy.load(path, mmap_mode='r')`.
+
+    :param int height:
+        The height of the tower.
+    :param str directory:
+        The (existing) directory to write `indptr.npy` and `indices.npy` to.
+    :param int chunk_size:
+        The number of states whose edges are computed at once, bounds the memory.
+    :param numpy.dtype dtype:
+        (optional) The integer dtype of the arrays. Default = int32 if it fits, else int64.
+    :rtype:
+        tuple
+    :return:
+        The (indptr, indices) file paths.
+    :raises ImportError:
+        numpy is not installed.
+    """
+    np, dtype = _prepare(height, dtype)
+    from numpy.lib.format import open_memmap
+
+    paths = (os.path.join(directory, INDPTR), os.path.join(directory, INDICES))
+    indptr = open_memmap(paths[0], mode='w+', dtype=dtype, shape=(3 ** height + 1,))
+    indices = open_memmap(paths[1], mode='w+', dtype=dtype, shape=(count_edges(height),))
+    _fill(np, height, chunk_size, indptr, indices)
+    indptr.flush()
+    indices.flush()
+    del indptr, indices
+    return paths
@@ -9,8 +9,16 @@ from collections import namedtuple
 
 __all__ = [
     'Move',
+    'CompactMove',
+    'ROD_NAMES',
+    'pack_moves',
+    'unpack_moves',
 ]
 
+# The names of the :class:`Rod`'s in the order they are held by :class:`Rods`, the index of a
+# name is the `start`/`end` value of a :class:`CompactMove`.
+ROD_NAMES = ('start', 'end', 'tmp')
+
 
 class Move(namedtuple('Move', ('disk', 'start', 'end', 'moves'))):
     """
@@ -26,3 +34,46 @@ class Move(namedtuple('Move', ('disk', 'start', 'end', 'moves'))):
 
     def __new__(cls, disk, start, end, moves):
         return super(Move, cls).__new__(cls, disk, start, end, moves)
+
+
+class CompactMove(namedtuple('CompactMove', ('disk', 'start', 'end', 'moves'))):
+    """
+    A lightweight :class:`Move` which carries no :class:`Rod` snapshots.
+
+    :param int disk:
+        The width of the disk that will be moved (1 = the smallest disk).
+    :param int start:
+        The index of the :class:`Rod` the disk is moved from (see `ROD_NAMES`).
+    :param int end:
+        The index of the :class:`Rod` the disk is moved to (see `ROD_NAMES`).
+    :param int moves:
+        The number of moves prior to the move.
+    """
+
+    def __new__(cls, disk, start, end, moves):
+        return super(CompactMove, cls).__new__(cls, disk, start, end, moves)
+
+
+def pack_moves(moves):
+    """
+    Pack (start, end) rod index pairs into bytes, one byte per move: `start << 2 | end`.
+
+    :param Iterable[tuple] moves:
+        The (start, end) rod indexes of each move.
+    :rtype:
+        bytearray
+    """
+    return bytearray((start << 2) | end for start, end in moves)
+
+
+def unpack_moves(data):
+    """
+    Unpack the bytes of :func:`pack_moves` into (start, end) rod index pairs.
+
+    :note:
+        Generator, yields (start, end) tuples.
+    :param bytes data:
+        The packed moves.
+    """
+    for byte in bytearray(data):
+        yield byte >> 2, byte & 3
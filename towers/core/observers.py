@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.observers
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from itertools import islice
+
+from .moves import ROD_NAMES, CompactMove
+
+__all__ = [
+    'Subscription',
+    'publish',
+    'pack_batch',
+]
+
+
+def pack_batch(moves):
+    """
+    Pack a batch of :class:`Move`'s or :class:`CompactMove`'s, one byte per move (see
+    :func:`towers.core.moves.pack_moves`).
+
+    :param List moves:
+        The moves.
+    :rtype:
+        bytearray
+    """
+    if moves and not isinstance(moves[0], CompactMove):
+        rods = ROD_NAMES.index
+        return bytearray((rods(i.start.name) << 2) | rods(i.end.name) for i in moves)
+    return bytearray((i.start << 2) | i.end for i in moves)
+
+
+class Subscription(object):
+    """
+    An observer of the moves of a :class:`Towers`, which receives them in batches.
+    """
+
+    def __init__(self, callback, batch_size=1024, packed=False):
+        """
+        :param callable callback:
+            Called with every batch of moves.
+        :param int batch_size:
+            The number of moves per batch, the last batch of an iteration may be smaller.
+        :param bool packed:
+            True=deliver every batch as packed bytes (see :func:`pack_batch`), False=as a list
+            of the moves.
+        """
+        if batch_size < 1:
+            raise ValueError('batch_size must be >= 1: {size}'.format(size=batch_size))
+        self.callback = callback
+        self.batch_size = batch_size
+        self.packed = packed
+
+    def deliver(self, moves):
+        """
+        Deliver a batch of moves to the callback.
+
+        :param List moves:
+            The moves.
+        """
+        self.callback(pack_batch(moves) if self.packed else moves)
+
+    def drain(self, buffer, begin, final):
+        """
+        Deliver the full batches of the moves in a buffer from an offset (and any remaining moves
+        when `final`).
+
+        :return:
+            The offset of the first move not delivered.
+        """
+        size = self.batch_size
+        while len(buffer) - begin >= size:
+            self.deliver(buffer[begin:begin + size])
+            begin += size
+        if final and len(buffer) > begin:
+            self.deliver(buffer[begin:])
+            begin = len(buffer)
+        return begin
+
+
+def publish(subscriptions, moves):
+    """
+    Pass the moves through, delivering them to the subscriptions in batches.
+
+    Every subscription receives its batches once enough moves have been made, and whatever
+    remains when the moves end, fail or the iteration is abandoned.
+
+    :note:
+        Generator, yields the `moves`.
+    :param List[Subscription] subscriptions:
+        The subscriptions.
+    :param Iterator moves:
+        The moves.
+    """
+    stride = min(i.batch_size for i in subscriptions)
+    pending = dict((id(i), 0) for i in subscriptions)
+    buffer = []
+    record = buffer.append
+
+    def flush(final):
+        for subscription in subscriptions:
+            key = id(subscription)
+            pending[key] = subscription.drain(buffer, pending[key], final)
+
+        # Forget the moves which every subscription has received.
+        done = min(pending.values())
+        if done:
+            del buffer[:done]
+            for key in pending:
+                pending[key] -= done
+
+    try:
+        while True:
+            size = len(buffer)
+            for move in islice(moves, stride):
+                record(move)
+                yield move
+            if len(buffer) - size < stride:
+                break
+            flush(False)
+    finally:
+        flush(True)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.operations
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import contextlib
+import functools
+from collections import Counter
+
+from .disk import Disk
+from .moves import CompactMove, Move
+from .rod import PersistentRod, Rod
+from .rods import Rods
+from .towers import Towers
+
+__all__ = [
+    'COUNTED',
+    'count_operations',
+]
+
+# The classes and methods whose calls are counted, the construction of an instance is counted
+# as a call of `__new__`.
+COUNTED = (
+    (Disk, ('__new__', 'validate')),
+    (Rod, ('__new__', '__copy__', '__deepcopy__', 'validate')),
+    (PersistentRod, ('__new__', '__copy__', '__deepcopy__')),
+    (Rods, ('__new__', '__copy__', '__deepcopy__', 'validate')),
+    (Towers, ('__copy__', '__deepcopy__', 'validate')),
+    (Move, ('__new__',)),
+    (CompactMove, ('__new__',)),
+)
+
+
+def _counted(counts, key, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        counts[key] += 1
+        return function(*args, **kwargs)
+
+    return wrapper
+
+
+@contextlib.contextmanager
+def count_operations():
+    """
+    Count the copies, validations and constructions of the :class:`Disk`, :class:`Rod`,
+    :class:`Rods`, :class:`Towers` and moves made inside the context.
+
+    The counts are exact whatever the speed of the machine, so tests can assert budgets on them
+    (ie: no :class:`Rod` copies per move when iterating compact moves) and catch a change that
+    makes every move O(height) deterministically.
+
+    :note:
+        For tests only, the methods are patched on the classes so every thread is counted. A
+        call made through `super()` counts once per class (ie: constructing a
+        :class:`PersistentRod` counts `PersistentRod.__new__` and `Rod.__new__`).
+    :rtype:
+        collections.Counter
+    :return:
+        The number of calls of every method in `COUNTED`, keyed by `Class.method`.
+    """
+    counts = Counter()
+    patched = []
+    try:
+        for cls, names in COUNTED:
+            for name in names:
+                original = cls.__dict__[name]
+                key = '{cls}.{name}'.format(cls=cls.__name__, name=name)
+                if isinstance(original, staticmethod):
+                    counted = staticmethod(_counted(counts, key, original.__get__(None, cls)))
+                else:
+                    counted = _counted(counts, key, original)
+                patched.append((cls, name, original))
+                setattr(cls, name, counted)
+        yield counts
+    finally:
+        for cls, name, original in reversed(patched):
+            setattr(cls, name, original)
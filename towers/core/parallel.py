@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.parallel
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import json
+import multiprocessing
+import os
+
+from six.moves import range
+
+from .solution import state_at
+from .validation import validate_height
+from .verify import Verification, verify
+
+__all__ = [
+    'verify_file',
+    'detect_format',
+    'parse_text',
+    'parse_jsonl',
+]
+
+FORMATS = ('packed', 'text', 'jsonl')
+
+
+def parse_text(data):
+    """
+    Parse a text move log: one move per line, the start and end rods separated by whitespace,
+    as indexes (`0`, `1`, `2`) or names (`start`, `end`, `tmp`). Blank lines are ignored.
+
+    :note:
+        Generator, yields (start, end) tuples.
+    :param bytes data:
+        The text of the log.
+    """
+    for line in data.splitlines():
+        parts = line.split()
+        if parts:
+            yield tuple(int(i) if i.isdigit() else i.decode('ascii', 'replace') for i in parts)
+
+
+def parse_jsonl(data):
+    """
+    Parse a jsonl move log (as written by `towers solve --format jsonl`): one json object per
+    line with the `start` and `end` rods, as indexes or names. Blank lines are ignored, and a
+    line which is not such an object is an unknown move.
+
+    :note:
+        Generator, yields (start, end) tuples.
+    :param bytes data:
+        The text of the log.
+    """
+    for line in data.splitlines():
+        if not line.strip():
+            continue
+        try:
+            move = json.loads(line.decode('utf-8'))
+            yield move['start'], move['end']
+        except (ValueError, KeyError, TypeError):
+            yield None, None
+
+
+def _parse(data, fmt):
+    """
+    Parse the moves of a chunk of a log.
+    """
+    if fmt == 'packed':
+        return data
+    return parse_text(data) if fmt == 'text' else parse_jsonl(data)
+
+
+def detect_format(path):
+    """
+    Detect the format of a move log from its first byte: a packed move byte is never a
+    printable character, and a jsonl line starts with `{`.
+
+    :param str path:
+        The path of the log file.
+    :rtype:
+        str
+    :return:
+        `packed`, `text` or `jsonl`.
+    """
+    with open(path, 'rb') as f:
+        first = f.read(1)
+    if not first or ord(first) < 0x10:
+        return 'packed'
+    return 'jsonl' if first == b'{' else 'text'
+
+
+def _read(path, begin, end):
+    with open(path, 'rb') as f:
+        f.seek(begin)
+        return f.read(end - begin)
+
+
+def _count(args):
+    """
+    Count the moves in a chunk of a text log.
+    """
+    path, fmt, begin, end = args
+    return sum(1 for _ in _parse(_read(path, begin, end), fmt))
+
+
+def _verify_chunk(args):
+    """
+    Verify a chunk of a log, starting from the state the optimal solution would be in.
+
+    :return:
+        (the seeded compact state, :class:`Verification`).
+    """
+    path, fmt, height, begin, end, offset = args
+    moves = _parse(_read(path, begin, end), fmt)
+    state = state_at(height, min(offset, (1 << height) - 1))
+    return state, verify(height, moves, state=state, offset=offset)
+
+
+def _boundaries(path, fmt, size, chunk_size):
+    """
+    Split a log into chunks of about `chunk_size` bytes, text chunks end on a line boundary.
+    """
+    if fmt == 'packed':
+        return [(i, min(i + chunk_size, size)) for i in range(0, size, chunk_size)]
+
+    chunks = []
+    begin = 0
+    with open(path, 'rb') as f:
+        while begin < size:
+            f.seek(min(begin + chunk_size, size))
+            f.readline()
+            end = min(f.tell(), size)
+            chunks.append((begin, end))
+            begin = end
+    return chunks
+
+
+def _map(function, args, pool):
+    return pool.imap(function, args) if pool is not None else (function(i) for i in args)
+
+
+def verify_file(path, height, fmt='packed', workers=None, chunk_size=1 << 24):
+    """
+    Verify a (very long) move log across several processes.
+
+    The log is cut into chunks, each of which is verified independently starting from the state
+    the optimal solution is in at the chunk's first move. The results are then merged in order:
+    a chunk whose seeded state does not match the state the previous chunk actually ended in
+    (ie: the log deviated from the optimal solution but was still legal) is verified again from
+    that state.
+
+    :param str path:
+        The path of the log file.
+    :param int height:
+        The height of the tower.
+    :param str fmt:
+        `packed` (one byte per move, see :func:`towers.core.moves.pack_moves`), `text` (see
+        :func:`parse_text`), `jsonl` (see :func:`parse_jsonl`) or None to detect it (see
+        :func:`detect_format`).
+    :param int workers:
+        (optional) The number of worker processes, 1 = verify in this process.
+        Default = the number of cores.
+    :param int chunk_size:
+        The approximate number of bytes of the log per chunk.
+    :rtype:
+        Verification
+    :raises InvalidTowerHeight:
+        The height of the tower is invalid.
+    """
+    validate_height(height)
+    fmt = detect_format(path) if fmt is None else fmt
+    if fmt not in FORMATS:
+        raise ValueError('Unknown format: {fmt}'.format(fmt=fmt))
+
+    size = os.path.getsize(path)
+    chunks = _boundaries(path, fmt, size, chunk_size)
+    workers = min(workers or multiprocessing.cpu_count(), len(chunks))
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+
+    try:
+        if fmt == 'packed':
+            counts = [end - begin for begin, end in chunks]
+        else:
+            counts = list(_map(_count, [(path, fmt, b, e) for b, e in chunks], pool))
+        offsets = []
+        offset = 0
+        for count in counts:
+            offsets.append(offset)
+            offset += count
+
+        results = _map(_verify_chunk, [
+            (path, fmt, height, begin, end, offset)
+            for (begin, end), offset in zip(chunks, offsets)
+        ], pool)
+        return _merge(path, fmt, height, chunks, offsets, results)
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+
+def _merge(path, fmt, height, chunks, offsets, results):
+    """
+    Merge the chunk results in order, re-verifying any chunk whose seeded state was wrong.
+    """
+    result = Verification(height, 0, None, None, state_at(height, 0))
+    for (begin, end), offset, (seed, chunk) in zip(chunks, offsets, results):
+        if seed != result.state:
+            moves = _parse(_read(path, begin, end), fmt)
+            chunk = verify(height, moves, state=result.state, offset=offset)
+        result = chunk
+        if not result.valid:
+            break
+    return result
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.progress
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import time
+from collections import namedtuple
+from itertools import chain, islice
+
+__all__ = [
+    'Progress',
+    'ProgressMonitor',
+]
+
+# The bounds of the number of moves between two checks of the clock.
+_MIN_STRIDE = 1 << 8
+_MAX_STRIDE = 1 << 20
+
+# The number of times the clock is checked per `interval`.
+_CHECKS = 16
+
+
+class Progress(namedtuple('Progress', ('moves', 'total', 'rate', 'eta'))):
+    """
+    :param int moves:
+        The number of moves made so far.
+    :param int total:
+        The number of moves required to solve the towers.
+    :param float rate:
+        The number of moves made per second since the iteration started.
+    :param float eta:
+        The estimated number of seconds until the towers are solved, None if unknown.
+    """
+
+    def __new__(cls, moves, total, rate, eta):
+        return super(Progress, cls).__new__(cls, moves, total, rate, eta)
+
+
+class ProgressMonitor(object):
+    """
+    Report the progress of an iteration over the moves of a :class:`Towers`.
+
+    The moves are passed through in strides and only checked between strides, so the clock is
+    read a few times per `interval` whatever the rate of moves.
+    """
+
+    def __init__(self, callback, every=None, interval=None, clock=None):
+        """
+        :param callable callback:
+            Called with a :class:`Progress` at every report, and once when the iteration ends.
+        :param int every:
+            (optional) Report every N moves.
+        :param float interval:
+            (optional) Report every T seconds.
+        :param callable clock:
+            (optional) The clock. Default = `time.time`.
+        """
+        if not every and not interval:
+            raise ValueError('every or interval is required')
+        if every is not None and every < 1:
+            raise ValueError('every must be >= 1: {every}'.format(every=every))
+        self._callback = callback
+        self._every = every
+        self._interval = interval
+        self._clock = clock or time.time
+
+    def _stride(self, moves, rate):
+        """
+        Determine the number of moves to pass through before the next check.
+        """
+        stride = _MAX_STRIDE
+        if self._interval:
+            stride = int(rate * self._interval / _CHECKS) if rate else _MIN_STRIDE
+            stride = min(max(stride, _MIN_STRIDE), _MAX_STRIDE)
+        if self._every:
+            stride = min(stride, self._every - moves % self._every)
+        return stride
+
+    def _report(self, tower, rate):
+        moves = tower.moves
+        total = tower.total_moves
+        eta = max(total - moves, 0) / rate if rate else None
+        self._callback(Progress(moves, total, rate, eta))
+
+    def _due(self, moves, elapsed):
+        """
+        Determine whether a report is due.
+        """
+        if self._every and not moves % self._every:
+            return True
+        return bool(self._interval) and elapsed >= self._interval
+
+    def _strides(self, tower, moves):
+        """
+        Generate the strides of the moves, checking the progress between them.
+        """
+        clock = self._clock
+        first = tower.moves
+        begin = last = clock()
+        rate = 0.0
+
+        while True:
+            done = tower.moves
+            stride = self._stride(done, rate)
+            yield islice(moves, stride)
+
+            now = clock()
+            if now > begin:
+                rate = (tower.moves - first) / float(now - begin)
+            if tower.moves - done < stride:
+                break
+            if self._due(tower.moves, now - last):
+                last = now
+                self._report(tower, rate)
+
+        self._report(tower, rate)
+
+    def __call__(self, tower, moves):
+        """
+        Pass the moves through, reporting the progress of the tower.
+
+        :param Towers tower:
+            The tower being iterated.
+        :param Iterator moves:
+            The moves of the tower.
+        :rtype:
+            Iterator
+        """
+        return chain.from_iterable(self._strides(tower, moves))
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.render
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import sys
+import time
+
+from .moves import ROD_NAMES, CompactMove
+
+__all__ = [
+    'Renderer',
+    'disk_glyphs',
+    'format_move',
+]
+
+_GLYPHS = {}
+
+
+def disk_glyphs(height, pad=False):
+    """
+    Obtain the (cached) glyphs for every :class:`Disk` width of a tower of the given height.
+
+    :param int height:
+        The height of the tower.
+    :param bool pad:
+        True=pad every glyph to `height` characters so that rendered moves line up.
+    :rtype:
+        tuple
+    :return:
+        The glyph of the disk with width `w` is at index `w`.
+    """
+    key = (height, pad)
+    glyphs = _GLYPHS.get(key)
+    if glyphs is None:
+        glyphs = tuple(('*' * width).ljust(height if pad else 0) for width in range(height + 1))
+        _GLYPHS[key] = glyphs
+    return glyphs
+
+
+def format_move(move, height, fmt='compact'):
+    """
+    Format a single move as a line of text (without the line terminator).
+
+    :param Move|CompactMove move:
+        The move to format.
+    :param int height:
+        The height of the :class:`Towers` the move belongs to.
+    :param str fmt:
+        `compact` = one short line per move, `full` = the `str` of the move as given: the
+        rod snapshots of a :class:`Move`, but only the rod indexes of a :class:`CompactMove`
+        (ie: the moves rendered by a verbose :func:`Towers.__call__`).
+    :rtype:
+        str
+    """
+    if fmt == 'full':
+        return str(move)
+    if isinstance(move, CompactMove):
+        width = move.disk
+        start = ROD_NAMES[move.start]
+        end = ROD_NAMES[move.end]
+    else:
+        width = move.disk.width
+        start = move.start.name
+        end = move.end.name
+    return '{moves} {glyph} {start}->{end}'.format(
+        moves=move.moves,
+        glyph=disk_glyphs(height, pad=True)[width],
+        start=start,
+        end=end,
+    )
+
+
+class Renderer(object):
+    """
+    A buffered, rate limited writer of moves to a text stream.
+    """
+
+    def __init__(
+        self, stream=None, fmt='compact', every=1, rate=None, buffer_size=65536, clock=None
+    ):
+        """
+        :param stream:
+            (optional) The file-like object to write to. Default = `sys.stdout`.
+        :param str fmt:
+            The move format, see :func:`format_move`.
+        :param int every:
+            Only render every Nth move.
+        :param float rate:
+            (optional) The maximum number of lines to render per second, excess moves are
+            dropped.
+        :param int buffer_size:
+            The number of characters to buffer before writing to the `stream`.
+        :param callable clock:
+            (optional) The clock used for rate limiting. Default = `time.time`.
+        """
+        if every < 1:
+            raise ValueError('every must be >= 1: {every}'.format(every=every))
+        self._stream = stream
+        self._fmt = fmt
+        self._every = every
+        self._interval = (1.0 / rate) if rate else None
+        self._buffer_size = buffer_size
+        self._clock = clock or time.time
+        self._buffer = []
+        self._buffered = 0
+        self._seen = 0
+        self._next = None
+        self.rendered = 0
+        self.dropped = 0
+
+    @property
+    def stream(self):
+        """
+        Obtain the stream being written to.
+        """
+        return self._stream if self._stream is not None else sys.stdout
+
+    def render(self, move, height):
+        """
+        Render the move, subject to sampling and rate limiting.
+
+        :param Move|CompactMove move:
+            The move to render.
+        :param int height:
+            The height of the :class:`Towers` the move belongs to.
+        """
+        seen = self._seen
+        self._seen = seen + 1
+        if seen % self._every:
+            self.dropped += 1
+            return
+
+        if self._interval is not None:
+            now = self._clock()
+            if self._next is not None and now < self._next:
+                self.dropped += 1
+                return
+            self._next = now + self._interval
+
+        line = format_move(move, height, self._fmt)
+        self._buffer.append(line)
+        self._buffered += len(line) + 1
+        self.rendered += 1
+        if self._buffered >= self._buffer_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write any buffered lines to the stream.
+        """
+        if self._buffer:
+            self._buffer.append('')
+            self.stream.write('\n'.join(self._buffer))
+            self._buffer = []
+            self._buffered = 0
+        flush = getattr(self.stream, 'flush', None)
+        if flush is not None:
+            flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.flush()
@@ -12,10 +12,12 @@ import six
 
 from .disk import Disk
 from .errors import CorruptRod, DuplicateDisk
+from .stack import DiskStack
 from .utils import Serializable
 from .validation import Validatable
+from .zobrist import zobrist_hash, zobrist_key
 
-__all__ = ['Rod']
+__all__ = ['Rod', 'PersistentRod']
 
 
 class Rod(
@@ -38,6 +40,7 @@ class Rod(
         """
         self = super(Rod, cls).__new__(cls, name, disks or [], height)
         self.validate()
+        self._zobrist = zobrist_hash(self.disks)
         return self
 
     def to_json(self):
@@ -64,6 +67,8 @@ class Rod(
         """
         if isinstance(d, six.string_types):
             d = json.loads(d)
+        if d.pop('persistent', False):
+            cls = PersistentRod
         return cls(
             name=d.pop('name'),
             height=d.pop('height'),
@@ -77,11 +82,14 @@ class Rod(
         """
         Return a shallow copy of this instance.
 
+        :note:
+            The copy has its own list of the (same) disks, so each rod keeps its own Zobrist
+            hash up to date.
         :rtype: Rod
         """
         return Rod(
             self.name,
-            disks=self.disks,
+            disks=self.disks[:],
             height=self.height,
         )
 
@@ -113,9 +121,38 @@ class Rod(
         :rtype: bool
         """
         if isinstance(other, Rod):
-            if other.height == self.height:
-                if other.disks == self.disks:
-                    return True
+            # Not by the Zobrist hashes, which are stale after changing `disks` directly.
+            return other.height == self.height and other.disks == self.disks
+        return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        """
+        Hash this Rod by its current disks, in O(1).
+
+        :rtype: int
+        """
+        return hash((self.height, self._zobrist))
+
+    @property
+    def zobrist(self):
+        """
+        Obtain the Zobrist hash of the disks on this rod.
+
+        :note:
+            Maintained by :func:`Rod.pop` and :func:`Rod.append`, call :func:`Rod.rehash` after
+            modifying `disks` directly.
+        :rtype: int
+        """
+        return self._zobrist
+
+    def rehash(self):
+        """
+        Recalculate the Zobrist hash of this rod from scratch.
+        """
+        self._zobrist = zobrist_hash(self.disks)
 
     def __bool__(self):
         """
@@ -139,7 +176,9 @@ class Rod(
 
         :rtype: Disk
         """
-        return self.disks.pop()
+        disk = self.disks.pop()
+        self._zobrist ^= zobrist_key(disk.width)
+        return disk
 
     def append(self, disk, validate=True):
         """
@@ -151,6 +190,7 @@ class Rod(
             True=perform self validation.
         """
         self.disks.append(disk)
+        self._zobrist ^= zobrist_key(disk.width)
         if validate:
             self.validate()
 
@@ -190,3 +230,102 @@ class Rod(
             width = disk_width
 
             disk.validate()
+
+
+class PersistentRod(Rod):
+    """
+    A :class:`Rod` whose disks are held in a :class:`DiskStack`.
+
+    Copies share their disks with the original: a deep copy (ie: the snapshots held by a
+    :class:`Move`) is made in O(1) instead of O(height), and every push and pop only creates a
+    single new stack entry, so keeping the full history of a solve costs O(1) memory per move.
+    The Zobrist hash is held by the stack, so a snapshot carries no state of its own.
+    """
+
+    def __new__(cls, name, disks=None, height=0):
+        """
+        :param str name:
+            The name of the rod.
+        :param Iterable[Disk] disks:
+            (optional) The disks on the rod, bottom first.
+        :param int height:
+            The height of the rod.
+        :rtype: PersistentRod
+        :raises: See `Rod.validate`.
+        """
+        if not isinstance(disks, DiskStack):
+            disks = DiskStack(disks)
+        self = super(Rod, cls).__new__(cls, name, disks, height)
+        self.validate()
+        return self
+
+    def to_json(self):
+        """
+        Return a json serializable representation of this instance.
+
+        :rtype: object
+        """
+        d = super(PersistentRod, self).to_json()
+        d['persistent'] = True
+        return d
+
+    def __copy__(self):
+        """
+        Return a shallow copy of this instance (which shares the stack of disks).
+
+        :rtype: PersistentRod
+        """
+        return self._share(self.disks)
+
+    def __deepcopy__(self, *d):
+        """
+        Return a deep copy of this instance in O(1), the copy shares all its disks.
+
+        :param dict d:
+            Memoisation dict.
+        :rtype: PersistentRod
+        """
+        return self._share(self.disks.copy())
+
+    def _share(self, disks):
+        # The disks are already known to be valid, so skip the validation.
+        return super(Rod, PersistentRod).__new__(PersistentRod, self.name, disks, self.height)
+
+    @property
+    def _zobrist(self):
+        return self.disks.zobrist
+
+    def rehash(self):
+        """
+        The Zobrist hash is always maintained by the stack of disks.
+        """
+
+    def pop(self):
+        """
+        Pop the top most disk from this rod and return it, in O(1).
+
+        :rtype: Disk
+        """
+        return self.disks.pop()
+
+    def append(self, disk, validate=True):
+        """
+        Append the disk to this rod and optionally validate, in O(1).
+
+        :param Disk disk:
+            The disk to add to the top of our rod.
+        :param bool validate:
+            True=check that the disk is smaller than the current top disk.
+        :raises DuplicateDisk:
+            This rod already contains this disk
+        :raises CorruptRod:
+            The disk is larger than the current top disk.
+        """
+        if validate:
+            disk.validate()
+            top = self.disks.top
+            if top is not None and top.width <= disk.width:
+                if top.width == disk.width:
+                    raise DuplicateDisk(self, disk.width)
+                raise CorruptRod(self, disk)
+        self.disks.append(disk)
@@ -13,7 +13,7 @@ import six
 
 from .disk import Disk
 from .errors import InvalidRod, InvalidRodHeight
-from .rod import Rod
+from .rod import PersistentRod, Rod
 from .utils import Serializable
 from .validation import Validatable, validate_height
 
@@ -32,6 +32,8 @@ class Rods(namedtuple('Rods', ('start', 'end', 'tmp')), Sequence, Validatable, S
         The intermediary rod.
     :param int height:
         The height of the tower.
+    :param bool persistent:
+        True=create any missing rods as :class:`PersistentRod`'s.
     :raises InvalidTowerHeight:
         The height of the tower is invalid.
     :raises InvalidRod:
@@ -44,11 +46,9 @@ class Rods(namedtuple('Rods', ('start', 'end', 'tmp')), Sequence, Validatable, S
         A disk is on top of a disk of smaller size on a Rod.
     """
 
-    def __new__(cls, height=1, start=None, end=None, tmp=None):
+    def __new__(cls, height=1, start=None, end=None, tmp=None, persistent=False):
         validate_height(height)
 
-        start_rod = [Disk(rod, height) for rod in range(height)]
-
         for rod in [start, end, tmp]:
             if rod is None:
                 continue
@@ -58,19 +58,20 @@ class Rods(namedtuple('Rods', ('start', 'end', 'tmp')), Sequence, Validatable, S
                 raise InvalidRodHeight(rod, height)
             rod.validate()
 
+        rod_type = PersistentRod if persistent else Rod
         if start is None:
-            start = Rod(
+            start = rod_type(
                 name='start',
-                disks=start_rod,
+                disks=[Disk(rod, height) for rod in range(height)],
                 height=height,
             )
         if end is None:
-            end = Rod(
+            end = rod_type(
                 name='end',
                 height=height,
             )
         if tmp is None:
-            tmp = Rod(
+            tmp = rod_type(
                 name='tmp',
                 height=height,
             )
@@ -161,8 +162,31 @@ class Rods(namedtuple('Rods', ('start', 'end', 'tmp')), Sequence, Validatable, S
         :rtype: bool
         """
         if isinstance(other, Rods):
-            if all([getattr(self, field) == getattr(other, field) for field in self._fields]):
-                return True
+            if self.height == other.height and self.zobrist == other.zobrist:
+                return all([getattr(self, i) == getattr(other, i) for i in self._fields])
+        return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        """
+        Hash this Rods by the current position of every disk, in O(1).
+
+        :rtype:
+            int
+        """
+        return hash((self.height, ) + self.zobrist)
+
+    @property
+    def zobrist(self):
+        """
+        Obtain the Zobrist hashes of each of the rods.
+
+        :rtype:
+            tuple
+        """
+        return self.start.zobrist, self.end.zobrist, self.tmp.zobrist
 
     def __str__(self):
         return 'Rods({height} - {start}, {end}, {tmp})'.format(
@@ -0,0 +1,167 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.sampling
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import random
+from itertools import chain
+
+from six.moves import map, range
+
+from .errors import InvalidTowerHeight
+from .utils import import_numpy
+from .validation import validate_height
+
+__all__ = [
+    'random_state',
+    'random_states',
+    'iter_states',
+    'count_states',
+]
+
+# The number of disks converted from a base-3 index to a compact state per table lookup.
+CHUNK_HEIGHT = 8
+
+# The largest tower whose compact states fit in a uint64.
+MAX_HEIGHT = 32
+
+# The default number of states drawn at once by :func:`random_states`.
+CHUNK_SIZE = 1 << 16
+
+_TABLES = {0: (0,)}
+
+
+def _table(height):
+    """
+    Obtain the compact states of a tower of (at most `CHUNK_HEIGHT`) disks, in base-3 index order
+    (see :func:`towers.core.state.unrank`).
+    """
+    table = _TABLES.get(height)
+    if table is None:
+        below = _table(height - 1)
+        shift = 2 * (height - 1)
+        table = _TABLES[height] = tuple(
+            state | ((rod + 1) << shift) for rod in range(3) for state in below
+        )
+    return table
+
+
+def _spread(index, height):
+    """
+    Convert a base-3 index into a compact state, `CHUNK_HEIGHT` disks per table lookup.
+    """
+    state = 0
+    shift = 0
+    size = 3 ** CHUNK_HEIGHT
+    table = _table(CHUNK_HEIGHT)
+    while height > CHUNK_HEIGHT:
+        index, low = divmod(index, size)
+        state |= table[low] << shift
+        shift += 2 * CHUNK_HEIGHT
+        height -= CHUNK_HEIGHT
+    return state | (_table(height)[index] << shift)
+
+
+def count_states(height):
+    """
+    Determine the number of legal states of a tower, every disk can be on any rod.
+
+    :param int height:
+        The height of the tower.
+    :rtype:
+        int
+    """
+    validate_height(height)
+    return 3 ** height
+
+
+def random_state(height, rng=None):
+    """
+    Draw a legal state uniformly at random.
+
+    :param int height:
+        The height of the tower.
+    :param random.Random rng:
+        (optional) The random number generator, seed one for reproducible states.
+        Default = the `random` module.
+    :rtype:
+        int
+    :return:
+        The compact state (see :mod:`towers.core.state`), convert it with
+        :func:`towers.core.state.decode` if :class:`Rods` are required.
+    """
+    return _spread((rng or random).randrange(count_states(height)), height)
+
+
+def random_states(height, count, seed=None, chunk_size=CHUNK_SIZE):
+    """
+    Draw many legal states uniformly at random, vectorized.
+
+    :param int height:
+        The height of the tower, at most 32.
+    :param int count:
+        The number of states.
+    :param int seed:
+        (optional) The seed of the random number generator, for reproducible states.
+    :param int chunk_size:
+        The number of states drawn at once, bounds the temporary memory.
+    :rtype:
+        numpy.ndarray
+    :return:
+        A uint64 array of compact states (see :mod:`towers.core.state`).
+    :raises ImportError:
+        numpy is not installed.
+    """
+    validate_height(height)
+    if height > MAX_HEIGHT:
+        raise InvalidTowerHeight(height)
+    np = import_numpy()
+    if np is None:  # pragma: no cover
+        raise ImportError('random_states requires numpy')
+
+    rng = np.random.RandomState(seed)
+    shifts = np.arange(0, 2 * height, 2, dtype=np.uint64)
+    states = np.empty(count, dtype=np.uint64)
+    for begin in range(0, count, chunk_size):
+        rows = min(chunk_size, count - begin)
+        codes = rng.randint(1, 4, size=(rows, height)).astype(np.uint64)
+        states[begin:begin + rows] = np.bitwise_or.reduce(codes << shifts, axis=1)
+    return states
+
+
+def iter_states(height, start=0, stop=None):
+    """
+    Enumerate the legal states of a tower in base-3 index order (see
+    :func:`towers.core.state.rank`).
+
+    Consecutive states differ in the smallest disks, the states of the smallest `CHUNK_HEIGHT`
+    disks come from a cached table and are combined with the larger disks without running any
+    Python code per state.
+
+    :param int height:
+        The height of the tower.
+    :param int start:
+        The index of the first state.
+    :param int stop:
+        (optional) The index after the last state. Default = every state.
+    :rtype:
+        Iterator[int]
+    :return:
+        The compact states (see :mod:`towers.core.state`).
+    """
+    total = count_states(height)
+    stop = total if stop is None else min(stop, total)
+    low = min(height, CHUNK_HEIGHT)
+    size = 3 ** low
+    table = _table(low)
+
+    def segments():
+        for high in range(start // size, -(-stop // size)):
+            prefix = _spread(high, height - low) << (2 * low)
+            offset = high * size
+            rows = table[max(start - offset, 0):stop - offset]
+            yield map(prefix.__or__, rows)
+
+    return chain.from_iterable(segments())
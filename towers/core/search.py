@@ -0,0 +1,469 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.search
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import array
+import tempfile
+from collections import namedtuple
+
+from .moves import CompactMove
+from .validation import validate_height
+
+__all__ = [
+    'StateGraph',
+    'SearchResult',
+    'search',
+    'layers',
+]
+
+# Marks a state that has not been reached yet in a `_Distances` table.
+_UNSEEN = 3
+
+# Holds the index of any state, `Q` is not available on old pythons.
+_INDEX_TYPECODE = 'Q' if 'Q' in getattr(array, 'typecodes', '') else 'L'
+
+
+class SearchResult(namedtuple('SearchResult', ('distance', 'path', 'explored'))):
+    """
+    :param int distance:
+        The number of moves on a shortest path, None if the end is unreachable.
+    :param List[CompactMove] path:
+        The moves of a shortest path, None if not requested or unreachable.
+    :param int explored:
+        The number of (canonical) states that were visited.
+    """
+
+    def __new__(cls, distance, path, explored):
+        return super(SearchResult, cls).__new__(cls, distance, path, explored)
+
+
+class StateGraph(object):
+    """
+    The graph of every state of a tower with any number of rods, where each state is identified
+    by its dense base-`rods` index: the rod of the disk of width `w` is digit `w-1`.
+    """
+
+    def __init__(self, height, rods=3, rule=None, directed=None, fixed=()):
+        """
+        :param int height:
+            The number of disks.
+        :param int rods:
+            The number of rods.
+        :param callable rule:
+            (optional) `rule(disk, start, end)`, returns True if the disk of width `disk` may be
+            moved from rod `start` to rod `end`. Applied on top of the usual rule that a disk may
+            only be placed on a larger disk.
+        :param bool directed:
+            True=a legal move may not be legal in reverse. Default = True if a `rule` is given.
+        :param Iterable[int] fixed:
+            The rods which may not be relabelled when canonicalising states, all others are
+            considered interchangeable.
+        :raises InvalidTowerHeight:
+            The height is invalid.
+        """
+        validate_height(height)
+        if rods < 3:
+            raise ValueError('A tower needs at least 3 rods: {rods}'.format(rods=rods))
+        self.height = height
+        self.rods = rods
+        self.rule = rule
+        self.directed = (rule is not None) if directed is None else bool(directed)
+        self.size = rods ** height
+        self._powers = [rods ** i for i in range(height + 1)]
+        self._free = tuple(i for i in range(rods) if i not in set(fixed))
+
+    def index(self, state):
+        """
+        Obtain the index of a state.
+
+        :param Iterable[int] state:
+            The rod of each disk, smallest disk first.
+        :rtype:
+            int
+        """
+        return sum(rod * power for rod, power in zip(state, self._powers))
+
+    def state(self, index):
+        """
+        Obtain the rod of each disk, smallest disk first, of the state with the given index.
+
+        :param int index:
+            The index of the state.
+        :rtype:
+            List[int]
+        """
+        state = []
+        for _ in range(self.height):
+            index, rod = divmod(index, self.rods)
+            state.append(rod)
+        return state
+
+    def tops(self, index):
+        """
+        Determine the width of the top-most disk of each rod (zero for an empty rod).
+
+        :param int index:
+            The index of the state.
+        :rtype:
+            List[int]
+        """
+        rods = self.rods
+        top = [0] * rods
+        width = 1
+        found = 0
+        while index and found < rods:
+            index, rod = divmod(index, rods)
+            if not top[rod]:
+                top[rod] = width
+                found += 1
+            width += 1
+        if found < rods and width <= self.height and not top[0]:
+            # The remaining (zero) digits are all disks on rod 0.
+            top[0] = width
+        return top
+
+    def successors(self, index):
+        """
+        Enumerate the states reachable with one legal move.
+
+        :param int index:
+            The index of the state.
+        :rtype:
+            List[tuple]
+        :return:
+            (disk, start, end, index) of every successor.
+        """
+        top = self.tops(index)
+        powers = self._powers
+        rule = self.rule
+        result = []
+        for start, disk in enumerate(top):
+            if not disk:
+                continue
+            power = powers[disk - 1]
+            for end, other in enumerate(top):
+                if end == start or (other and other < disk):
+                    continue
+                if rule is not None and not rule(disk, start, end):
+                    continue
+                result.append((disk, start, end, index + (end - start) * power))
+        return result
+
+    def predecessors(self, index):
+        """
+        Enumerate the states from which the given state is reachable with one legal move.
+
+        :param int index:
+            The index of the state.
+        :rtype:
+            List[tuple]
+        :return:
+            (disk, start, end, index) of every predecessor, where the move is made from the
+            predecessor.
+        """
+        if not self.directed:
+            return [
+                (disk, end, start, neighbour)
+                for disk, start, end, neighbour in self.successors(index)
+            ]
+
+        top = self.tops(index)
+        powers = self._powers
+        rule = self.rule
+        result = []
+        for end, disk in enumerate(top):
+            if not disk:
+                continue
+            power = powers[disk - 1]
+            for start, other in enumerate(top):
+                if start == end or (other and other < disk):
+                    continue
+                if not rule(disk, start, end):
+                    continue
+                result.append((disk, start, end, index + (start - end) * power))
+        return result
+
+    def canonical(self, index):
+        """
+        Relabel the interchangeable rods of a state in order of their largest disk.
+
+        :param int index:
+            The index of the state.
+        :rtype:
+            int
+        """
+        free = self._free
+        if len(free) < 2:
+            return index
+
+        state = self.state(index)
+        mapping = {}
+        available = iter(free)
+        for rod in reversed(state):
+            if rod in free and rod not in mapping:
+                mapping[rod] = next(available)
+        return self.index(mapping.get(rod, rod) for rod in state)
+
+
+class _Distances(object):
+    """
+    The distance of every state, either modulo 3 in 2 bits per state (enough to walk back along
+    a shortest path of an undirected graph) or in full.
+    """
+
+    def __init__(self, size, full):
+        self._full = full
+        if full:
+            self._table = array.array('i', [-1]) * size
+        else:
+            self._table = bytearray(b'\xff') * ((size + 3) // 4)
+
+    def seen(self, index):
+        if self._full:
+            return self._table[index] >= 0
+        return ((self._table[index >> 2] >> ((index & 3) << 1)) & 3) != _UNSEEN
+
+    def get(self, index):
+        if self._full:
+            return self._table[index]
+        return (self._table[index >> 2] >> ((index & 3) << 1)) & 3
+
+    def set(self, index, distance):
+        if self._full:
+            self._table[index] = distance
+        else:
+            shift = (index & 3) << 1
+            offset = index >> 2
+            self._table[offset] = (self._table[offset] & ~(3 << shift)) | ((distance % 3) << shift)
+
+    def matches(self, index, distance):
+        if self._full:
+            return self._table[index] == distance
+        return self.get(index) == distance % 3
+
+
+class _Frontier(object):
+    """
+    A FIFO of state indexes which spills to a temporary file once it grows too large.
+    """
+
+    def __init__(self, spill_dir=None, limit=1 << 20):
+        self._spill_dir = spill_dir
+        self._limit = limit
+        self._buffer = array.array(_INDEX_TYPECODE)
+        self._file = None
+        self._spilled = 0
+
+    def __len__(self):
+        return self._spilled + len(self._buffer)
+
+    def append(self, index):
+        self._buffer.append(index)
+        if self._spill_dir is not None and len(self._buffer) >= self._limit:
+            if self._file is None:
+                self._file = tempfile.TemporaryFile(dir=self._spill_dir)
+            self._buffer.tofile(self._file)
+            self._spilled += len(self._buffer)
+            self._buffer = array.array(_INDEX_TYPECODE)
+
+    def __iter__(self):
+        if self._file is not None:
+            self._file.seek(0)
+            remaining = self._spilled
+            while remaining:
+                chunk = array.array(_INDEX_TYPECODE)
+                count = min(remaining, self._limit)
+                chunk.fromfile(self._file, count)
+                remaining -= count
+                for index in chunk:
+                    yield index
+        for index in self._buffer:
+            yield index
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _expand(graph, table, frontier, depth, forward, canonical, spill_dir, limit):
+    """
+    Visit every unseen neighbour of the frontier, returning the next frontier.
+    """
+    neighbours = graph.successors if forward else graph.predecessors
+    found = _Frontier(spill_dir, limit)
+    for index in frontier:
+        for _, _, _, neighbour in neighbours(index):
+            if canonical:
+                neighbour = graph.canonical(neighbour)
+            if not table.seen(neighbour):
+                table.set(neighbour, depth)
+                found.append(neighbour)
+    frontier.close()
+    return found
+
+
+def _walk(graph, table, index, distance, forward, canonical):
+    """
+    Walk from a state back to the root of a distance table, returning the moves in walk order.
+    """
+    neighbours = graph.predecessors if forward else graph.successors
+    moves = []
+    while distance:
+        distance -= 1
+        for disk, start, end, neighbour in neighbours(index):
+            key = graph.canonical(neighbour) if canonical else neighbour
+            if table.seen(key) and table.matches(key, distance):
+                moves.append((disk, start, end))
+                index = neighbour
+                break
+        else:  # pragma: no cover
+            raise RuntimeError('Corrupt distance table at: {index}'.format(index=index))
+    return moves
+
+
+def _meeting(frontier, table, target):
+    """
+    Find the first state of the frontier which was seen from the other side of the search (or
+    which is the target, if there is no other side).
+    """
+    for index in frontier:
+        if (index == target) if table is None else table.seen(index):
+            return index
+
+
+def search(
+    height, rods=3, rule=None, start=None, end=None, directed=None, canonical=None,
+    bidirectional=None, path=True, spill_dir=None, frontier_limit=1 << 20,
+):
+    """
+    Find the length of (and optionally a) shortest sequence of moves between two states by
+    breadth first search over packed state indexes.
+
+    :param int height:
+        The number of disks.
+    :param int rods:
+        The number of rods.
+    :param callable rule:
+        (optional) See :class:`StateGraph`.
+    :param Iterable[int] start:
+        (optional) The rod of each disk at the start, smallest first. Default = all on rod 0.
+    :param Iterable[int] end:
+        (optional) The rod of each disk at the end, smallest first. Default = all on rod 1.
+    :param bool directed:
+        See :class:`StateGraph`.
+    :param bool canonical:
+        True=treat states that only differ by a relabelling of the rods not used by `start` or
+        `end` as the same state. Only valid if the `rule` treats those rods alike.
+        Default = True if no `rule` is given.
+    :param bool bidirectional:
+        True=search from both ends at once (requires an undirected graph).
+        Default = True for undirected graphs.
+    :param bool path:
+        True=also return the moves of a shortest path.
+    :param str spill_dir:
+        (optional) The directory in which to spill large frontiers to disk.
+    :param int frontier_limit:
+        The number of states of a frontier to hold in memory before spilling to disk.
+    :rtype:
+        SearchResult
+    """
+    start = [0] * height if start is None else list(start)
+    end = [1] * height if end is None else list(end)
+    graph = StateGraph(height, rods, rule, directed, fixed=set(start) | set(end))
+    canonical = (rule is None) if canonical is None else canonical
+    if bidirectional is None:
+        bidirectional = not graph.directed
+    if bidirectional and graph.directed:
+        raise ValueError('A bidirectional search requires an undirected graph')
+
+    source = graph.index(start)
+    target = graph.index(end)
+    if source == target:
+        return SearchResult(0, [] if path else None, 1)
+
+    tables = [_Distances(graph.size, graph.directed)]
+    frontiers = [_Frontier(spill_dir, frontier_limit)]
+    depths = [0]
+    tables[0].set(source, 0)
+    frontiers[0].append(source)
+    if bidirectional:
+        tables.append(_Distances(graph.size, False))
+        frontiers.append(_Frontier(spill_dir, frontier_limit))
+        depths.append(0)
+        tables[1].set(target, 0)
+        frontiers[1].append(target)
+
+    explored = len(tables)
+    meet = None
+    while meet is None and all(frontiers):
+        side = 1 if bidirectional and len(frontiers[1]) < len(frontiers[0]) else 0
+        depths[side] += 1
+        frontiers[side] = _expand(
+            graph, tables[side], frontiers[side], depths[side], side == 0, canonical, spill_dir,
+            frontier_limit,
+        )
+        explored += len(frontiers[side])
+        meet = _meeting(frontiers[side], tables[1 - side] if bidirectional else None, target)
+
+    for frontier in frontiers:
+        frontier.close()
+
+    if meet is None:
+        return SearchResult(None, None, explored)
+
+    # The meeting state is at the last depth reached from both sides.
+    moves = None
+    if path:
+        moves = _walk(graph, tables[0], meet, depths[0], True, canonical)[::-1]
+        if bidirectional:
+            moves += _walk(graph, tables[1], meet, depths[1], False, canonical)
+        moves = [CompactMove(disk, a, b, i) for i, (disk, a, b) in enumerate(moves)]
+    return SearchResult(sum(depths), moves, explored)
+
+
+def layers(height, rods=3, rule=None, start=None, directed=None, spill_dir=None,
+           frontier_limit=1 << 20):
+    """
+    Count the states at each distance from a start state, by breadth first search over every
+    reachable state.
+
+    :param int height:
+        The number of disks.
+    :param int rods:
+        The number of rods.
+    :param callable rule:
+        (optional) See :class:`StateGraph`.
+    :param Iterable[int] start:
+        (optional) The rod of each disk at the start, smallest first. Default = all on rod 0.
+    :param bool directed:
+        See :class:`StateGraph`.
+    :param str spill_dir:
+        (optional) The directory in which to spill large frontiers to disk.
+    :param int frontier_limit:
+        The number of states of a frontier to hold in memory before spilling to disk.
+    :rtype:
+        List[int]
+    :return:
+        The number of states at distance `i` is at index `i`, so the last index is the
+        eccentricity of the start state.
+    """
+    start = [0] * height if start is None else list(start)
+    graph = StateGraph(height, rods, rule, directed)
+    table = _Distances(graph.size, False)
+    frontier = _Frontier(spill_dir, frontier_limit)
+    source = graph.index(start)
+    table.set(source, 0)
+    frontier.append(source)
+
+    counts = []
+    depth = 0
+    while len(frontier):
+        counts.append(len(frontier))
+        depth += 1
+        frontier = _expand(graph, table, frontier, depth, True, False, spill_dir, frontier_limit)
+    frontier.close()
+    return counts
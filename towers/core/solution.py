@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.solution
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import heapq
+
+import six
+from six.moves import range
+
+from .errors import InvalidMoves
+from .moves import ROD_NAMES, CompactMove
+from .validation import validate_height, validate_moves
+
+__all__ = [
+    'move_at',
+    'state_at',
+    'iter_solution',
+    'iter_filtered',
+    'count_moves',
+    'next_move',
+    'previous_move',
+]
+
+
+def _step(height, disk):
+    """
+    Determine the direction in which a disk travels around the rods of the optimal solution:
+    1 = `start` -> `end` -> `tmp`, 2 = `start` -> `tmp` -> `end`.
+    """
+    return 2 if (height - disk) & 1 else 1
+
+
+def _moves_array(np, height, indexes):
+    """
+    Calculate the (disk, start, end) uint64 arrays of the moves at the given uint64 indexes of
+    the optimal solution, vectorized (see :func:`move_at`).
+    """
+    count = indexes + np.uint64(1)
+    # The disk is the position of the lowest set bit of the move number.
+    disk = np.frexp((count & (~count + np.uint64(1))).astype(np.float64))[1].astype(np.uint64)
+    turn = (count >> disk) % np.uint64(3)
+    step = np.where((np.uint64(height) - disk) & np.uint64(1), np.uint64(2), np.uint64(1))
+    start = (turn * step) % np.uint64(3)
+    end = (((turn + np.uint64(1)) % np.uint64(3)) * step) % np.uint64(3)
+    return disk, start, end
+
+
+def _validate_index(height, index):
+    validate_height(height)
+    validate_moves(index)
+    if index >= (1 << height) - 1:
+        raise InvalidMoves(index)
+
+
+def move_at(height, index):
+    """
+    Determine the move at the given index of the optimal solution, in O(1).
+
+    The disk of width `d` makes its `j`-th move at index `2 ** (d-1) * (2j + 1) - 1`, always in
+    the same direction around the rods.
+
+    :param int height:
+        The height of the tower.
+    :param int index:
+        The index of the move, 0 = the first move.
+    :rtype:
+        CompactMove
+    :raises InvalidMoves:
+        The index is not within the solution.
+    """
+    _validate_index(height, index)
+    count = index + 1
+    disk = (count & -count).bit_length()
+    turn = count >> disk
+    step = _step(height, disk)
+    return CompactMove(disk, (turn * step) % 3, ((turn + 1) * step) % 3, index)
+
+
+def state_at(height, moves):
+    """
+    Determine the compact state (see :mod:`towers.core.state`) after the given number of moves of
+    the optimal solution, in O(height).
+
+    :param int height:
+        The height of the tower.
+    :param int moves:
+        The number of moves made.
+    :rtype:
+        int
+    :raises InvalidMoves:
+        The number of moves is not within the solution.
+    """
+    validate_height(height)
+    validate_moves(moves)
+    if moves > (1 << height) - 1:
+        raise InvalidMoves(moves)
+
+    state = 0
+    for disk in range(1, height + 1):
+        turns = (moves + (1 << (disk - 1))) >> disk
+        state |= (((turns * _step(height, disk)) % 3) + 1) << (2 * (disk - 1))
+    return state
+
+
+def iter_solution(height, start=0, stop=None):
+    """
+    Generate the moves of the optimal solution, in O(1) per move and without any :class:`Rod`.
+
+    :note:
+        Generator, yields :class:`CompactMove` instances.
+    :param int height:
+        The height of the tower.
+    :param int start:
+        The index of the first move to generate.
+    :param int stop:
+        (optional) The index at which to stop. Default = the end of the solution.
+    """
+    validate_height(height)
+    total = (1 << height) - 1
+    stop = total if stop is None else min(stop, total)
+    steps = [0] + [_step(height, disk) for disk in range(1, height + 1)]
+
+    for index in range(start, stop):
+        count = index + 1
+        disk = (count & -count).bit_length()
+        turn = count >> disk
+        step = steps[disk]
+        yield CompactMove(disk, (turn * step) % 3, ((turn + 1) * step) % 3, index)
+
+
+def _rod_pairs(rod_pairs):
+    """
+    Convert (start, end) pairs of rod indexes or names into a set of rod index pairs.
+    """
+    return set(
+        tuple(ROD_NAMES.index(rod) if isinstance(rod, six.string_types) else rod for rod in pair)
+        for pair in rod_pairs
+    )
+
+
+def _selections(height, disks, rod_pairs):
+    """
+    Determine the selected moves as (disk, residue) pairs: the turns `j` of the disk with
+    `j % 3 == residue` are selected, every turn when the residue is None.
+    """
+    disks = range(1, height + 1) if disks is None else sorted(set(disks))
+    pairs = None if rod_pairs is None else _rod_pairs(rod_pairs)
+
+    selections = []
+    for disk in disks:
+        if not 1 <= disk <= height:
+            continue
+        step = _step(height, disk)
+        if pairs is None:
+            selections.append((disk, None))
+            continue
+        for pair_start, pair_end in pairs:
+            if (pair_end - pair_start) % 3 == step and pair_start in (0, 1, 2):
+                selections.append((disk, (pair_start * step) % 3))
+    return selections
+
+
+def _first_turn(disk, index, residue):
+    """
+    Determine the first selected turn of a disk whose move index is at or after `index`.
+    """
+    # The move index of turn j is 2 ** (d-1) * (2j + 1) - 1.
+    turn = (-(-(index + 1) >> (disk - 1))) // 2
+    return turn if residue is None else turn + (residue - turn) % 3
+
+
+def _last_turn(disk, index, residue):
+    """
+    Determine the last selected turn of a disk whose move index is at or before `index` (negative
+    if there is none).
+    """
+    turn = (((index + 1) >> (disk - 1)) - 1) // 2
+    return turn if residue is None else turn - (turn - residue) % 3
+
+
+def _move(height, disk, turn):
+    step = _step(height, disk)
+    index = (1 << (disk - 1)) * (2 * turn + 1) - 1
+    return CompactMove(disk, (turn * step) % 3, ((turn + 1) * step) % 3, index)
+
+
+def _progression(height, disk, residue, start, stop):
+    """
+    Generate the selected moves of a disk between two indexes.
+
+    :note:
+        Generator, yields (index, :class:`CompactMove`) pairs.
+    """
+    step = _step(height, disk)
+    base = 1 << (disk - 1)
+    turn = _first_turn(disk, start, residue)
+    stride = 1 if residue is None else 3
+
+    for index in range(base * (2 * turn + 1) - 1, stop, 2 * base * stride):
+        yield index, CompactMove(disk, (turn * step) % 3, ((turn + 1) * step) % 3, index)
+        turn += stride
+
+
+def iter_filtered(height, disks=None, rod_pairs=None, start=0, stop=None):
+    """
+    Generate only the selected moves of the optimal solution, in O(log(height)) per generated
+    move (the moves that are not selected cost nothing).
+
+    The moves of the disk of width `d` are at the arithmetic progression of indexes
+    `2 ** (d-1) * (2j + 1) - 1` and cycle through the same 3 pairs of rods, so the moves of each
+    disk between a pair of rods form an arithmetic progression too. The progressions of every
+    selected disk and pair of rods are merged in order.
+
+    :note:
+        Generator, yields :class:`CompactMove` instances.
+    :param int height:
+        The height of the tower.
+    :param Iterable[int] disks:
+        (optional) The widths of the disks to select (ie: the largest `k` disks are
+        `range(height - k + 1, height + 1)`). Default = every disk.
+    :param Iterable[tuple] rod_pairs:
+        (optional) The (start, end) pairs of rod indexes or names (see `ROD_NAMES`) to select.
+        Default = every pair.
+    :param int start:
+        The index of the first move to consider.
+    :param int stop:
+        (optional) The index at which to stop. Default = the end of the solution.
+    """
+    validate_height(height)
+    total = (1 << height) - 1
+    stop = total if stop is None else min(stop, total)
+
+    progressions = [
+        _progression(height, disk, residue, start, stop)
+        for disk, residue in _selections(height, disks, rod_pairs)
+    ]
+    for _, move in heapq.merge(*progressions):
+        yield move
+
+
+def count_moves(height, start=0, stop=None, disks=None, rod_pairs=None):
+    """
+    Count the selected moves of the optimal solution between two indexes, in O(height).
+
+    :param int height:
+        The height of the tower.
+    :param int start:
+        The index of the first move to count.
+    :param int stop:
+        (optional) The index at which to stop. Default = the end of the solution.
+    :param Iterable[int] disks:
+        (optional) The widths of the disks to count. Default = every disk.
+    :param Iterable[tuple] rod_pairs:
+        (optional) The (start, end) pairs of rod indexes or names to count. Default = every pair.
+    :rtype:
+        int
+    """
+    validate_height(height)
+    validate_moves(start)
+    total = (1 << height) - 1
+    stop = total if stop is None else min(stop, total)
+    if stop <= start:
+        return 0
+
+    count = 0
+    for disk, residue in _selections(height, disks, rod_pairs):
+        first = _first_turn(disk, start, None)
+        last = _last_turn(disk, stop - 1, None)
+        if last < first:
+            continue
+        if residue is None:
+            count += last - first + 1
+        else:
+            count += (last - residue) // 3 - (first - 1 - residue) // 3
+    return count
+
+
+def next_move(height, index, disks=None, rod_pairs=None):
+    """
+    Find the first selected move of the optimal solution at or after an index, in O(height).
+
+    :param int height:
+        The height of the tower.
+    :param int index:
+        The index to search from.
+    :param Iterable[int] disks:
+        (optional) The widths of the disks to select. Default = every disk.
+    :param Iterable[tuple] rod_pairs:
+        (optional) The (start, end) pairs of rod indexes or names to select.
+        Default = every pair.
+    :rtype:
+        CompactMove
+    :return:
+        The move, None if there is no such move.
+    """
+    validate_height(height)
+    validate_moves(index)
+    total = (1 << height) - 1
+
+    found = None
+    for disk, residue in _selections(height, disks, rod_pairs):
+        move = _move(height, disk, _first_turn(disk, index, residue))
+        if move.moves < total and (found is None or move.moves < found.moves):
+            found = move
+    return found
+
+
+def previous_move(height, index, disks=None, rod_pairs=None):
+    """
+    Find the last selected move of the optimal solution at or before an index, in O(height).
+
+    :param int height:
+        The height of the tower.
+    :param int index:
+        The index to search from.
+    :param Iterable[int] disks:
+        (optional) The widths of the disks to select. Default = every disk.
+    :param Iterable[tuple] rod_pairs:
+        (optional) The (start, end) pairs of rod indexes or names to select.
+        Default = every pair.
+    :rtype:
+        CompactMove
+    :return:
+        The move, None if there is no such move.
+    """
+    validate_height(height)
+    validate_moves(index)
+    index = min(index, (1 << height) - 2)
+
+    found = None
+    for disk, residue in _selections(height, disks, rod_pairs):
+        turn = _last_turn(disk, index, residue)
+        if turn >= 0:
+            move = _move(height, disk, turn)
+            if found is None or move.moves > found.moves:
+                found = move
+    return found
@@ -0,0 +1,151 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.stack
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from collections import namedtuple
+
+from .zobrist import zobrist_key
+
+__all__ = ['DiskStack']
+
+
+# An immutable cons cell: the top disk, the cell below it, the number of disks in the stack and
+# their Zobrist hash.
+_Node = namedtuple('_Node', ('disk', 'below', 'size', 'zobrist'))
+
+
+class DiskStack(object):
+    """
+    A list-like stack of disks backed by an immutable cons-list.
+
+    Every push and pop creates a new version of the stack in O(1), leaving the versions held by
+    any copies untouched, so copies share their disks instead of duplicating them.
+
+    :param Iterable[Disk] disks:
+        (optional) The disks to stack, bottom first.
+    """
+
+    __slots__ = ('_head',)
+
+    def __init__(self, disks=None):
+        self._head = None
+        for disk in disks or ():
+            self.append(disk)
+
+    @classmethod
+    def _from_head(cls, head):
+        self = cls.__new__(cls)
+        self._head = head
+        return self
+
+    def copy(self):
+        """
+        Return a copy of this stack in O(1), the copy shares all its disks with this stack.
+
+        :rtype: DiskStack
+        """
+        return DiskStack._from_head(self._head)
+
+    @property
+    def top(self):
+        """
+        Obtain the top most disk, None if the stack is empty.
+
+        :rtype: Disk
+        """
+        return self._head.disk if self._head is not None else None
+
+    @property
+    def zobrist(self):
+        """
+        Obtain the Zobrist hash of the disks in this stack, see :mod:`towers.core.zobrist`.
+
+        :rtype: int
+        """
+        return self._head.zobrist if self._head is not None else 0
+
+    def append(self, disk):
+        """
+        Push a disk onto the top of this stack.
+
+        :param Disk disk:
+        """
+        head = self._head
+        key = zobrist_key(disk.width)
+        if head is None:
+            self._head = _Node(disk, None, 1, key)
+        else:
+            self._head = _Node(disk, head, head.size + 1, head.zobrist ^ key)
+
+    def pop(self):
+        """
+        Pop the top most disk from this stack and return it.
+
+        :rtype: Disk
+        :raises IndexError:
+            The stack is empty.
+        """
+        head = self._head
+        if head is None:
+            raise IndexError('pop from empty stack')
+        self._head = head.below
+        return head.disk
+
+    def __len__(self):
+        return self._head.size if self._head is not None else 0
+
+    def __bool__(self):
+        return self._head is not None
+
+    __nonzero__ = __bool__
+
+    def __reversed__(self):
+        """
+        Iterate over the disks from the top down.
+
+        :rtype: Disk
+        """
+        node = self._head
+        while node is not None:
+            yield node.disk
+            node = node.below
+
+    def __iter__(self):
+        """
+        Iterate over the disks from the bottom up, as a list of disks would.
+
+        :rtype: Disk
+        """
+        return iter(list(reversed(self))[::-1])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) and index == slice(None):
+            return self.copy()
+        return list(self)[index]
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, *d):
+        return self.copy()
+
+    def __eq__(self, other):
+        if isinstance(other, DiskStack):
+            if other._head is self._head:
+                return True
+            if len(other) != len(self):
+                return False
+        elif not isinstance(other, list):
+            return False
+        return list(self) == list(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self))
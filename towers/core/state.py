@@ -0,0 +1,235 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.state
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from .disk import Disk
+from .errors import IllegalMove
+from .moves import ROD_NAMES
+from .rod import Rod
+from .rods import Rods
+from .validation import validate_height
+
+__all__ = [
+    'encode',
+    'decode',
+    'from_masks',
+    'height_of',
+    'start_state',
+    'end_state',
+    'tops',
+    'legal_moves',
+    'apply',
+    'rank',
+    'unrank',
+]
+
+# The (start, end) rod indexes of every possible move.
+MOVES = tuple((start, end) for start in range(3) for end in range(3) if start != end)
+
+_LOW_BITS = {}
+
+
+def _low_bits(height):
+    """
+    Obtain the mask with the low bit of each of the `height` 2-bit pairs set.
+    """
+    mask = _LOW_BITS.get(height)
+    if mask is None:
+        mask = _LOW_BITS[height] = (4 ** height - 1) // 3
+    return mask
+
+
+def encode(rods):
+    """
+    Encode the :class:`Rods` as a compact state.
+
+    :param Rods rods:
+        The rods to encode.
+    :rtype:
+        int
+    """
+    state = 0
+    for index, rod in enumerate(rods):
+        code = index + 1
+        for disk in rod.disks:
+            state |= code << (2 * (disk.width - 1))
+    return state
+
+
+def decode(state):
+    """
+    Decode a compact state into a new :class:`Rods`.
+
+    :param int state:
+        The compact state.
+    :rtype:
+        Rods
+    :raises InvalidTowerHeight:
+        The state holds no disks.
+    """
+    height = height_of(state)
+    validate_height(height)
+
+    disks = ([], [], [])
+    for width in range(height, 0, -1):
+        code = (state >> (2 * (width - 1))) & 3
+        disks[code - 1].append(Disk(height - width, height))
+
+    return Rods(
+        height,
+        *[Rod(name, disks=rod_disks, height=height) for name, rod_disks in zip(ROD_NAMES, disks)]
+    )
+
+
+def from_masks(masks):
+    """
+    Convert the bitmasks of the disks on each rod (bit `w - 1` = the disk of width `w`) into a
+    compact state.
+
+    :param Iterable[int] masks:
+        The bitmask of every rod, in `ROD_NAMES` order.
+    :rtype:
+        int
+    """
+    state = 0
+    for rod, mask in enumerate(masks):
+        disk = 0
+        while mask:
+            if mask & 1:
+                state |= (rod + 1) << (2 * disk)
+            mask >>= 1
+            disk += 1
+    return state
+
+
+def height_of(state):
+    """
+    Determine the height of the tower of a compact state.
+
+    :param int state:
+        The compact state.
+    :rtype:
+        int
+    """
+    return (state.bit_length() + 1) // 2
+
+
+def start_state(height):
+    """
+    The compact state with every disk on the start rod.
+
+    :param int height:
+        The height of the tower.
+    :rtype:
+        int
+    """
+    return _low_bits(height)
+
+
+def end_state(height):
+    """
+    The compact state with every disk on the end rod.
+
+    :param int height:
+        The height of the tower.
+    :rtype:
+        int
+    """
+    return _low_bits(height) << 1
+
+
+def tops(state):
+    """
+    Determine the width of the top-most disk of each rod.
+
+    :param int state:
+        The compact state.
+    :rtype:
+        tuple
+    :return:
+        The width of the top disk of each rod (in `ROD_NAMES` order), zero for an empty rod.
+    """
+    mask = _low_bits(height_of(state))
+    low = state & mask
+    high = (state >> 1) & mask
+    rods = (low & ~high, high & ~low, low & high)
+    return tuple(((rod & -rod).bit_length() + 1) // 2 for rod in rods)
+
+
+def legal_moves(state):
+    """
+    Enumerate the legal moves from a compact state.
+
+    :param int state:
+        The compact state.
+    :rtype:
+        List[tuple]
+    :return:
+        The (start, end) rod indexes of every legal move.
+    """
+    top = tops(state)
+    return [
+        (start, end) for start, end in MOVES
+        if top[start] and (not top[end] or top[start] < top[end])
+    ]
+
+
+def apply(state, move, validate=True):
+    """
+    Apply a move to a compact state.
+
+    :param int state:
+        The compact state.
+    :param tuple move:
+        The (start, end) rod indexes of the move.
+    :param bool validate:
+        True=check the move is legal first.
+    :rtype:
+        int
+    :return:
+        The new compact state.
+    :raises IllegalMove:
+        The move is not legal from the state.
+    """
+    start, end = move
+    top = tops(state)
+    width = top[start]
+    if validate and (not width or (top[end] and top[end] < width) or start == end):
+        raise IllegalMove(move, state)
+    return state ^ (((start + 1) ^ (end + 1)) << (2 * (width - 1)))
+
+
+def rank(state):
+    """
+    Convert a compact state into its dense base-3 index, in the range [0, 3 ** height).
+
+    :param int state:
+        The compact state.
+    :rtype:
+        int
+    """
+    index = 0
+    for width in range(height_of(state), 0, -1):
+        index = index * 3 + ((state >> (2 * (width - 1))) & 3) - 1
+    return index
+
+
+def unrank(index, height):
+    """
+    Convert a dense base-3 index back into a compact state.
+
+    :param int index:
+        The base-3 index (the rod index of the disk of width `w` is digit `w-1`).
+    :param int height:
+        The height of the tower.
+    :rtype:
+        int
+    """
+    state = 0
+    for width in range(height):
+        index, rod = divmod(index, 3)
+        state |= (rod + 1) << (2 * width)
+    return state
@@ -9,16 +9,22 @@ import contextlib
 import copy
 import json
 import math
+import time
 from collections import Sequence
 
 import six
 
 from .errors import (
-    InvalidEndingConditions, InvalidStartingConditions,
+    InvalidEndingConditions, InvalidStartingConditions, TowersError,
 )
-from .moves import Move
+from .moves import CompactMove, Move
+from .observers import Subscription, publish
+from .progress import ProgressMonitor
+from .render import Renderer
 from .rod import Rod
 from .rods import Rods
+from .solution import iter_filtered
+from .state import encode
 from .utils import Serializable
 from .validation import (
     Validatable, validate_height, validate_moves, validate_rods,
@@ -58,7 +64,13 @@ class Towers(Sequence, Validatable, Serializable):
         validate_moves(moves)
         self._rods = rods if rods is not None else Rods(height)
         self._moves = moves
+        # The validity of the rods is unknown.
+        self._valid = None
+        # Seqlock: equal to `moves` unless a move is being made (see `snapshot`).
+        self._version = moves
         self._verbose = bool(verbose)
+        self._progress = None
+        self._subscriptions = []
 
     def to_json(self):
         """
@@ -120,13 +132,19 @@ class Towers(Sequence, Validatable, Serializable):
             # Error inside context or validation:
             if reset_on_error:
                 self._verbose = verbose
-                self._moves = moves
+                self._version = None
                 self._rods = Rods.from_json(rods)
+                self._moves = moves
+                self._valid = None
+                self._version = moves
         else:
             if reset_on_success:
                 self._verbose = verbose
-                self._moves = moves
+                self._version = None
                 self._rods = Rods.from_json(rods)
+                self._moves = moves
+                self._valid = None
+                self._version = moves
 
     def __bool__(self):
         """
@@ -144,11 +162,61 @@ class Towers(Sequence, Validatable, Serializable):
         :rtype:
             bool
         """
-        try:
-            self.validate_end()
-            return True
-        except Exception:
-            return False
+        return self.is_solved()
+
+    def _validate_rods(self):
+        """
+        Fully validate the rods (whatever the cache says), refreshing the cache.
+        """
+        self._valid = False
+        self._rods.validate()
+        self._valid = True
+
+    def invalidate(self):
+        """
+        Forget the cached validity of the rods, call after changing the :class:`Rod`'s directly
+        (the `validate` methods always check the rods in full, and also refresh the cache).
+        """
+        self._valid = None
+
+    def is_valid(self):
+        """
+        Determine whether the rods are valid, without raising.
+
+        :note:
+            The result is cached, so this is O(1) on every further call. Call
+            :func:`Towers.invalidate` after changing the :class:`Rod`'s directly (ie: with
+            `Rod.append(disk, validate=False)`).
+        :rtype:
+            bool
+        """
+        valid = self._valid
+        if valid is None:
+            try:
+                self._rods.validate()
+                valid = True
+            except TowersError:
+                valid = False
+            self._valid = valid
+        return valid
+
+    def is_start(self):
+        """
+        Determine whether the towers are in their start state, without raising, in O(1).
+
+        :rtype:
+            bool
+        """
+        return self._moves == 0 and len(self._rods.start.disks) == self.height and self.is_valid()
+
+    def is_solved(self):
+        """
+        Determine whether the towers are solved, without raising, in O(1).
+
+        :rtype:
+            bool
+        """
+        return len(self._rods.end.disks) == self.height and self.is_valid()
 
     def __copy__(self):
         """
@@ -173,7 +241,7 @@ class Towers(Sequence, Validatable, Serializable):
         :rtype:
             :class:`Towers`
         """
-        return Towers.from_json(self.to_json())
+        return self.from_json(self.to_json())
 
     def __eq__(self, other):
         """
@@ -185,9 +253,23 @@ class Towers(Sequence, Validatable, Serializable):
             bool
         """
         if isinstance(other, Towers):
-            if other.height == self.height:
-                if other._rods == self._rods:
-                    return True
+            return other._rods == self._rods
+        return False
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        """
+        Hash this :class:`Towers` by its current state, in O(1).
+
+        :note:
+            The hash changes as moves are made, only use a :class:`Towers` as a dict key or set
+            member while it is not being moved.
+        :rtype:
+            int
+        """
+        return hash(self._rods)
 
     def __getitem__(self, index):
         """
@@ -225,13 +307,145 @@ class Towers(Sequence, Validatable, Serializable):
         """
         Run the towers, yielding :class:`Move` instances.
         """
-        for i in self.move_tower(
+        return self._monitor(self.move_tower(
             height=self.height,
             start=self.start_rod,
             end=self.end_rod,
             tmp=self.tmp_rod,
-        ):
-            yield i
+        ))
+
+    def iter_compact(self):
+        """
+        Run the towers, yielding :class:`CompactMove` instances.
+
+        Unlike iterating over the :class:`Towers` no :class:`Rod` snapshots are taken, so each
+        move costs O(1). Unless starting from the start state, every move is validated.
+
+        :raises CorruptRod:
+            A :class:`Disk` is placed on top of a :class:`Disk` of smaller size.
+        """
+        return self._monitor(self._iter_compact())
+
+    def _iter_compact(self):
+        rods = list(self._rods)
+        # The schedule only keeps the rods valid when starting from the start state.
+        trusted = self.is_start()
+
+        for start, end in self.schedule(self.height, 0, 1, 2):
+            moves = self._moves
+            self._version = moves + 1
+            if not trusted:
+                self._valid = None
+            disk = rods[start].pop()
+            # Untrusted, fail at the first illegal placement (as when iterating the Towers).
+            rods[end].append(disk, validate=not trusted)
+            self._moves = moves + 1
+            yield CompactMove(disk.width, start, end, moves)
+
+    def on_progress(self, callback, every=None, interval=None, clock=None):
+        """
+        Report the progress of every following iteration over the moves of this instance.
+
+        :note:
+            The clock is only read between strides of moves, so the overhead is a few percent
+            at most, and nothing once disabled.
+        :param callable callback:
+            Called with a :class:`towers.core.progress.Progress` every `every` moves and/or
+            every `interval` seconds, and when the iteration ends. None = disable reporting.
+        :param int every:
+            (optional) Report every N moves.
+        :param float interval:
+            (optional) Report every T seconds.
+        :param callable clock:
+            (optional) The clock. Default = `time.time`.
+        """
+        self._progress = None if callback is None else \
+            ProgressMonitor(callback, every=every, interval=interval, clock=clock)
+
+    def subscribe(self, callback, batch_size=1024, packed=False):
+        """
+        Deliver the moves of every following iteration over this instance to an observer, in
+        batches.
+
+        :note:
+            The moves are recorded once for every observer, each observer is called once per
+            batch. The remaining moves are always delivered when the iteration completes, fails
+            or is abandoned.
+        :param callable callback:
+            Called with every batch of moves, as a list (or packed bytes).
+        :param int batch_size:
+            The number of moves per batch.
+        :param bool packed:
+            True=deliver every batch as packed bytes, one byte per move (see
+            :func:`towers.core.moves.pack_moves`).
+        :rtype:
+            Subscription
+        """
+        subscription = Subscription(callback, batch_size=batch_size, packed=packed)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """
+        Stop delivering moves to an observer, from the next iteration.
+
+        :param Subscription subscription:
+            The subscription returned by :func:`Towers.subscribe`.
+        """
+        self._subscriptions.remove(subscription)
+
+    def _monitor(self, moves):
+        if self._subscriptions:
+            moves = publish(list(self._subscriptions), moves)
+        progress = self._progress
+        return moves if progress is None else progress(self, moves)
+
+    def iter_moves(self, disks=None, rod_pairs=None):
+        """
+        Generate only the selected moves that remain to solve the towers, without making them.
+
+        Jumps straight between the selected moves (see
+        :func:`towers.core.solution.iter_filtered`), so the cost is proportional to the number of
+        moves generated, the :class:`Rods` are assumed to be where the optimal solution leaves
+        them after `moves` moves.
+
+        :note:
+            Generator, yields :class:`CompactMove` instances.
+        :param Iterable[int] disks:
+            (optional) The widths of the disks to select. Default = every disk.
+        :param Iterable[tuple] rod_pairs:
+            (optional) The (start, end) pairs of rod indexes or names to select.
+            Default = every pair.
+        """
+        return iter_filtered(self.height, disks=disks, rod_pairs=rod_pairs, start=self.moves)
+
+    def schedule(self, height, start, end, tmp):
+        """
+        Generate the moves that move a tower of the given height, without making them.
+
+        :note:
+            Generator, yields (start, end) pairs of the given rods in O(1) amortized per move.
+        :param int height:
+            The height of the tower to move.
+        :param start:
+            The rod to move the tower from.
+        :param end:
+            The rod to move the tower to.
+        :param tmp:
+            The intermediary rod.
+        """
+        stack = [(height, start, end, tmp)]
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            height, start, end, tmp = pop()
+            if height > 1:
+                push((height - 1, tmp, end, start))
+                push((1, start, end, tmp))
+                push((height - 1, start, tmp, end))
+            elif height == 1:
+                yield start, end
 
     def __str__(self):
         return 'Towers({rods})'.format(rods=self._rods)
@@ -276,6 +490,48 @@ class Towers(Sequence, Validatable, Serializable):
         """
         return self._rods.height
 
+    @property
+    def state(self):
+        """
+        Obtain the compact state of the :class:`Rods` (see :mod:`towers.core.state`).
+
+        :rtype:
+            int
+        """
+        return encode(self._rods)
+
+    def snapshot(self):
+        """
+        Obtain a consistent (moves, compact state) pair without blocking the thread making the
+        moves.
+
+        The moves are made under a seqlock: the version is bumped before a disk is popped and
+        the move count catches up once the disk has been appended, so a read that overlaps a move
+        is detected and retried.
+
+        :rtype:
+            tuple
+        :return:
+            (moves, compact state, see :mod:`towers.core.state`).
+        """
+        while True:
+            moves = self._moves
+            if self._version == moves:
+                state = encode(self._rods)
+                if self._version == moves and self._moves == moves:
+                    return moves, state
+            # Torn read, let the writer finish the move.
+            time.sleep(0)
+
+    @property
+    def total_moves(self):
+        """
+        Determine the number of moves required to solve this instance from the start.
+
+        :rtype: int
+        """
+        return self.moves_for_height(self.height)
+
     @staticmethod
     def moves_for_height(height):
         """
@@ -301,7 +557,7 @@ class Towers(Sequence, Validatable, Serializable):
             Initial conditions are invalid.
         """
         validate_height(self.height)
-        self._rods.validate()
+        self._validate_rods()
 
         if not (bool(self._rods.start) and not bool(self._rods.end)):
             raise InvalidStartingConditions(self._rods, self.moves)
@@ -323,7 +579,7 @@ class Towers(Sequence, Validatable, Serializable):
             End conditions are invalid.
         """
         validate_height(self.height)
-        self._rods.validate()
+        self._validate_rods()
 
         if not (bool(self._rods.end) and not bool(self._rods.start)):
             raise InvalidEndingConditions(self._rods)
@@ -340,7 +596,7 @@ class Towers(Sequence, Validatable, Serializable):
             A :class:`Disk` is on top of a :class:`Disk` of smaller size.
         """
         validate_height(self.height)
-        self._rods.validate()
+        self._validate_rods()
 
     def __enter__(self):
         """
@@ -360,16 +616,28 @@ class Towers(Sequence, Validatable, Serializable):
         """
         self.validate_end()
 
-    def __call__(self):
+    def __call__(self, renderer=None):
         """
         Run the towers. Convenience method.
 
+        :param Renderer renderer:
+            (optional) The :class:`Renderer` used to display the moves when in verbose mode.
+            Default = a compact :class:`Renderer` writing to `stdout`.
         :raises:
-            See :func:`Towers.move_tower`.
+            See :func:`Towers.iter_compact`.
         """
-        for i in self:
-            if self.verbose:
-                print(i)
+        if not self.verbose:
+            for _ in self.iter_compact():
+                pass
+            return
+
+        renderer = renderer or Renderer()
+        height = self.height
+        try:
+            for i in self.iter_compact():
+                renderer.render(i, height)
+        finally:
+            renderer.flush()
 
     @property
     def start_rod(self):
@@ -414,15 +682,8 @@ class Towers(Sequence, Validatable, Serializable):
         :param Rod tmp:
             The intermediary :class:`Rod` to use when moving the :class:`Disk`.
         """
-        if height >= 1:
-            for i in self.move_tower(height - 1, start, tmp, end):
-                yield i
-            for i in self.move_disk(start, end):
-                yield i
-            for i in self.move_tower(height - 1, tmp, end, start):
-                yield i
-        elif height == 1:
-            for i in self.move_disk(start, end):
+        for start_rod, end_rod in self.schedule(height, start, end, tmp):
+            for i in self.move_disk(start_rod, end_rod):
                 yield i
 
     def move_disk(self, start, end):
@@ -440,11 +701,15 @@ class Towers(Sequence, Validatable, Serializable):
         end_rod = copy.deepcopy(end)
         moves = self.moves
 
-        disk = start.pop()
-
-        move = Move(disk, start_rod, end_rod, moves)
-
-        end.append(disk)
-        self._moves += 1
+        self._version = moves + 1
+        try:
+            disk = start.pop()
+            move = Move(disk, start_rod, end_rod, moves)
+            end.append(disk)
+        except Exception:
+            self._valid = None
+            self._version = moves
+            raise
+        self._moves = moves + 1
 
         yield move
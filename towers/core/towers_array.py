@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.towers_array
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from .batch import _rods
+from .errors import InvalidMoves, InvalidTowerHeight
+from .solution import _moves_array
+from .state import decode, from_masks
+from .towers import Towers
+from .utils import import_numpy
+from .validation import validate_height
+
+__all__ = ['TowersArray']
+
+# The largest tower whose rods fit in a uint64 bitmask.
+MAX_HEIGHT = 63
+
+
+class TowersArray(object):
+    """
+    Many independent towers of the same height, simulated at once with numpy.
+
+    Every tower is held as a bitmask of disks per rod (the disk of width `w` is bit `w-1`, the
+    rods are in `ROD_NAMES` order) plus a move counter, so stepping, seeking and checking all the
+    towers are a handful of vectorized operations whatever their number.
+    """
+
+    def __init__(self, count, height, moves=0):
+        """
+        :param int count:
+            The number of towers.
+        :param int height:
+            The height of every tower, at most 63.
+        :param int|numpy.ndarray moves:
+            The number of moves of the optimal solution every tower (or each tower) has made.
+        :raises InvalidTowerHeight:
+            The height of the towers is invalid.
+        :raises ImportError:
+            numpy is not installed.
+        """
+        validate_height(height)
+        if height > MAX_HEIGHT:
+            raise InvalidTowerHeight(height)
+        np = import_numpy()
+        if np is None:  # pragma: no cover
+            raise ImportError('TowersArray requires numpy')
+
+        self._np = np
+        self._height = height
+        self._full = np.uint64((1 << height) - 1)
+        self._masks = np.zeros((count, 3), dtype=np.uint64)
+        self._moves = np.zeros(count, dtype=np.uint64)
+        self.seek(moves)
+
+    def __len__(self):
+        return len(self._moves)
+
+    def __str__(self):
+        return 'TowersArray({count} x {height})'.format(count=len(self), height=self.height)
+
+    @property
+    def height(self):
+        """
+        Obtain the height of the towers.
+
+        :rtype: int
+        """
+        return self._height
+
+    @property
+    def total_moves(self):
+        """
+        Determine the number of moves required to solve each tower.
+
+        :rtype: int
+        """
+        return (1 << self._height) - 1
+
+    @property
+    def moves(self):
+        """
+        Obtain the number of moves each tower has made.
+
+        :rtype: numpy.ndarray
+        """
+        return self._moves
+
+    @property
+    def masks(self):
+        """
+        Obtain the (count, 3) bitmasks of the disks on every rod of every tower.
+
+        :rtype: numpy.ndarray
+        """
+        return self._masks
+
+    def seek(self, moves):
+        """
+        Put every tower into the state the optimal solution is in after a number of moves, in
+        O(height) vectorized operations (see :func:`towers.core.solution.state_at`).
+
+        :param int|numpy.ndarray moves:
+            The number of moves for every tower, or for each tower.
+        :raises InvalidMoves:
+            A number of moves is beyond the end of the solution.
+        """
+        np = self._np
+        moves = np.broadcast_to(np.asarray(moves, dtype=np.uint64), self._moves.shape)
+        if (moves > np.uint64(self.total_moves)).any():
+            raise InvalidMoves(int(moves.max()))
+
+        masks = np.zeros_like(self._masks)
+        rows = np.arange(len(self))
+        for disk in range(1, self._height + 1):
+            rods = _rods(np, self._height, disk, moves).astype(np.intp)
+            masks[rows, rods] |= np.uint64(1 << (disk - 1))
+        self._masks = masks
+        self._moves = moves.copy()
+
+    def tops(self):
+        """
+        Obtain the width of the top disk of every rod of every tower, 0 = an empty rod.
+
+        :rtype: numpy.ndarray
+        """
+        np = self._np
+        masks = self._masks
+        low = masks & (~masks + np.uint64(1))
+        widths = np.frexp(low.astype(np.float64))[1]
+        return np.where(masks != 0, widths, 0)
+
+    def legal(self, start, end):
+        """
+        Determine which towers can move the top disk of one rod onto another.
+
+        :param int|numpy.ndarray start:
+            The index of the rod to move from, for every tower or for each tower.
+        :param int|numpy.ndarray end:
+            The index of the rod to move to, for every tower or for each tower.
+        :rtype: numpy.ndarray
+        """
+        np = self._np
+        rows = np.arange(len(self))
+        start, end = np.broadcast_arrays(np.asarray(start, dtype=np.intp), np.asarray(end, np.intp))
+        source = self._masks[rows, start]
+        target = self._masks[rows, end]
+        disk = source & (~source + np.uint64(1))
+        blocked = (target != 0) & ((target & (~target + np.uint64(1))) < disk)
+        return (start != end) & (source != 0) & ~blocked
+
+    def apply(self, start, end):
+        """
+        Move the top disk of one rod onto another in every tower where the move is legal.
+
+        :param int|numpy.ndarray start:
+            The index of the rod to move from, for every tower or for each tower.
+        :param int|numpy.ndarray end:
+            The index of the rod to move to, for every tower or for each tower.
+        :rtype: numpy.ndarray
+        :return:
+            The towers that made the move.
+        """
+        np = self._np
+        legal = self.legal(start, end)
+        rows = np.flatnonzero(legal)
+        start = np.broadcast_to(np.asarray(start, dtype=np.intp), legal.shape)[rows]
+        end = np.broadcast_to(np.asarray(end, dtype=np.intp), legal.shape)[rows]
+        self._move(rows, start, end)
+        return legal
+
+    def _move(self, rows, start, end):
+        np = self._np
+        masks = self._masks
+        source = masks[rows, start]
+        disk = source & (~source + np.uint64(1))
+        masks[rows, start] = source ^ disk
+        masks[rows, end] |= disk
+        self._moves[rows] += np.uint64(1)
+
+    def step(self):
+        """
+        Make the next move of the optimal solution in every unsolved tower (the towers are
+        assumed to follow the optimal solution, see :func:`towers.core.solution.move_at`).
+
+        :rtype: numpy.ndarray
+        :return:
+            The towers that made a move.
+        """
+        np = self._np
+        active = self._moves < np.uint64(self.total_moves)
+        rows = np.flatnonzero(active)
+        _, start, end = _moves_array(np, self._height, self._moves[rows])
+        self._move(rows, start.astype(np.intp), end.astype(np.intp))
+        return active
+
+    def valid(self):
+        """
+        Determine which towers hold every disk exactly once.
+
+        :rtype: numpy.ndarray
+        """
+        masks = self._masks
+        start, end, tmp = masks[:, 0], masks[:, 1], masks[:, 2]
+        disjoint = ((start & end) | (start & tmp) | (end & tmp)) == 0
+        return disjoint & ((start | end | tmp) == self._full)
+
+    def solved(self):
+        """
+        Determine which towers have every disk on the `end` rod.
+
+        :rtype: numpy.ndarray
+        """
+        return self._masks[:, 1] == self._full
+
+    def states(self):
+        """
+        Obtain the compact state (see :mod:`towers.core.state`) of every tower.
+
+        :rtype: numpy.ndarray
+        """
+        np = self._np
+        states = np.zeros(len(self), dtype=np.object_ if self._height > 32 else np.uint64)
+        for disk in range(self._height):
+            bit = np.uint64(1 << disk)
+            for rod in range(3):
+                held = (self._masks[:, rod] & bit) != 0
+                states[held] += (rod + 1) << (2 * disk)
+        return states
+
+    def tower(self, index):
+        """
+        Build the :class:`Towers` of a single tower.
+
+        :param int index:
+            The index of the tower.
+        :rtype: Towers
+        """
+        state = from_masks([int(mask) for mask in self._masks[index]])
+        return Towers(self._height, rods=decode(state), moves=int(self._moves[index]))
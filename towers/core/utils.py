@@ -8,6 +8,22 @@
 import abc
 
 
+def import_numpy():
+    """
+    Import numpy on first use, so that it is an optional (and lazily loaded) dependency.
+
+    :rtype:
+        module
+    :return:
+        The numpy module, None if it is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        return None
+    return numpy
+
+
 class Serializable(object):
     """
     A mixin which shows that a class is serializable.
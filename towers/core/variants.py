@@ -0,0 +1,878 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.variants
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import json
+
+import six
+
+from .capacity import solve_capacities
+from .costs import CostTable, move_table
+from .moves import CompactMove
+from .rods import Rods
+from .solution import _rod_pairs
+from .state import encode
+from .towers import Towers
+from .validation import validate_height
+
+__all__ = [
+    'VARIANTS',
+    'moves_for_variant',
+    'CapacityTowers',
+    'CyclicTowers',
+    'GraphTowers',
+    'LinearTowers',
+    'WeightedTowers',
+]
+
+# The names of the variants counted by :func:`moves_for_variant`.
+VARIANTS = ('classic', 'clockwise', 'anticlockwise', 'linear')
+
+
+def _filter_schedule(tower, disks, rod_pairs):
+    """
+    Generate the selected moves that remain to solve a tower by following its `schedule` (in
+    O(1) per move of the whole solution).
+    """
+    height = tower.height
+    disks = None if disks is None else set(disks)
+    pairs = None if rod_pairs is None else _rod_pairs(rod_pairs)
+    rods = [list(range(height, 0, -1)), [], []]
+
+    for index, (start, end) in enumerate(tower.schedule(height, 0, 1, 2)):
+        disk = rods[start].pop()
+        rods[end].append(disk)
+        if index < tower.moves:
+            continue
+        if (disks is None or disk in disks) and (pairs is None or (start, end) in pairs):
+            yield CompactMove(disk, start, end, index)
+
+
+def _sqrt3_power(n):
+    """
+    Calculate (1 + sqrt(3)) ** n exactly, as the pair (a, b) of a + b * sqrt(3).
+    """
+    result = (1, 0)
+    base = (1, 1)
+    while n:
+        if n & 1:
+            result = (result[0] * base[0] + 3 * result[1] * base[1],
+                      result[0] * base[1] + result[1] * base[0])
+        base = (base[0] * base[0] + 3 * base[1] * base[1], 2 * base[0] * base[1])
+        n >>= 1
+    return result
+
+
+class CyclicTowers(Towers):
+    """
+    The towers where a disk may only ever move one step around the cycle of rods.
+
+    Clockwise the cycle is `start` -> `tmp` -> `end` -> `start`, so the tower has to travel two
+    steps to reach the end rod, anti-clockwise it is `start` -> `end` -> `tmp` -> `start`, and the
+    tower travels one step.
+    """
+
+    def __init__(self, height=1, rods=None, moves=0, verbose=False, clockwise=True):
+        """
+        :param int height:
+            The height of the towers (ie: max number of disks each one rod can hold).
+        :param Rods rods:
+            An existing :class:`Rods` instance to use with this :class:`Towers` (the heights must
+            match).
+        :param int moves:
+            The number of moves already taken.
+        :param verbose:
+            True=enable verbose logging mode.
+        :param bool clockwise:
+            True=disks move clockwise, False=disks move anti-clockwise.
+        """
+        super(CyclicTowers, self).__init__(height=height, rods=rods, moves=moves, verbose=verbose)
+        self._clockwise = bool(clockwise)
+
+    def to_json(self):
+        """
+        Return a json serializable representation of this instance.
+
+        :rtype: object
+        """
+        d = super(CyclicTowers, self).to_json()
+        d['clockwise'] = self.clockwise
+        return d
+
+    @classmethod
+    def from_json(cls, d):
+        """
+        Return a class instance from a json serializable representation.
+
+        :param str|dict d:
+            The json or decoded-json from which to create a new instance.
+        :rtype:
+            CyclicTowers
+        :raises:
+            See :class:`CyclicTowers`.__init__.
+        """
+        if isinstance(d, six.string_types):
+            d = json.loads(d)
+        return cls(
+            height=d.pop('height'),
+            verbose=d.pop('verbose'),
+            moves=d.pop('moves'),
+            rods=Rods.from_json(d.pop('rods')),
+            clockwise=d.pop('clockwise'),
+        )
+
+    def __copy__(self):
+        """
+        Return a shallow copy of this instance.
+
+        :rtype:
+            :class:`CyclicTowers`
+        """
+        return CyclicTowers(
+            height=self.height,
+            rods=self._rods,
+            moves=self.moves,
+            verbose=self.verbose,
+            clockwise=self.clockwise,
+        )
+
+    def __str__(self):
+        return 'CyclicTowers({rods})'.format(rods=self._rods)
+
+    @property
+    def clockwise(self):
+        """
+        Obtain the direction in which the disks move.
+
+        :rtype:
+            bool
+        """
+        return self._clockwise
+
+    @property
+    def total_moves(self):
+        """
+        Determine the number of moves required to solve this instance from the start.
+
+        :rtype: int
+        """
+        return self.moves_for_height(self.height, self.clockwise)
+
+    @staticmethod
+    def moves_for_height(height, clockwise=True):
+        """
+        Determine the number of moves required to solve the puzzle for the given height.
+
+        :param int height:
+            The height of the :class:`Rods` (number of :class:`Disk` on a :class:`Rod`).
+        :param bool clockwise:
+            True=disks move clockwise, False=disks move anti-clockwise.
+        :rtype: int
+        """
+        # With R(n) two steps and Q(n) one step: R(n) + 1 = a + 2b where
+        # (1 + sqrt(3)) ** n = a + b * sqrt(3), and Q(n) = 2 * (R(n - 1) + 1) - 1.
+        if clockwise:
+            a, b = _sqrt3_power(height)
+            return a + 2 * b - 1
+        if height < 1:
+            return 0
+        a, b = _sqrt3_power(height - 1)
+        return 2 * (a + 2 * b) - 1
+
+    def iter_moves(self, disks=None, rod_pairs=None):
+        """
+        Generate only the selected moves that remain to solve the towers, without making them.
+
+        :note:
+            Generator, yields :class:`CompactMove` instances. The moves of this variant do not
+            form simple arithmetic progressions, so every move of the solution is visited.
+        :param Iterable[int] disks:
+            (optional) The widths of the disks to select. Default = every disk.
+        :param Iterable[tuple] rod_pairs:
+            (optional) The (start, end) pairs of rod indexes or names to select.
+            Default = every pair.
+        """
+        return _filter_schedule(self, disks, rod_pairs)
+
+    def schedule(self, height, start, end, tmp):
+        """
+        Generate the moves that move a tower of the given height, without making them.
+
+        :note:
+            Generator, yields (start, end) pairs of the given rods in O(1) amortized per move.
+        :param int height:
+            The height of the tower to move.
+        :param start:
+            The rod to move the tower from.
+        :param end:
+            The rod to move the tower to.
+        :param tmp:
+            The intermediary rod.
+        """
+        # Work in positions around the cycle, a tower either moves one or two steps.
+        cycle = (start, tmp, end) if self.clockwise else (start, end, tmp)
+        stack = [(2 if self.clockwise else 1, height, 0)] if height else []
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            steps, height, position = pop()
+            if not steps:
+                # A single disk, one step.
+                yield cycle[position], cycle[(position + 1) % 3]
+                continue
+
+            below = height - 1
+            if steps == 1:
+                if below:
+                    push((2, below, (position + 2) % 3))
+                push((0, 1, position))
+                if below:
+                    push((2, below, position))
+            else:
+                if below:
+                    push((2, below, position))
+                push((0, 1, (position + 1) % 3))
+                if below:
+                    push((1, below, (position + 2) % 3))
+                push((0, 1, position))
+                if below:
+                    push((2, below, position))
+
+
+class LinearTowers(Towers):
+    """
+    The towers where a disk may only move between adjacent rods, with the `tmp` rod between the
+    `start` and `end` rods.
+    """
+
+    def __str__(self):
+        return 'LinearTowers({rods})'.format(rods=self._rods)
+
+    def __copy__(self):
+        """
+        Return a shallow copy of this instance.
+
+        :rtype:
+            :class:`LinearTowers`
+        """
+        return LinearTowers(
+            height=self.height,
+            rods=self._rods,
+            moves=self.moves,
+            verbose=self.verbose,
+        )
+
+    @staticmethod
+    def moves_for_height(height):
+        """
+        Determine the number of moves required to solve the puzzle for the given height.
+
+        :param int height:
+            The height of the :class:`Rods` (number of :class:`Disk` on a :class:`Rod`).
+        :rtype: int
+        """
+        return 3 ** height - 1
+
+    def iter_moves(self, disks=None, rod_pairs=None):
+        """
+        Generate only the selected moves that remain to solve the towers, without making them.
+
+        :note:
+            Generator, yields :class:`CompactMove` instances. The moves of this variant do not
+            form simple arithmetic progressions, so every move of the solution is visited.
+        :param Iterable[int] disks:
+            (optional) The widths of the disks to select. Default = every disk.
+        :param Iterable[tuple] rod_pairs:
+            (optional) The (start, end) pairs of rod indexes or names to select.
+            Default = every pair.
+        """
+        return _filter_schedule(self, disks, rod_pairs)
+
+    def schedule(self, height, start, end, tmp):
+        """
+        Generate the moves that move a tower of the given height, without making them.
+
+        :note:
+            Generator, yields (start, end) pairs of the given rods in O(1) amortized per move.
+        :param int height:
+            The height of the tower to move.
+        :param start:
+            The rod to move the tower from.
+        :param end:
+            The rod to move the tower to.
+        :param tmp:
+            The intermediary (middle) rod.
+        """
+        stack = [(height, start, end)] if height else []
+        pop = stack.pop
+        push = stack.append
+
+        while stack:
+            height, start, end = pop()
+            if not height:
+                # A single disk between adjacent rods.
+                yield start, end
+                continue
+
+            below = height - 1
+            if below:
+                push((below, start, end))
+            push((0, tmp, end))
+            if below:
+                push((below, end, start))
+            push((0, start, tmp))
+            if below:
+                push((below, start, end))
+
+
+class WeightedTowers(Towers):
+    """
+    The towers where every move has a cost, depending on its rods (and optionally the width of
+    its disk), solved with the minimum total cost rather than the fewest moves.
+    """
+
+    def __init__(self, height=1, rods=None, moves=0, verbose=False, costs=None, by_width=False):
+        """
+        :param int height:
+            The height of the towers (ie: max number of disks each one rod can hold).
+        :param Rods rods:
+            An existing :class:`Rods` instance to use with this :class:`Towers` (the heights must
+            match).
+        :param int moves:
+            The number of moves already taken.
+        :param verbose:
+            True=enable verbose logging mode.
+        :param List[List] costs:
+            (optional) The 3 x 3 matrix of the cost of a move from rod `start` (row) to rod `end`
+            (column), in `ROD_NAMES` order. Default = every move costs 1.
+        :param bool by_width:
+            True=the cost of a move is also multiplied by the width of its disk.
+        :raises ValueError:
+            The costs are not a 3 x 3 matrix of non-negative numbers.
+        """
+        super(WeightedTowers, self).__init__(height=height, rods=rods, moves=moves,
+                                             verbose=verbose)
+        self._table = CostTable(costs or [[1] * 3] * 3, by_width=by_width)
+
+    def to_json(self):
+        """
+        Return a json serializable representation of this instance.
+
+        :rtype: object
+        """
+        d = super(WeightedTowers, self).to_json()
+        d['costs'] = [list(row) for row in self.costs]
+        d['by_width'] = self.by_width
+        return d
+
+    @classmethod
+    def from_json(cls, d):
+        """
+        Return a class instance from a json serializable representation.
+
+        :param str|dict d:
+            The json or decoded-json from which to create a new instance.
+        :rtype:
+            WeightedTowers
+        :raises:
+            See :class:`WeightedTowers`.__init__.
+        """
+        if isinstance(d, six.string_types):
+            d = json.loads(d)
+        return cls(
+            height=d.pop('height'),
+            verbose=d.pop('verbose'),
+            moves=d.pop('moves'),
+            rods=Rods.from_json(d.pop('rods')),
+            costs=d.pop('costs'),
+            by_width=d.pop('by_width'),
+        )
+
+    def __copy__(self):
+        """
+        Return a shallow copy of this instance.
+
+        :rtype:
+            :class:`WeightedTowers`
+        """
+        return WeightedTowers(
+            height=self.height,
+            rods=self._rods,
+            moves=self.moves,
+            verbose=self.verbose,
+            costs=self.costs,
+            by_width=self.by_width,
+        )
+
+    def __str__(self):
+        return 'WeightedTowers({rods})'.format(rods=self._rods)
+
+    @property
+    def costs(self):
+        """
+        Obtain the cost matrix.
+
+        :rtype: tuple
+        """
+        return self._table.costs
+
+    @property
+    def by_width(self):
+        """
+        Are the costs multiplied by the width of the disk.
+
+        :rtype: bool
+        """
+        return self._table.by_width
+
+    @property
+    def total_moves(self):
+        """
+        Determine the number of moves of the minimum cost solution from the start.
+
+        :rtype: int
+        """
+        return self._table.moves(self.height)
+
+    @staticmethod
+    def moves_for_height(height, costs=None, by_width=False):
+        """
+        Determine the number of moves of the minimum cost solution for the given height.
+
+        :param int height:
+            The height of the :class:`Rods` (number of :class:`Disk` on a :class:`Rod`).
+        :param List[List] costs:
+            (optional) The 3 x 3 matrix of the cost of a move from rod `start` (row) to rod `end`
+            (column), in `ROD_NAMES` order. Default = every move costs 1.
+        :param bool by_width:
+            True=the cost of a move is also multiplied by the width of its disk.
+        :rtype: int
+        """
+        return CostTable(costs or [[1] * 3] * 3, by_width=by_width).moves(height)
+
+    @property
+    def total_cost(self):
+        """
+        Determine the minimum total cost of solving this instance from the start, from the
+        memoised cost table and without making any moves.
+
+        :rtype: int|float
+        """
+        return self._table.cost(self.height)
+
+    def iter_moves(self, disks=None, rod_pairs=None):
+        """
+        Generate only the selected moves that remain to solve the towers, without making them.
+
+        :note:
+            Generator, yields :class:`CompactMove` instances. Every move of the solution is
+            visited.
+        :param Iterable[int] disks:
+            (optional) The widths of the disks to select. Default = every disk.
+        :param Iterable[tuple] rod_pairs:
+            (optional) The (start, end) pairs of rod indexes or names to select.
+            Default = every pair.
+        """
+        return _filter_schedule(self, disks, rod_pairs)
+
+    def schedule(self, height, start, end, tmp):
+        """
+        Generate the moves of the minimum cost solution, without making them.
+
+        :note:
+            Generator, yields (start, end) pairs of the given rods in O(1) amortized per move.
+            The costs are those of the rods in `start`, `end`, `tmp` order.
+        :param int height:
+            The height of the tower to move.
+        :param start:
+            The rod to move the tower from.
+        :param end:
+            The rod to move the tower to.
+        :param tmp:
+            The intermediary rod.
+        """
+        rods = (start, end, tmp)
+        for source, target in self._table.schedule(height, 0, 1):
+            yield rods[source], rods[target]
+
+
+class CapacityTowers(Towers):
+    """
+    The towers whose rods can each hold a limited number of disks, solved with the fewest moves
+    that never overfill a rod (see :func:`towers.core.capacity.solve_capacities`).
+    """
+
+    def __init__(self, height=1, rods=None, moves=0, verbose=False, capacities=None):
+        """
+        :param int height:
+            The height of the towers (ie: max number of disks each one rod can hold).
+        :param Rods rods:
+            An existing :class:`Rods` instance to use with this :class:`Towers` (the heights must
+            match).
+        :param int moves:
+            The number of moves already taken.
+        :param verbose:
+            True=enable verbose logging mode.
+        :param tuple capacities:
+            (optional) The maximum number of disks each rod (in `ROD_NAMES` order) can hold,
+            None = unlimited. Default = every rod is unlimited.
+        :raises ValueError:
+            The capacities are not 3 non-negative integers (or None).
+        """
+        super(CapacityTowers, self).__init__(height=height, rods=rods, moves=moves,
+                                             verbose=verbose)
+        capacities = (None,) * 3 if capacities is None else tuple(capacities)
+        if len(capacities) != 3 or any(i is not None and i < 0 for i in capacities):
+            raise ValueError('capacities must be 3 non-negative integers: {capacities}'.format(
+                capacities=capacities,
+            ))
+        self._capacities = capacities
+
+    def to_json(self):
+        """
+        Return a json serializable representation of this instance.
+
+        :rtype: object
+        """
+        d = super(CapacityTowers, self).to_json()
+        d['capacities'] = list(self.capacities)
+        return d
+
+    @classmethod
+    def from_json(cls, d):
+        """
+        Return a class instance from a json serializable representation.
+
+        :param str|dict d:
+            The json or decoded-json from which to create a new instance.
+        :rtype:
+            CapacityTowers
+        :raises:
+            See :class:`CapacityTowers`.__init__.
+        """
+        if isinstance(d, six.string_types):
+            d = json.loads(d)
+        return cls(
+            height=d.pop('height'),
+            verbose=d.pop('verbose'),
+            moves=d.pop('moves'),
+            rods=Rods.from_json(d.pop('rods')),
+            capacities=d.pop('capacities'),
+        )
+
+    def __copy__(self):
+        """
+        Return a shallow copy of this instance.
+
+        :rtype:
+            :class:`CapacityTowers`
+        """
+        return CapacityTowers(
+            height=self.height,
+            rods=self._rods,
+            moves=self.moves,
+            verbose=self.verbose,
+            capacities=self.capacities,
+        )
+
+    def __str__(self):
+        return 'CapacityTowers({rods})'.format(rods=self._rods)
+
+    @property
+    def capacities(self):
+        """
+        Obtain the maximum number of disks each rod can hold, None = unlimited.
+
+        :rtype: tuple
+        """
+        return self._capacities
+
+    @property
+    def total_moves(self):
+        """
+        Determine the number of moves required to solve this instance from the start.
+
+        :rtype: int
+        :raises Unsolvable:
+            The tower cannot be solved within the capacities.
+        """
+        return self.moves_for_height(self.height, self.capacities)
+
+    @staticmethod
+    def moves_for_height(height, capacities=None):
+        """
+        Determine the number of moves of the shortest solution within the capacities for the
+        given height.
+
+        :param int height:
+            The height of the :class:`Rods` (number of :class:`Disk` on a :class:`Rod`).
+        :param tuple capacities:
+            (optional) The maximum number of disks each rod (in `ROD_NAMES` order) can hold,
+            None = unlimited. Default = every rod is unlimited.
+        :rtype: int
+        :raises Unsolvable:
+            The tower cannot be solved within the capacities.
+        """
+        capacities = (None,) * 3 if capacities is None else capacities
+        return solve_capacities(height, capacities, path=False).distance
+
+    def iter_moves(self, disks=None, rod_pairs=None):
+        """
+        Generate only the selected moves that remain to solve the towers, without making them.
+
+        :note:
+            Generator, yields :class:`CompactMove` instances. Every move of the solution is
+            visited.
+        :param Iterable[int] disks:
+            (optional) The widths of the disks to select. Default = every disk.
+        :param Iterable[tuple] rod_pairs:
+            (optional) The (start, end) pairs of rod indexes or names to select.
+            Default = every pair.
+        :raises Unsolvable:
+            The tower cannot be solved within the capacities.
+        """
+        if self.is_start():
+            for move in _filter_schedule(self, disks, rod_pairs):
+                yield move
+            return
+
+        # The solution is found from the current state, not replayed from the start.
+        disks = None if disks is None else set(disks)
+        pairs = None if rod_pairs is None else _rod_pairs(rod_pairs)
+        moves = self.moves
+        for move in solve_capacities(self.height, self.capacities, encode(self._rods)).path:
+            selected = disks is None or move.disk in disks
+            if selected and (pairs is None or (move.start, move.end) in pairs):
+                yield CompactMove(move.disk, move.start, move.end, moves + move.moves)
+
+    def schedule(self, height, start, end, tmp):
+        """
+        Generate the moves of the shortest solution within the capacities, from the current
+        state of the rods, without making them.
+
+        :note:
+            Generator, yields (start, end) pairs of the given rods. From the start state this is
+            the classic solution (in O(1) amortized per move), otherwise the solution is found
+            first.
+        :param int height:
+            The height of the tower to move.
+        :param start:
+            The rod to move the tower from.
+        :param end:
+            The rod to move the tower to.
+        :param tmp:
+            The intermediary rod.
+        :raises Unsolvable:
+            The tower cannot be solved within the capacities.
+        """
+        if self.is_start():
+            solve_capacities(height, self.capacities, path=False)
+            for move in super(CapacityTowers, self).schedule(height, start, end, tmp):
+                yield move
+            return
+
+        rods = (start, end, tmp)
+        for move in solve_capacities(height, self.capacities, encode(self._rods)).path:
+            yield rods[move.start], rods[move.end]
+
+
+def _allowed(allowed):
+    """
+    Validate the allowed moves (None = every move), returning the sorted (start, end) pairs of
+    rod indexes.
+    """
+    if allowed is None:
+        allowed = [(start, end) for start in range(3) for end in range(3) if start != end]
+    try:
+        pairs = _rod_pairs(allowed)
+    except ValueError:
+        pairs = None
+    rods = set(range(3))
+    if not pairs or any(len(set(pair) & rods) != len(pair) or len(pair) != 2 for pair in pairs):
+        raise ValueError('allowed must be (start, end) pairs of distinct rods: {allowed}'.format(
+            allowed=allowed,
+        ))
+    return tuple(sorted(pairs))
+
+
+class GraphTowers(Towers):
+    """
+    The towers where only the moves along the edges of a directed graph of the rods are
+    allowed (ie: never from `end` to `start`), solved with the fewest moves.
+
+    The cyclic and linear towers are special cases. The optimal recursive move scheme of every
+    (height, start, end) is derived by dynamic programming (see
+    :func:`towers.core.costs.move_table`), so the number of moves is exact without a search over
+    the states, and the moves are streamed from the memoised sub-schemes.
+    """
+
+    def __init__(self, height=1, rods=None, moves=0, verbose=False, allowed=None):
+        """
+        :param int height:
+            The height of the towers (ie: max number of disks each one rod can hold).
+        :param Rods rods:
+            An existing :class:`Rods` instance to use with this :class:`Towers` (the heights must
+            match).
+        :param int moves:
+            The number of moves already taken.
+        :param verbose:
+            True=enable verbose logging mode.
+        :param Iterable[tuple] allowed:
+            (optional) The (start, end) pairs of rod indexes or names of the allowed moves.
+            Default = every move is allowed.
+        :raises ValueError:
+            The allowed moves are not pairs of distinct rods.
+        """
+        super(GraphTowers, self).__init__(height=height, rods=rods, moves=moves, verbose=verbose)
+        self._allowed = _allowed(allowed)
+        self._table = move_table(self._allowed)
+
+    def to_json(self):
+        """
+        Return a json serializable representation of this instance.
+
+        :rtype: object
+        """
+        d = super(GraphTowers, self).to_json()
+        d['allowed'] = [list(pair) for pair in self.allowed]
+        return d
+
+    @classmethod
+    def from_json(cls, d):
+        """
+        Return a class instance from a json serializable representation.
+
+        :param str|dict d:
+            The json or decoded-json from which to create a new instance.
+        :rtype:
+            GraphTowers
+        :raises:
+            See :class:`GraphTowers`.__init__.
+        """
+        if isinstance(d, six.string_types):
+            d = json.loads(d)
+        return cls(
+            height=d.pop('height'),
+            verbose=d.pop('verbose'),
+            moves=d.pop('moves'),
+            rods=Rods.from_json(d.pop('rods')),
+            allowed=[tuple(pair) for pair in d.pop('allowed')],
+        )
+
+    def __copy__(self):
+        """
+        Return a shallow copy of this instance.
+
+        :rtype:
+            :class:`GraphTowers`
+        """
+        return GraphTowers(
+            height=self.height,
+            rods=self._rods,
+            moves=self.moves,
+            verbose=self.verbose,
+            allowed=self.allowed,
+        )
+
+    def __str__(self):
+        return 'GraphTowers({rods})'.format(rods=self._rods)
+
+    @property
+    def allowed(self):
+        """
+        Obtain the (start, end) pairs of rod indexes of the allowed moves.
+
+        :rtype: tuple
+        """
+        return self._allowed
+
+    @property
+    def total_moves(self):
+        """
+        Determine the number of moves of the shortest solution from the start.
+
+        :rtype: int
+        :raises Unsolvable:
+            The tower cannot be solved with only the allowed moves.
+        """
+        return self._table.moves(self.height)
+
+    @staticmethod
+    def moves_for_height(height, allowed=None):
+        """
+        Determine the (exact) number of moves required to solve a tower, without making them.
+
+        :param int height:
+            The height of the tower.
+        :param Iterable[tuple] allowed:
+            (optional) The (start, end) pairs of rod indexes or names of the allowed moves.
+            Default = every move is allowed.
+        :rtype:
+            int
+        :raises Unsolvable:
+            The tower cannot be solved with only the allowed moves.
+        """
+        return move_table(_allowed(allowed)).moves(height)
+
+    def iter_moves(self, disks=None, rod_pairs=None):
+        """
+        Generate only the selected moves that remain to solve the towers, without making them.
+
+        :note:
+            Generator, yields :class:`CompactMove` instances. Every move of the solution is
+            visited.
+        :param Iterable[int] disks:
+            (optional) The widths of the disks to select. Default = every disk.
+        :param Iterable[tuple] rod_pairs:
+            (optional) The (start, end) pairs of rod indexes or names to select.
+            Default = every pair.
+        """
+        return _filter_schedule(self, disks, rod_pairs)
+
+    def schedule(self, height, start, end, tmp):
+        """
+        Generate the moves of the shortest solution, without making them.
+
+        :note:
+            Generator, yields (start, end) pairs of the given rods in O(1) amortized per move.
+            The allowed moves are those of the rods in `start`, `end`, `tmp` order.
+        :param int height:
+            The height of the tower to move.
+        :param start:
+            The rod to move the tower from.
+        :param end:
+            The rod to move the tower to.
+        :param tmp:
+            The intermediary rod.
+        :raises Unsolvable:
+            The tower cannot be solved with only the allowed moves.
+        """
+        rods = (start, end, tmp)
+        for source, target in self._table.schedule(height, 0, 1):
+            yield rods[source], rods[target]
+
+
+def moves_for_variant(height, variant='classic'):
+    """
+    Determine the number of moves required to solve a tower of a named variant.
+
+    :param int height:
+        The height of the tower.
+    :param str variant:
+        One of `VARIANTS`.
+    :rtype: int
+    :raises ValueError:
+        The variant is unknown.
+    """
+    if variant not in VARIANTS:
+        raise ValueError('Unknown variant: {variant}'.format(variant=variant))
+    validate_height(height)
+    if variant == 'linear':
+        return LinearTowers.moves_for_height(height)
+    if variant == 'classic':
+        return Towers.moves_for_height(height)
+    return CyclicTowers.moves_for_height(height, variant == 'clockwise')
@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.verify
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+from collections import namedtuple
+
+from six.moves import range
+
+from .moves import ROD_NAMES
+from .solution import _moves_array, state_at
+from .state import end_state, from_masks
+from .utils import import_numpy
+from .validation import validate_height, validate_moves
+
+__all__ = [
+    'Verification',
+    'verify',
+    'optimal_packed',
+    'UNKNOWN_ROD',
+    'SAME_ROD',
+    'EMPTY_ROD',
+    'LARGER_DISK',
+]
+
+# The reasons a move can be illegal.
+UNKNOWN_ROD = 'unknown rod'
+SAME_ROD = 'start and end rods are the same'
+EMPTY_ROD = 'start rod is empty'
+LARGER_DISK = 'disk placed on a smaller disk'
+
+# The rod index of every accepted rod identifier.
+_RODS = dict((index, index) for index in range(len(ROD_NAMES)))
+_RODS.update((name, index) for index, name in enumerate(ROD_NAMES))
+
+# Every packed move byte as a (start, end) pair, see :func:`towers.core.moves.pack_moves`.
+_UNPACKED = [(byte >> 2, byte & 3) for byte in range(256)]
+
+# The number of moves compared against the optimal solution at once by the numpy path.
+_CHUNK = 1 << 20
+
+
+class Verification(namedtuple('Verification', ('height', 'moves', 'index', 'reason', 'state'))):
+    """
+    :param int height:
+        The height of the tower.
+    :param int moves:
+        The number of moves made (including any `offset`) before the first illegal move.
+    :param int index:
+        The index of the first illegal move, None if every move was legal.
+    :param str reason:
+        Why the move at `index` is illegal, None if every move was legal.
+    :param int state:
+        The compact state (see :mod:`towers.core.state`) after the legal moves.
+    """
+
+    def __new__(cls, height, moves, index, reason, state):
+        return super(Verification, cls).__new__(cls, height, moves, index, reason, state)
+
+    @property
+    def valid(self):
+        """
+        Were all the moves legal.
+
+        :rtype:
+            bool
+        """
+        return self.index is None
+
+    @property
+    def solved(self):
+        """
+        Were all the moves legal and did they leave every disk on the end rod.
+
+        :rtype:
+            bool
+        """
+        return self.valid and self.state == end_state(self.height)
+
+    @property
+    def optimal(self):
+        """
+        Did the moves solve the tower in the least number of moves.
+
+        :rtype:
+            bool
+        """
+        return self.solved and self.moves == (1 << self.height) - 1
+
+
+def _masks(state, height):
+    """
+    Convert a compact state into a bitmask of disks per rod (the disk of width `w` is bit `w-1`).
+    """
+    masks = [0, 0, 0]
+    for disk in range(height):
+        masks[((state >> (2 * disk)) & 3) - 1] |= 1 << disk
+    return masks
+
+
+def _replay(masks, moves, index):
+    """
+    Make the moves on the bitboard until one is illegal.
+
+    :return:
+        (index, reason) of the illegal move, or (index after the last move, None).
+    """
+    rods = _RODS
+    for move in moves:
+        try:
+            start, end = move
+            start = rods[start]
+            end = rods[end]
+        except (KeyError, TypeError, ValueError):
+            return index, UNKNOWN_ROD
+        if start == end:
+            return index, SAME_ROD
+
+        source = masks[start]
+        if not source:
+            return index, EMPTY_ROD
+        disk = source & -source
+        target = masks[end]
+        if target and (target & -target) < disk:
+            return index, LARGER_DISK
+
+        masks[start] = source ^ disk
+        masks[end] = target | disk
+        index += 1
+    return index, None
+
+
+def _packed(moves):
+    """
+    Obtain the packed moves as a numpy array, or None if they are not packed.
+    """
+    np = import_numpy()
+    if np is None:
+        return None
+    if isinstance(moves, (bytes, bytearray, memoryview)):
+        return np.frombuffer(moves, dtype=np.uint8)
+    if isinstance(moves, np.ndarray):
+        if moves.ndim == 1 and moves.dtype == np.uint8:
+            return moves
+        if moves.ndim == 2 and moves.shape[1] == 2:
+            pairs = moves.astype(np.int64)
+            packed = (pairs[:, 0] << 2) | pairs[:, 1]
+            packed[(pairs < 0).any(axis=1) | (pairs > 2).any(axis=1)] = 3
+            return packed.astype(np.uint8)
+    return None
+
+
+def optimal_packed(np, height, start, stop):
+    """
+    Calculate the packed moves of the optimal solution between two indexes, vectorized.
+
+    :param np:
+        The numpy module.
+    :param int height:
+        The height of the tower (at most 63).
+    :param int start:
+        The index of the first move.
+    :param int stop:
+        The index after the last move.
+    :rtype:
+        numpy.ndarray
+    """
+    _, source, target = _moves_array(np, height, np.arange(start, stop, dtype=np.uint64))
+    return ((source << np.uint64(2)) | target).astype(np.uint8)
+
+
+def _optimal_prefix(np, height, packed, offset):
+    """
+    Determine how many of the packed moves match the optimal solution from the given index.
+    """
+    total = min(len(packed), (1 << height) - 1 - offset)
+    for start in range(0, total, _CHUNK):
+        stop = min(start + _CHUNK, total)
+        expected = optimal_packed(np, height, offset + start, offset + stop)
+        mismatch = np.flatnonzero(packed[start:stop] != expected)
+        if len(mismatch):
+            return start + int(mismatch[0])
+    return max(total, 0)
+
+
+def verify(height, moves, state=None, offset=0):
+    """
+    Check a sequence of moves against the rules.
+
+    Moves are replayed on a bitboard (a bitmask of disks per rod). Packed moves (one byte per
+    move, see :func:`towers.core.moves.pack_moves`, or an (N, 2) numpy array) are first compared
+    against the optimal solution in bulk with numpy (when installed), only the remainder after
+    the first deviation is replayed move by move.
+
+    :param int height:
+        The height of the tower.
+    :param moves:
+        An iterable of (start, end) pairs of rod indexes or names, or a buffer of packed moves.
+    :param int state:
+        (optional) The compact state (see :mod:`towers.core.state`) to start from.
+        Default = the state of the optimal solution after `offset` moves.
+    :param int offset:
+        The number of moves already made to reach the `state`.
+    :rtype:
+        Verification
+    :raises InvalidTowerHeight:
+        The height of the tower is invalid.
+    :raises InvalidMoves:
+        The offset is invalid, or no `state` is given and the offset is beyond the end of the
+        optimal solution.
+    """
+    validate_height(height)
+    validate_moves(offset)
+    optimal = state_at(height, offset) if state is None or offset < (1 << height) else None
+    if state is None:
+        state = optimal
+    index = offset
+
+    packed = _packed(moves) if height < 64 and state == optimal else None
+    if packed is not None:
+        matched = _optimal_prefix(import_numpy(), height, packed, offset)
+        index += matched
+        state = state_at(height, index)
+        moves = (_UNPACKED[byte] for byte in bytearray(packed[matched:].tobytes()))
+    elif isinstance(moves, (bytes, bytearray, memoryview)):
+        moves = (_UNPACKED[byte] for byte in bytearray(moves))
+
+    masks = _masks(state, height)
+    end, reason = _replay(masks, moves, index)
+    return Verification(height, end, end if reason else None, reason, from_masks(masks))
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.core.zobrist
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+
+import random
+
+__all__ = [
+    'zobrist_key',
+    'zobrist_hash',
+]
+
+# Seeded so that hashes are reproducible between runs.
+_RANDOM = random.Random(0x70E75)
+_KEYS = []
+
+
+def zobrist_key(width):
+    """
+    Obtain the random key of the :class:`Disk` with the given width.
+
+    :param int width:
+        The width of the :class:`Disk`.
+    :rtype:
+        int
+    """
+    keys = _KEYS
+    while len(keys) <= width:
+        keys.append(_RANDOM.getrandbits(64))
+    return keys[width]
+
+
+def zobrist_hash(disks):
+    """
+    Calculate the Zobrist hash of a stack of disks from scratch.
+
+    The hash of a stack is the xor of the keys of the disks it holds, so adding or removing a
+    :class:`Disk` updates it in O(1) by xor-ing in that disk's key.
+
+    :param Iterable[Disk] disks:
+        The disks to hash.
+    :rtype:
+        int
+    """
+    value = 0
+    for disk in disks:
+        value ^= zobrist_key(disk.width)
+    return value
@@ -0,0 +1,332 @@
+#!/usr/bin/env python
+# -*- coding: latin-1 -*-
+#
+# @module towers.server
+# @version 0.1
+# @copyright (c) 2017-present Francis Horsman.
+#
+# A local solve service over a Unix socket (Python 3.7+, no other dependencies).
+#
+# Every request is one JSON line, ie: `{"op": "solve", "height": 20, "format": "packed"}`.
+# Every response starts with one JSON header line, `{"ok": true, ...}` or
+# `{"ok": false, "error": "..."}`. A `solve` header is followed by the solution as frames: a 4
+# byte big-endian length then that many bytes, ending with an empty frame. A connection may make
+# any number of requests, one after the other.
+
+import asyncio
+import base64
+import json
+import os
+import socket
+import struct
+from collections import OrderedDict
+
+from .core.blocks import iter_batches
+from .core.errors import TowersError
+
+__all__ = [
+    'ResultCache',
+    'Server',
+    'serve',
+    'request',
+]
+
+# The default maximum number of bytes of responses held by the shared cache.
+CACHE_BYTES = 1 << 26
+
+# The default maximum length of a request line (ie: the base64 moves of a `verify`).
+REQUEST_BYTES = 1 << 28
+
+# The terminating (empty) frame of a streamed response.
+_END = struct.pack('>I', 0)
+
+
+class ResultCache(object):
+    """
+    A bounded LRU cache of encoded responses, shared by every client of a :class:`Server`.
+    """
+
+    def __init__(self, max_bytes=CACHE_BYTES):
+        """
+        :param int max_bytes:
+            The maximum total size of the cached responses, larger responses are not cached.
+        """
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """
+        Obtain a cached response.
+
+        :param tuple key:
+            The key of the request.
+        :rtype:
+            List[bytes]
+        :return:
+            The chunks of the response, None if not cached.
+        """
+        chunks = self._entries.get(key)
+        if chunks is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._entries.move_to_end(key)
+        return chunks
+
+    def put(self, key, chunks):
+        """
+        Cache a response, evicting the least recently used responses to make room.
+
+        :param tuple key:
+            The key of the request.
+        :param List[bytes] chunks:
+            The chunks of the response.
+        """
+        size = sum(len(chunk) for chunk in chunks)
+        if size > self.max_bytes or key in self._entries:
+            return
+        self._entries[key] = chunks
+        self._size += size
+        while self._size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= sum(len(chunk) for chunk in evicted)
+
+
+def _header(**fields):
+    fields['ok'] = True
+    return (json.dumps(fields, sort_keys=True) + '\n').encode('utf-8')
+
+
+def _error(message):
+    return (json.dumps({'ok': False, 'error': message}) + '\n').encode('utf-8')
+
+
+def _frames(batches):
+    for batch in batches:
+        if batch:
+            yield struct.pack('>I', len(batch)) + batch
+    yield _END
+
+
+def _solve(request):
+    height = request['height']
+    fmt = request.get('format', 'packed')
+    batches = iter_batches(height, fmt)
+    header = _header(op='solve', height=height, format=fmt, moves=(1 << height) - 1)
+    return ('solve', height, fmt), header, _frames(batches)
+
+
+def _count(request):
+    from .core.variants import moves_for_variant
+
+    height = request['height']
+    variant = request.get('variant', 'classic')
+    moves = moves_for_variant(height, variant)
+    return ('count', height, variant), _header(op='count', moves=moves), ()
+
+
+def _state_at(request):
+    from .core.solution import state_at
+    from .core.state import decode
+
+    height = request['height']
+    moves = request['moves']
+    state = state_at(height, moves)
+    header = _header(op='state-at', state=state, rods=str(decode(state)))
+    return ('state-at', height, moves), header, ()
+
+
+def _verify(request):
+    from .core.verify import verify
+
+    result = verify(request['height'], base64.b64decode(request['packed']))
+    header = _header(op='verify', valid=result.valid, solved=result.solved,
+                     optimal=result.optimal, index=result.index, reason=result.reason,
+                     moves=result.moves, state=result.state)
+    # The move logs are not worth caching.
+    return None, header, ()
+
+
+_HANDLERS = {
+    'solve': _solve,
+    'count': _count,
+    'state-at': _state_at,
+    'verify': _verify,
+}
+
+
+class Server(object):
+    """
+    Serve solve, count, state-at and verify requests over a Unix socket.
+
+    Clients are served concurrently, the next batch of a solution is generated in a worker thread
+    and only once the previous batch has been taken by the client (backpressure), and the
+    responses of the requests are shared between the clients through a :class:`ResultCache`.
+    """
+
+    def __init__(self, path, cache=None, limit=REQUEST_BYTES):
+        """
+        :param str path:
+            The path of the Unix socket.
+        :param ResultCache cache:
+            (optional) The shared cache of responses.
+        :param int limit:
+            The maximum length of a request line, longer requests are answered with an error
+            and the connection is closed.
+        """
+        self.path = path
+        self.cache = ResultCache() if cache is None else cache
+        self.limit = limit
+        self._server = None
+
+    async def start(self):
+        """
+        Start listening on the socket.
+        """
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self._server = await asyncio.start_unix_server(self._handle, path=self.path,
+                                                       limit=self.limit)
+
+    async def serve_forever(self):
+        """
+        Start listening on the socket (if not started) and serve until cancelled.
+        """
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def close(self):
+        """
+        Stop listening on the socket and remove it.
+        """
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Longer than the limit, the rest of the connection cannot be parsed.
+                    writer.write(_error('request longer than {limit} bytes'.format(
+                        limit=self.limit)))
+                    await writer.drain()
+                    break
+                if not line:
+                    break
+                await self._respond(line, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _respond(self, line, writer):
+        try:
+            request = json.loads(line.decode('utf-8'))
+            handler = _HANDLERS[request['op']]
+            # Some requests (ie: `verify`) take a while, never block the other clients.
+            loop = asyncio.get_event_loop()
+            key, header, frames = await loop.run_in_executor(None, handler, request)
+        except KeyError as e:
+            writer.write(_error('missing or unknown field: {key}'.format(key=e.args[0])))
+        except (TowersError, ValueError, TypeError) as e:
+            writer.write(_error(str(e)))
+        else:
+            await self._stream(key, header, frames, writer)
+        await writer.drain()
+
+    async def _stream(self, key, header, frames, writer):
+        cached = self.cache.get(key) if key is not None else None
+        if cached is not None:
+            for chunk in cached:
+                writer.write(chunk)
+                await writer.drain()
+            return
+
+        chunks = [header]
+        size = len(header)
+        writer.write(header)
+        loop = asyncio.get_event_loop()
+        frames = iter(frames)
+        while True:
+            frame = await loop.run_in_executor(None, next, frames, None)
+            if frame is None:
+                break
+            writer.write(frame)
+            await writer.drain()
+            if chunks is not None:
+                chunks.append(frame)
+                size += len(frame)
+                chunks = chunks if size <= self.cache.max_bytes else None
+        if key is not None and chunks is not None:
+            self.cache.put(key, chunks)
+
+
+def serve(path, cache_bytes=CACHE_BYTES):
+    """
+    Serve requests on a Unix socket until interrupted.
+
+    :param str path:
+        The path of the Unix socket.
+    :param int cache_bytes:
+        The maximum number of bytes of responses held by the shared cache.
+    """
+    server = Server(path, ResultCache(cache_bytes))
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+def _read_exactly(stream, size):
+    data = stream.read(size)
+    if len(data) != size:
+        raise ConnectionError('connection closed')
+    return data
+
+
+def request(path, op, **fields):
+    """
+    Make one request of a server (blocking), for clients without an event loop.
+
+    :param str path:
+        The path of the Unix socket.
+    :param str op:
+        The operation: `solve`, `count`, `state-at` or `verify`.
+    :param fields:
+        The fields of the request, ie: `height`, `format`, `moves`, `packed` (base64 packed
+        moves for `verify`).
+    :rtype:
+        tuple
+    :return:
+        The (header, body) of the response, the body is the solution of a `solve`, else None.
+    """
+    fields['op'] = op
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall((json.dumps(fields) + '\n').encode('utf-8'))
+        stream = connection.makefile('rb')
+        header = json.loads(stream.readline().decode('utf-8'))
+        if not header['ok'] or op != 'solve':
+            return header, None
+
+        body = []
+        while True:
+            size = struct.unpack('>I', _read_exactly(stream, 4))[0]
+            if not size:
+                return header, b''.join(body)
+            body.append(_read_exactly(stream, size))